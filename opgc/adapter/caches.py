@@ -0,0 +1,201 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from furl import furl
+
+# 304 응답에는 본문이 없으므로 캐시된 응답을 돌려줄때 같이 복원해야하는 헤더
+CACHED_RESPONSE_HEADERS = ['Link', 'Content-Type']
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    headers: dict = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def get_conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCacheStats:
+    """
+    조건부 요청 캐시 통계 (thread-safe)
+    - hits: 304 응답을 받아 캐시된 본문을 사용한 횟수 (rate limit 차감 없음)
+    - misses: 캐시가 없거나 변경되어 본문을 새로 받은 횟수
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def increase(self, name: str, count: int = 1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + count)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self):
+        with self._lock:
+            self.hits = self.misses = self.stores = self.evictions = 0
+
+    def to_dict(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hit_rate, 4),
+        }
+
+
+class BaseResponseCache:
+
+    def __init__(self, max_entry_bytes: int):
+        self.max_entry_bytes = max_entry_bytes
+        self.stats = ResponseCacheStats()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CachedResponse):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    @staticmethod
+    def build_key(url: str, params: Optional[dict] = None) -> str:
+        # 파라미터 순서가 달라도 같은 키가 되도록 정렬한다.
+        _furl = furl(url)
+        args = {**_furl.args, **{key: str(value) for key, value in (params or {}).items()}}
+        return f'github-response:{_furl.remove(query=True).url}?{urlencode(sorted(args.items()))}'
+
+    def store(self, key: str, headers, body: bytes):
+        """
+        200 응답을 캐시에 저장 (ETag, Last-Modified 가 없는 응답은 조건부 요청이 불가능하므로 저장하지 않음)
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        if not etag and not last_modified:
+            return
+
+        if len(body) > self.max_entry_bytes:
+            return
+
+        self.set(key, CachedResponse(
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            headers={name: headers[name] for name in CACHED_RESPONSE_HEADERS if headers.get(name)}
+        ))
+        self.stats.increase('stores')
+
+
+class MemoryResponseCache(BaseResponseCache):
+    """
+    프로세스 메모리에 저장하는 LRU 캐시 (전체 본문 크기 기준으로 eviction)
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int):
+        super().__init__(max_entry_bytes=max_entry_bytes)
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.size
+
+            self._entries[key] = entry
+            self.current_bytes += entry.size
+
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.size
+                self.stats.increase('evictions')
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DjangoResponseCache(BaseResponseCache):
+    """
+    Django cache(운영에서는 Redis)에 저장하는 캐시
+    : 여러 프로세스(api 서버, 크론 스크립트)가 같은 캐시를 공유한다.
+      전체 크기 기준 eviction 은 Redis 의 maxmemory 정책에 맡기고, 너무 큰 응답은 저장하지 않는다.
+    """
+
+    def __init__(self, alias: str, timeout: int, max_entry_bytes: int):
+        super().__init__(max_entry_bytes=max_entry_bytes)
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        return self.cache.get(key)
+
+    def set(self, key: str, entry: CachedResponse):
+        self.cache.set(key, entry, timeout=self.timeout)
+
+    def clear(self):
+        if hasattr(self.cache, 'delete_pattern'):
+            self.cache.delete_pattern('github-response:*')
+
+
+def create_response_cache() -> BaseResponseCache:
+    config = settings.GITHUB_RESPONSE_CACHE
+
+    if config['BACKEND'] == 'django':
+        return DjangoResponseCache(
+            alias=config['CACHE_ALIAS'],
+            timeout=config['TIMEOUT'],
+            max_entry_bytes=config['MAX_ENTRY_BYTES']
+        )
+
+    return MemoryResponseCache(
+        max_bytes=config['MAX_BYTES'],
+        max_entry_bytes=config['MAX_ENTRY_BYTES']
+    )
+
+
+response_cache = create_response_cache()
@@ -0,0 +1,214 @@
+import json
+from typing import Optional, List
+
+from django.core.exceptions import ImproperlyConfigured
+from furl import furl
+from requests import Response
+from sentry_sdk import capture_exception
+
+from adapter.rate_limits import GRAPHQL_RATE_LIMIT_RESOURCE
+from adapter.retries import send_with_retry
+from adapter.sessions import SessionManager
+from adapter.tokens import token_pool
+from core.github_dto import UserInformationDto, UserProfileDto
+from utils.exceptions import json_handler_manager
+from utils.type import convert_dict_key_lower
+
+REPOSITORY_FIELDS = """
+fragment RepositoryFields on Repository {
+  name
+  nameWithOwner
+  owner { login }
+  stargazerCount
+  isFork
+  pushedAt
+  diskUsage
+  primaryLanguage { name }
+  languages(first: 50, orderBy: {field: SIZE, direction: DESC}) {
+    edges { size node { name } }
+  }
+}
+"""
+
+USER_PROFILE_QUERY = REPOSITORY_FIELDS + """
+query($login: String!, $first: Int!) {
+  user(login: $login) {
+    login
+    name
+    email
+    location
+    avatarUrl
+    company
+    bio
+    websiteUrl
+    followers { totalCount }
+    following { totalCount }
+    publicRepositories: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    repositories(first: $first, ownerAffiliations: OWNER, orderBy: {field: PUSHED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...RepositoryFields }
+    }
+  }
+}
+"""
+
+OWNED_REPOSITORIES_QUERY = REPOSITORY_FIELDS + """
+query($login: String!, $first: Int!, $cursor: String) {
+  user(login: $login) {
+    repositories(first: $first, after: $cursor, ownerAffiliations: OWNER, orderBy: {field: PUSHED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...RepositoryFields }
+    }
+  }
+}
+"""
+
+GRAPHQL_RATE_LIMITED_ERROR = 'RATE_LIMITED'  # GraphQL 은 rate limit 을 초과해도 200 으로 응답하고 errors 의 type 으로 알려준다.
+
+
+class GithubGraphQLAdapter:
+    """
+    Github GraphQL API 통신 모듈
+    : 유저 정보, 레포지토리, 레포지토리별 언어 바이트 수를 몇번의 쿼리로 가져온다.
+      (REST API 로는 레포지토리 페이지 수 + 레포지토리 수 만큼 호출해야함)
+    """
+    graphql_url = furl('https://api.github.com/graphql')
+    token_pool = token_pool
+    github_api_url = 'https://api.github.com'
+    per_page = 100
+
+    @classmethod
+    def _handle_query(cls, query: str, variables: dict) -> Optional[dict]:
+        data = json.dumps({'query': query, 'variables': variables})
+
+        try:
+            # 조회 쿼리만 사용하므로 REST API 의 GET 요청처럼 재시도한다.
+            res = send_with_retry(cls.graphql_url.url, lambda: cls._send_query(data))
+
+        except ImproperlyConfigured:
+            raise
+        except Exception as e:
+            capture_exception(e)
+            return None
+
+        if res is None or res.status_code != 200:
+            return None
+
+        content = None
+        with json_handler_manager():
+            content = json.loads(res.content)
+
+        if not content or content.get('errors'):
+            # 존재하지 않는 유저(NOT_FOUND) 등은 REST API 에서 처리하도록 None 을 반환
+            return None
+
+        return content.get('data')
+
+    @classmethod
+    def _send_query(cls, data: str) -> Response:
+        session = SessionManager.get_session()
+
+        # token 이 없으면 acquire 에서 ImproperlyConfigured (요청 없이 res 를 사용하지 않도록 최소 한번은 실행)
+        for _ in range(len(cls.token_pool.tokens) or 1):
+            token = cls.token_pool.acquire(GRAPHQL_RATE_LIMIT_RESOURCE)
+            res = session.post(cls.graphql_url.url, headers=token.headers, data=data)
+
+            token.increase_usage()
+            limited_reason = token.graphql_state.update_from_response(
+                res.status_code, res.headers, res.text if res.status_code >= 400 else ''
+            )
+            is_limited = limited_reason is not None or (
+                token.graphql_state.is_limited() and GRAPHQL_RATE_LIMITED_ERROR in res.text
+            )
+
+            # rate limit 에 걸린 token 은 parking 되므로, 사용 가능한 다른 token 이 있으면 다시 요청한다.
+            if not is_limited or not cls.token_pool.has_available_token(GRAPHQL_RATE_LIMIT_RESOURCE):
+                break
+
+        return res
+
+    @classmethod
+    def get_user_profile(cls, username: str, limit: int) -> Optional[UserProfileDto]:
+        """
+        유저 정보, 소유한 레포지토리(최대 limit 개)를 가져온다.
+        : REST API(/users/{username}/repos)와 같은 레포지토리 목록이 되도록 소유한 레포지토리만 가져온다.
+        """
+        data = cls._handle_query(USER_PROFILE_QUERY, {'login': username, 'first': min(cls.per_page, limit)})
+
+        if not data or not data.get('user'):
+            return None
+
+        user = data['user']
+        owned_repositories = cls._get_all_nodes(
+            username, user['repositories'], OWNED_REPOSITORIES_QUERY, 'repositories', limit
+        )
+        if owned_repositories is None:
+            return None
+
+        return UserProfileDto(
+            user_information=cls.create_user_information_dto(user),
+            repositories=[cls.to_repository_data(node) for node in owned_repositories]
+        )
+
+    @classmethod
+    def _get_all_nodes(cls, username: str, connection: dict, query: str, field: str, limit: int) -> Optional[List[dict]]:
+        """
+        cursor 기반으로 다음 페이지를 가져온다. (limit 개를 채우면 중단)
+        """
+        nodes = list(connection['nodes'])
+        page_info = connection['pageInfo']
+
+        while page_info['hasNextPage'] and len(nodes) < limit:
+            data = cls._handle_query(query, {
+                'login': username,
+                'first': min(cls.per_page, limit - len(nodes)),
+                'cursor': page_info['endCursor']
+            })
+
+            if not data or not data.get('user'):
+                return None
+
+            nodes.extend(data['user'][field]['nodes'])
+            page_info = data['user'][field]['pageInfo']
+
+        return nodes[:limit]
+
+    @classmethod
+    def create_user_information_dto(cls, user: dict) -> UserInformationDto:
+        return UserInformationDto(
+            name=user.get('name'),
+            type='User',
+            email=user.get('email'),
+            location=user.get('location'),
+            avatar_url=user.get('avatarUrl'),
+            company=user.get('company'),
+            bio=user.get('bio'),
+            blog=user.get('websiteUrl') or '',
+            public_repos=user['publicRepositories']['totalCount'],
+            followers=user['followers']['totalCount'],
+            following=user['following']['totalCount'],
+            repos_url=f'{cls.github_api_url}/users/{user["login"]}/repos',
+            organizations_url=f'{cls.github_api_url}/users/{user["login"]}/orgs',
+        )
+
+    @classmethod
+    def to_repository_data(cls, node: dict) -> dict:
+        """
+        REST API 의 repository 응답과 같은 형태로 변환 (RepositoryDto 생성용)
+        """
+        full_name = node['nameWithOwner']
+        return {
+            'name': node['name'],
+            'full_name': full_name,
+            'owner': {'login': node['owner']['login']},
+            'stargazers_count': node['stargazerCount'],
+            'fork': node['isFork'],
+            'pushed_at': node.get('pushedAt'),
+            'size': node.get('diskUsage'),
+            'language': (node.get('primaryLanguage') or {}).get('name'),
+            'contributors_url': f'{cls.github_api_url}/repos/{full_name}/contributors',
+            'languages_url': f'{cls.github_api_url}/repos/{full_name}/languages',
+            'languages': convert_dict_key_lower({
+                edge['node']['name']: edge['size'] for edge in node['languages']['edges']
+            }),
+        }
@@ -1,76 +1,382 @@
+import asyncio
+import concurrent.futures
 import json
+import math
+import re
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
-import aiohttp
-import requests
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from furl import furl
+from multidict import CIMultiDict
 from requests import Response
 
 from sentry_sdk import capture_exception
 
+from adapter.caches import CachedResponse, response_cache
+from adapter.retries import send_with_retry, async_send_with_retry
+from adapter.sessions import SessionManager, AsyncSessionManager
+from adapter.singleflight import SingleFlight
+from adapter.tokens import GithubToken, token_pool
 from core.github_dto import UserInformationDto
 from utils.exceptions import GitHubUserDoesNotExist, json_handler_manager
 from utils.type import convert_dict_key_lower
 
 
+LINK_LAST_PAGE_REGEX = re.compile(r'<([^>]+)>;\s*rel="last"')
+LINK_NEXT_PAGE_REGEX = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
+@dataclass
+class RevalidatedResponse:
+    """
+    304 응답을 캐시된 응답으로 대체한 async 응답 (aiohttp 응답의 헤더는 변경할 수 없어서 따로 만든다)
+    """
+    status: int
+    headers: CIMultiDict
+
+
 class RequestMethod(Enum):
     GET = 'get'
     POST = 'post'
 
 
 class GithubAdapter:
-    headers = settings.GITHUB_API_HEADER
     github_url = furl('https://api.github.com/')
+    token_pool = token_pool
+    per_page = 100  # 페이지당 최대 개수 (github api 최대값)
+    request_flight = SingleFlight()  # 동시에 들어온 같은 GET 요청은 하나의 요청으로 합친다.
 
     @classmethod
     def _handle_request(
+        cls,
+        url: str,
+        method: RequestMethod,
+        params: Optional[dict] = None,
+        token: Optional[GithubToken] = None
+    ) -> Optional[Response]:
+        # token 을 지정한 요청(token 별 rate limit 확인)은 합치지 않는다.
+        if method != RequestMethod.GET or token:
+            return cls._request(url, method, params, token)
+
+        return cls.request_flight.do(
+            key=f'sync:{response_cache.build_key(url, params)}',
+            func=lambda: cls._request(url, method, params)
+        )
+
+    @classmethod
+    async def _async_handle_request(
         cls,
         url: str,
         method: RequestMethod,
         params: Optional[dict] = None
+    ):
+        if method != RequestMethod.GET:
+            return await cls._async_request(url, method, params)
+
+        return await cls.request_flight.async_do(
+            key=f'async:{response_cache.build_key(url, params)}',
+            func=lambda: cls._async_request(url, method, params)
+        )
+
+    @classmethod
+    def _request(
+        cls,
+        url: str,
+        method: RequestMethod,
+        params: Optional[dict] = None,
+        token: Optional[GithubToken] = None
     ) -> Optional[Response]:
 
+        cache_key, cached = cls._get_cached_response(url, method, params)
+
+        def _send() -> Response:
+            return cls._send_request(url, method, params, token, cached)
+
         try:
-            _request = requests.post if method == RequestMethod.POST else requests.get
-            res = _request(url, headers=cls.headers, params=params)
+            if method == RequestMethod.GET:
+                # 멱등성이 보장되는 GET 요청만 재시도
+                res = send_with_retry(url, _send)
+            else:
+                res = _send()
 
+        except ImproperlyConfigured:
+            raise
         except Exception as e:
             capture_exception(e)
             return None
 
+        if res is None:
+            return None
+
+        if cache_key:
+            if res.status_code == 304 and cached:
+                # 변경되지 않은 응답은 캐시된 본문으로 대체
+                res.status_code = 200
+                res._content = cached.body
+                res.headers.update(cached.headers)
+                response_cache.stats.increase('hits')
+            elif res.status_code == 200:
+                response_cache.stats.increase('misses')
+                response_cache.store(cache_key, res.headers, res.content)
+
         return res
 
     @classmethod
-    async def _async_handle_request(
+    async def _async_request(
         cls,
         url: str,
         method: RequestMethod,
         params: Optional[dict] = None
     ):
-        async with aiohttp.ClientSession() as session:
+        cache_key, cached = cls._get_cached_response(url, method, params)
+
+        async def _send() -> tuple:
+            return await cls._async_send_request(url, method, params, cached)
+
+        if method == RequestMethod.GET:
+            res, response_text = await async_send_with_retry(url, _send)
+        else:
+            res, response_text = await _send()
+
+        if cache_key:
+            if res.status == 304 and cached:
+                # 변경되지 않은 응답은 캐시된 본문과 헤더(Link 등)로 대체
+                res = RevalidatedResponse(status=200, headers=CIMultiDict(res.headers))
+                res.headers.update(cached.headers)
+                response_text = cached.body.decode('utf-8')
+                response_cache.stats.increase('hits')
+            elif res.status == 200:
+                response_cache.stats.increase('misses')
+                response_cache.store(cache_key, res.headers, response_text.encode('utf-8'))
+
+        return res, response_text
+
+    @classmethod
+    def _send_request(
+        cls,
+        url: str,
+        method: RequestMethod,
+        params: Optional[dict] = None,
+        token: Optional[GithubToken] = None,
+        cached: Optional[CachedResponse] = None
+    ) -> Response:
+        session = SessionManager.get_session()
+        _request = session.post if method == RequestMethod.POST else session.get
+
+        # token 이 없으면 acquire 에서 ImproperlyConfigured (요청 없이 res 를 사용하지 않도록 최소 한번은 실행)
+        for _ in range(len(cls.token_pool.tokens) or 1):
+            _token = token or cls.token_pool.acquire()
+            res = _request(url, headers=cls._get_headers(_token, cached), params=params)
+            limited_reason = cls._update_rate_limit(_token, res.status_code, res.headers, res.text)
+
+            # rate limit 에 걸린 token 은 parking 되므로, 사용 가능한 다른 token 이 있으면 다시 요청한다.
+            if not limited_reason or token or not cls.token_pool.has_available_token():
+                break
+
+        return res
+
+    @classmethod
+    async def _async_send_request(
+        cls,
+        url: str,
+        method: RequestMethod,
+        params: Optional[dict] = None,
+        cached: Optional[CachedResponse] = None
+    ) -> tuple:
+        session = AsyncSessionManager.get_session()
+
+        for _ in range(len(cls.token_pool.tokens) or 1):
+            token = cls.token_pool.acquire()
+
             if method == RequestMethod.POST:
-                async with session.post(url, headers=cls.headers) as res:
+                async with session.post(url, headers=cls._get_headers(token)) as res:
                     response_text = await res.text()
             else:
-                async with session.get(url, headers=cls.headers, params=params) as res:
+                async with session.get(url, headers=cls._get_headers(token, cached), params=params) as res:
                     response_text = await res.text()
 
+            limited_reason = cls._update_rate_limit(token, res.status, res.headers, response_text)
+
+            if not limited_reason or not cls.token_pool.has_available_token():
+                break
+
         return res, response_text
 
+    @classmethod
+    def _get_cached_response(
+        cls,
+        url: str,
+        method: RequestMethod,
+        params: Optional[dict] = None
+    ) -> (Optional[str], Optional[CachedResponse]):
+        """
+        GET 요청만 조건부 요청(ETag, Last-Modified) 캐시 대상
+        """
+        if method != RequestMethod.GET:
+            return None, None
+
+        cache_key = response_cache.build_key(url, params)
+        return cache_key, response_cache.get(cache_key)
+
+    @staticmethod
+    def _get_headers(token: GithubToken, cached: Optional[CachedResponse] = None) -> dict:
+        if not cached:
+            return token.headers
+        return {**token.headers, **cached.get_conditional_headers()}
+
+    @staticmethod
+    def _update_rate_limit(token: GithubToken, status_code: int, headers, body: str) -> Optional[str]:
+        """
+        응답 헤더로 token 의 rate limit 상태를 갱신하고, rate limit 응답인 경우 종류를 반환
+        """
+        token.increase_usage()
+        return token.state.update_from_response(status_code, headers, body if status_code >= 400 else '')
+
     @classmethod
     async def get_infos(cls, url):
         return await cls._async_handle_request(url, RequestMethod.GET)
 
     @classmethod
-    def check_rate_limit(cls) -> int:
+    def get_paginated_infos(
+        cls,
+        url: str,
+        params: Optional[dict] = None,
+        limit: Optional[int] = None
+    ) -> (Optional[list], int):
+        """
+        Link 헤더(rel="last")로 전체 페이지 수를 확인한 뒤 나머지 페이지들을 동시에 가져온다.
+        - limit : 필요한 개수만큼의 페이지만 가져온다.
+        """
+        params = {**(params or {}), 'per_page': cls.per_page, 'page': 1}
+        res = cls._handle_request(url=url, method=RequestMethod.GET, params=params)
+
+        if res is None:
+            return None, None
+
+        if res.status_code != 200:
+            return None, res.status_code
+
+        infos = cls._load_page(res.content)
+        pages = cls._get_next_pages(res.headers.get('Link'), limit)
+
+        if pages:
+            def _get_page(page: int):
+                return cls._handle_request(url=url, method=RequestMethod.GET, params={**params, 'page': page})
+
+            max_workers = min(len(pages), settings.GITHUB_PAGINATION_CONCURRENCY)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(_get_page, pages))
+
+            # 한 페이지라도 실패하면 일부만 가져온 목록으로 처리하지 않도록 실패로 반환한다.
+            for _res in responses:
+                if _res is None:
+                    return None, None
+
+                if _res.status_code != 200:
+                    return None, _res.status_code
+
+                infos.extend(cls._load_page(_res.content))
+
+        return infos[:limit] if limit else infos, res.status_code
+
+    @classmethod
+    async def async_get_paginated_infos(
+        cls,
+        url: str,
+        params: Optional[dict] = None,
+        limit: Optional[int] = None
+    ) -> (Optional[list], int):
+        """
+        get_paginated_infos 의 async 버전
+        """
+        params = {**(params or {}), 'per_page': cls.per_page, 'page': 1}
+        res, content = await cls._async_handle_request(url, RequestMethod.GET, params)
+
+        if res.status != 200:
+            return None, res.status
+
+        infos = cls._load_page(content)
+        pages = cls._get_next_pages(res.headers.get('Link'), limit)
+
+        if pages:
+            responses = await asyncio.gather(*[
+                cls._async_handle_request(url, RequestMethod.GET, {**params, 'page': page}) for page in pages
+            ])
+            for _res, _content in responses:
+                if _res.status != 200:
+                    return None, _res.status
+
+                infos.extend(cls._load_page(_content))
+
+        return infos[:limit] if limit else infos, res.status
+
+    @classmethod
+    def _get_next_pages(cls, link: Optional[str], limit: Optional[int] = None) -> List[int]:
+        """
+        첫번째 페이지 이후에 가져와야 할 페이지 목록
+        """
+        last_page = cls.get_last_page(link)
+
+        if limit:
+            last_page = min(last_page, math.ceil(limit / cls.per_page))
+
+        return list(range(2, last_page + 1))
+
+    @staticmethod
+    def get_last_page(link: Optional[str]) -> int:
+        """
+        Link 헤더에서 마지막 페이지 번호를 가져온다. (Link 헤더가 없으면 한 페이지)
+        ex) <https://api.github.com/user/1/repos?per_page=100&page=3>; rel="last"
+        """
+        if not link:
+            return 1
+
+        match = LINK_LAST_PAGE_REGEX.search(link)
+        if not match:
+            return 1
+
+        page = furl(match.group(1)).args.get('page')
+        return int(page) if page and page.isdigit() else 1
+
+    @staticmethod
+    def get_next_page(link: Optional[str]) -> Optional[int]:
+        """
+        Link 헤더에서 다음 페이지 번호를 가져온다. (다음 페이지가 없으면 None)
+        ex) <https://api.github.com/repos/jay/opgc/contributors?per_page=100&page=2>; rel="next"
+        """
+        if not link:
+            return None
+
+        match = LINK_NEXT_PAGE_REGEX.search(link)
+        if not match:
+            return None
+
+        page = furl(match.group(1)).args.get('page')
+        return int(page) if page and page.isdigit() else None
+
+    @staticmethod
+    def _load_page(content) -> list:
+        infos = []
+        with json_handler_manager():
+            infos = json.loads(content)
+        return infos if isinstance(infos, list) else []
+
+    @classmethod
+    def check_rate_limit(cls, token: Optional[GithubToken] = None) -> int:
         """
         현재 호출할 수 있는 Github API rate 체크
         참고: github api 의 경우 token 있는경우 시간당 5000번, 없으면 60번 호출 가능
               https://docs.gitlab.com/ee/user/admin_area/settings/user_and_ip_rate_limits.html#response-headers
         """
-        res = cls._handle_request(url=cls.github_url.set(path=f'rate_limit').url, method=RequestMethod.GET)
+        token = token or cls.token_pool.acquire()
+        res = cls._handle_request(
+            url=cls.github_url.set(path=f'rate_limit').url,
+            method=RequestMethod.GET,
+            token=token
+        )
 
         if res.status_code != 200:
             # 이 경우는 rate_limit api 가 호출이 안되는건데,
@@ -85,8 +391,33 @@ class GithubAdapter:
         except json.JSONDecodeError:
             return 0
 
+        token.state.update(
+            limit=content['rate'].get('limit'),
+            remaining=remaining,
+            reset_at=content['rate'].get('reset')
+        )
+
         return remaining
 
+    @classmethod
+    def get_rate_remaining(cls) -> int:
+        """
+        응답 헤더로 추적한 token 별 rate limit 상태로 전체 호출 가능 횟수를 확인
+        (아직 호출한 적이 없거나 reset 시각이 지난 token 만 /rate_limit 을 호출)
+        """
+        for token in cls.token_pool.get_unknown_tokens():
+            cls.check_rate_limit(token)
+
+        return cls.token_pool.get_remaining()
+
+    @classmethod
+    def get_token_usage_report(cls) -> List[dict]:
+        return cls.token_pool.get_usage_report()
+
+    @classmethod
+    def get_dedup_stats(cls) -> dict:
+        return cls.request_flight.stats.to_dict()
+
     @classmethod
     def get_user_info(cls, username: str) -> Optional[UserInformationDto]:
         """
@@ -101,6 +432,24 @@ class GithubAdapter:
 
         return UserInformationDto(**json.loads(res.content))
 
+    @classmethod
+    def is_exists_user(cls, username: str) -> bool:
+        """
+        Github 에 존재하는 유저인지 체크 (Organization 인 경우 404)
+        """
+        res = cls._handle_request(url=cls.github_url.copy().set(path=f'/users/{username}').url, method=RequestMethod.GET)
+        return res is not None and res.status_code == 200
+
+    @classmethod
+    async def async_is_exists_user(cls, username: str) -> bool:
+        """
+        is_exists_user 의 async 버전
+        """
+        res, _ = await cls._async_handle_request(
+            cls.github_url.copy().set(path=f'/users/{username}').url, RequestMethod.GET
+        )
+        return res.status == 200
+
     @classmethod
     def get_repository_infos(cls, repos_url: str, params: Optional[dict] = None) -> (Optional[list], int):
         """
@@ -146,6 +495,21 @@ class GithubAdapter:
 
         return contributor_infos, res.status_code
 
+    @classmethod
+    async def async_get_contributor_page(cls, contributors_url: str, page: int) -> (Optional[list], Optional[int], int):
+        """
+        contributor 정보를 한 페이지(per_page 개)씩 가져옵니다.
+        : Link 헤더(rel="next")로 다음 페이지 번호도 같이 반환 (마지막 페이지면 None)
+        """
+        res, content = await cls._async_handle_request(
+            contributors_url, RequestMethod.GET, {'per_page': cls.per_page, 'page': page}
+        )
+
+        if res.status != 200:
+            return None, None, res.status
+
+        return cls._load_page(content), cls.get_next_page(res.headers.get('Link')), res.status
+
     @classmethod
     def get_languages(cls, languages_url: str, params: Optional[dict] = None) -> (Optional[dict], int):
         """
@@ -162,3 +526,20 @@ class GithubAdapter:
             )
 
         return languages, res.status_code
+
+    @classmethod
+    async def async_get_languages(cls, languages_url: str, params: Optional[dict] = None) -> (Optional[dict], int):
+        """
+        get_languages 의 async 버전
+        """
+        res, content = await cls._async_handle_request(languages_url, RequestMethod.GET, params)
+
+        if res.status != 200:
+            return None, res.status
+
+        with json_handler_manager():
+            languages: dict = convert_dict_key_lower(
+                data=json.loads(content)
+            )
+
+        return languages, res.status
@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import Optional
+
+PRIMARY_RATE_LIMIT = 'primary'  # 시간당 호출 가능 횟수 초과 (X-RateLimit-Remaining: 0)
+SECONDARY_RATE_LIMIT = 'secondary'  # 짧은 시간에 너무 많은 요청 (abuse detection, Retry-After)
+SECONDARY_RATE_LIMIT_MESSAGES = ['secondary rate limit', 'abuse detection']
+DEFAULT_SECONDARY_RETRY_AFTER = 60  # Retry-After 헤더가 없는 secondary rate limit 대기 시간(초)
+RATE_LIMIT_RESOURCE = 'core'  # REST API 의 rate limit resource
+GRAPHQL_RATE_LIMIT_RESOURCE = 'graphql'  # GraphQL API 의 rate limit resource
+
+
+class RateLimitState:
+    """
+    Github API 응답 헤더로 추적하는 rate limit 상태 (thread-safe)
+    : 매번 /rate_limit 을 호출하지 않고 마지막 응답의 X-RateLimit-* 헤더로 호출 가능 여부를 판단한다.
+    """
+
+    def __init__(self, resource: str = RATE_LIMIT_RESOURCE):
+        self._lock = threading.Lock()
+        self.resource = resource
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None  # primary rate limit 이 초기화 되는 시각(epoch)
+        self.retry_after_at: Optional[float] = None  # secondary rate limit 이 해제 되는 시각(epoch)
+
+    def update(self, limit: Optional[int], remaining: Optional[int], reset_at: Optional[float]):
+        with self._lock:
+            if limit is not None:
+                self.limit = limit
+            if remaining is not None:
+                self.remaining = remaining
+            if reset_at is not None:
+                self.reset_at = reset_at
+
+    def update_from_response(self, status_code: int, headers, body: str = '') -> Optional[str]:
+        """
+        응답 헤더로 상태를 갱신하고, rate limit 응답인 경우 종류(primary, secondary)를 반환
+        """
+        resource = headers.get('X-RateLimit-Resource')
+        if resource and resource != self.resource:
+            return None
+
+        remaining = self._to_int(headers.get('X-RateLimit-Remaining'))
+        self.update(
+            limit=self._to_int(headers.get('X-RateLimit-Limit')),
+            remaining=remaining,
+            reset_at=self._to_int(headers.get('X-RateLimit-Reset'))
+        )
+
+        if status_code not in (403, 429):
+            return None
+
+        retry_after = self._to_int(headers.get('Retry-After'))
+
+        if remaining == 0 and retry_after is None:
+            return PRIMARY_RATE_LIMIT
+
+        body = (body or '').lower()
+        if retry_after is not None or any(message in body for message in SECONDARY_RATE_LIMIT_MESSAGES):
+            with self._lock:
+                self.retry_after_at = time.time() + (retry_after or DEFAULT_SECONDARY_RETRY_AFTER)
+            return SECONDARY_RATE_LIMIT
+
+        if status_code == 429:
+            return PRIMARY_RATE_LIMIT
+
+        return None
+
+    def get_limited_reason(self) -> Optional[str]:
+        now = time.time()
+
+        if self.retry_after_at and now < self.retry_after_at:
+            return SECONDARY_RATE_LIMIT
+
+        if self.remaining == 0 and self.reset_at and now < self.reset_at:
+            return PRIMARY_RATE_LIMIT
+
+        return None
+
+    def is_limited(self) -> bool:
+        return self.get_limited_reason() is not None
+
+    def get_remaining(self) -> Optional[int]:
+        """
+        호출 가능한 횟수 (상태를 알 수 없거나 reset 시각이 지난 경우 None)
+        """
+        if self.is_limited():
+            return 0
+
+        if self.remaining is None or not self.reset_at or time.time() >= self.reset_at:
+            return None
+
+        return self.remaining
+
+    def seconds_until_available(self) -> float:
+        now = time.time()
+        reason = self.get_limited_reason()
+
+        if reason == SECONDARY_RATE_LIMIT:
+            return max(self.retry_after_at - now, 0)
+        elif reason == PRIMARY_RATE_LIMIT:
+            return max(self.reset_at - now, 0)
+
+        return 0
+
+    def clear(self):
+        with self._lock:
+            self.limit = self.remaining = self.reset_at = self.retry_after_at = None
+
+    @staticmethod
+    def _to_int(value) -> Optional[int]:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
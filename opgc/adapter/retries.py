@@ -0,0 +1,193 @@
+import asyncio
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Optional, Callable, Awaitable
+
+import aiohttp
+import requests
+from django.conf import settings
+from furl import furl
+from sentry_sdk import capture_exception
+
+# 202: github 에서 통계를 계산중인 경우 (잠시 후 다시 요청하면 결과를 받을 수 있음)
+RETRY_STATUS = [202, 500, 502, 503, 504]
+RATE_LIMIT_STATUS = [403, 429]
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+ASYNC_RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+# endpoint 별 통계를 낼때 그대로 사용할 path (나머지는 유저명, 레포지토리명 등이라 * 로 치환)
+ENDPOINT_RESOURCES = {
+    'users', 'repos', 'orgs', 'contributors', 'languages', 'contributions', 'rate_limit', 'graphql'
+}
+
+
+class RetryStats:
+    """
+    endpoint 별 재시도 통계 (thread-safe)
+    - retries: 재시도 횟수
+    - failures: 재시도를 모두 소진하고 실패한 횟수
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints = defaultdict(lambda: {'retries': 0, 'failures': 0})
+
+    @staticmethod
+    def get_endpoint(url: str) -> str:
+        _furl = furl(url)
+        segments = [segment if segment in ENDPOINT_RESOURCES else '*' for segment in _furl.path.segments if segment]
+        return f'{_furl.host}/{"/".join(segments)}'
+
+    def increase(self, url: str, name: str):
+        with self._lock:
+            self.endpoints[self.get_endpoint(url)][name] += 1
+
+    def reset(self):
+        with self._lock:
+            self.endpoints.clear()
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self.endpoints.items()}
+
+
+retry_stats = RetryStats()
+
+
+class RetryPolicy:
+    """
+    capped exponential backoff + full jitter 재시도 정책
+    : 5xx, 202(stats computing), 커넥션 오류는 backoff 후 재시도하고
+      Retry-After 가 있는 응답은 Retry-After 만큼 기다린 뒤 재시도한다. (max_retry_after 보다 길면 포기)
+    """
+
+    def __init__(self, max_retries: int, backoff_base: float, backoff_max: float, max_retry_after: float):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+
+    def get_backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def get_retry_delay(
+        self,
+        attempt: int,
+        status_code: Optional[int] = None,
+        headers: Optional[dict] = None,
+        exception: Optional[Exception] = None
+    ) -> Optional[float]:
+        """
+        재시도 해야하는 경우 대기 시간(초)을, 재시도 하지 않는 경우 None 을 반환
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        if exception is not None:
+            return self.get_backoff(attempt)
+
+        headers = headers or {}
+        retry_after = self._to_float(headers.get('Retry-After'))
+
+        if status_code in RETRY_STATUS:
+            return retry_after if retry_after is not None else self.get_backoff(attempt)
+
+        if status_code in RATE_LIMIT_STATUS:
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+
+            # github.com 크롤링 429 (rate limit 헤더가 없음)
+            if status_code == 429 and headers.get('X-RateLimit-Remaining') is None:
+                return self.get_backoff(attempt)
+
+        return None
+
+    @staticmethod
+    def _to_float(value) -> Optional[float]:
+        try:
+            return max(float(value), 0)
+        except (TypeError, ValueError):
+            return None
+
+
+retry_policy = RetryPolicy(
+    max_retries=settings.GITHUB_RETRY['MAX_RETRIES'],
+    backoff_base=settings.GITHUB_RETRY['BACKOFF_BASE'],
+    backoff_max=settings.GITHUB_RETRY['BACKOFF_MAX'],
+    max_retry_after=settings.GITHUB_RETRY['MAX_RETRY_AFTER'],
+)
+
+
+def send_with_retry(url: str, send: Callable[[], requests.Response]) -> Optional[requests.Response]:
+    """
+    재시도 정책에 따라 요청 (GET 같은 멱등성이 보장되는 요청에만 사용)
+    """
+    attempt = 0
+
+    while True:
+        res, exception = None, None
+
+        try:
+            res = send()
+        except RETRY_EXCEPTIONS as e:
+            exception = e
+
+        delay = retry_policy.get_retry_delay(
+            attempt,
+            status_code=res.status_code if res is not None else None,
+            headers=res.headers if res is not None else None,
+            exception=exception
+        )
+
+        if delay is None:
+            break
+
+        retry_stats.increase(url, 'retries')
+        time.sleep(delay)
+        attempt += 1
+
+    if exception is not None or (res is not None and res.status_code in RETRY_STATUS):
+        retry_stats.increase(url, 'failures')
+
+    if exception is not None:
+        capture_exception(exception)
+
+    return res
+
+
+async def async_send_with_retry(url: str, send: Callable[[], Awaitable[tuple]]) -> tuple:
+    """
+    send_with_retry 의 async 버전 (send 는 (response, text) 를 반환)
+    """
+    attempt = 0
+
+    while True:
+        res, text, exception = None, None, None
+
+        try:
+            res, text = await send()
+        except ASYNC_RETRY_EXCEPTIONS as e:
+            exception = e
+
+        delay = retry_policy.get_retry_delay(
+            attempt,
+            status_code=res.status if res is not None else None,
+            headers=res.headers if res is not None else None,
+            exception=exception
+        )
+
+        if delay is None:
+            break
+
+        retry_stats.increase(url, 'retries')
+        await asyncio.sleep(delay)
+        attempt += 1
+
+    if exception is not None or (res is not None and res.status in RETRY_STATUS):
+        retry_stats.increase(url, 'failures')
+
+    if exception is not None:
+        raise exception
+
+    return res, text
@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import weakref
+from typing import Optional
+
+import aiohttp
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionStats:
+    """
+    커넥션 재사용 통계 (thread-safe)
+    - opened: 새로 맺은 커넥션 수 (TCP+TLS handshake 발생)
+    - requests: 전송한 요청 수
+    - reused: 기존 커넥션을 재사용한 요청 수
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.requests = 0
+
+    def increase_opened(self):
+        with self._lock:
+            self.opened += 1
+
+    def increase_requests(self):
+        with self._lock:
+            self.requests += 1
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.opened, 0)
+
+    def reset(self):
+        with self._lock:
+            self.opened = 0
+            self.requests = 0
+
+    def to_dict(self) -> dict:
+        return {'opened': self.opened, 'requests': self.requests, 'reused': self.reused}
+
+
+connection_stats = ConnectionStats()
+
+
+class CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        connection_stats.increase_opened()
+        return super()._new_conn()
+
+
+class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        connection_stats.increase_opened()
+        return super()._new_conn()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    host 별 커넥션 풀을 유지하고 기본 timeout 을 적용하는 HTTPAdapter
+    """
+
+    def __init__(self, timeout=None, *args, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': CountingHTTPConnectionPool,
+            'https': CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+
+        connection_stats.increase_requests()
+        return super().send(request, **kwargs)
+
+
+class SessionManager:
+    """
+    프로세스 전역에서 공유하는 requests.Session 관리
+    : ThreadPoolExecutor 의 worker 들이 같은 커넥션 풀을 공유해서 keep-alive 커넥션을 재사용한다.
+    """
+    _session: Optional[requests.Session] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        if cls._session is None:
+            with cls._lock:
+                if cls._session is None:
+                    cls._session = cls._create_session()
+
+        return cls._session
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        adapter = PooledHTTPAdapter(
+            timeout=settings.GITHUB_HTTP_TIMEOUT,
+            pool_connections=settings.GITHUB_HTTP_POOL_CONNECTIONS,
+            pool_maxsize=settings.GITHUB_HTTP_POOL_MAXSIZE,
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    @classmethod
+    def close(cls):
+        with cls._lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
+    @staticmethod
+    def get_connection_stats() -> dict:
+        return connection_stats.to_dict()
+
+
+class AsyncSessionManager:
+    """
+    event loop 단위로 공유하는 aiohttp.ClientSession 관리
+    : 요청마다 세션을 새로 만들지 않고, TCPConnector 로 host 당 동시 커넥션 수를 제한한다.
+    """
+    _sessions = weakref.WeakKeyDictionary()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = cls._sessions.get(loop)
+
+        if session is None or session.closed:
+            session = cls._create_session()
+            with cls._lock:
+                cls._sessions[loop] = session
+
+        return session
+
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=settings.GITHUB_ASYNC_CONNECTION_LIMIT,
+            limit_per_host=settings.GITHUB_ASYNC_LIMIT_PER_HOST,
+            use_dns_cache=True,
+            ttl_dns_cache=settings.GITHUB_ASYNC_DNS_CACHE_TTL,
+            keepalive_timeout=settings.GITHUB_ASYNC_KEEPALIVE_TIMEOUT,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=settings.GITHUB_ASYNC_TIMEOUT)
+        )
+
+    @classmethod
+    async def close(cls):
+        with cls._lock:
+            session = cls._sessions.pop(asyncio.get_running_loop(), None)
+
+        if session is not None and not session.closed:
+            await session.close()
+
+    @classmethod
+    def run(cls, coroutine):
+        """
+        새로운 event loop 에서 coroutine 을 실행하고, loop 에 묶인 세션까지 정리한다.
+        """
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.run_until_complete(cls.close())
+            loop.close()
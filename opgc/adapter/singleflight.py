@@ -0,0 +1,98 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import Callable, Awaitable, Any
+
+
+class SingleFlightStats:
+    """
+    요청 병합 통계 (thread-safe)
+    - executed: 실제로 실행된 요청 수
+    - shared: 이미 진행중인 요청의 결과를 공유받은 호출 수
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def increase(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    @property
+    def dedup_rate(self) -> float:
+        total = self.executed + self.shared
+        return self.shared / total if total else 0.0
+
+    def reset(self):
+        with self._lock:
+            self.executed = self.shared = 0
+
+    def to_dict(self) -> dict:
+        return {'executed': self.executed, 'shared': self.shared, 'dedup_rate': round(self.dedup_rate, 4)}
+
+
+class SingleFlight:
+    """
+    같은 key 로 동시에 들어온 호출들을 하나의 실행으로 합친다. (singleflight)
+    : 먼저 들어온 호출(leader)만 실제로 실행하고, 실행중에 들어온 호출들은 그 결과를 공유받는다.
+      결과는 concurrent.futures.Future 로 전달하기 때문에 다른 스레드, 다른 event loop 의 coroutine 도 기다릴 수 있다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.stats = SingleFlightStats()
+
+    def _join(self, key: str) -> (concurrent.futures.Future, bool):
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                return future, False
+
+            future = concurrent.futures.Future()
+            self._flights[key] = future
+            return future, True
+
+    def _finish(self, key: str):
+        with self._lock:
+            self._flights.pop(key, None)
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        future, is_leader = self._join(key)
+
+        if not is_leader:
+            self.stats.increase('shared')
+            return future.result()
+
+        self.stats.increase('executed')
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._finish(key)
+
+        future.set_result(result)
+        return result
+
+    async def async_do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        future, is_leader = self._join(key)
+
+        if not is_leader:
+            self.stats.increase('shared')
+            return await asyncio.wrap_future(future)
+
+        self.stats.increase('executed')
+        try:
+            result = await func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._finish(key)
+
+        future.set_result(result)
+        return result
@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import time
+
+from django.conf import settings
+
+THROTTLED_STATUS = 429
+
+# redis 에 저장하는 token bucket 상태 (tokens, updated_at, rate)를 갱신하고 token 을 하나 가져온다.
+# 반환값: {대기 시간(초), 현재 rate} (대기 시간이 0 이면 token 을 가져온것)
+REDIS_ACQUIRE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local capacity = tonumber(ARGV[1])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at', 'rate')
+local rate = tonumber(state[3]) or tonumber(ARGV[2])
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+
+redis.call('HMSET', KEYS[1], 'tokens', tokens, 'updated_at', now, 'rate', rate)
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return {tostring(wait), tostring(rate)}
+"""
+
+# rate 를 AIMD 로 조절 (ARGV[1]: 새 rate 를 계산할 방향 increase or decrease)
+REDIS_ADJUST_RATE_SCRIPT = """
+local rate = tonumber(redis.call('HGET', KEYS[1], 'rate')) or tonumber(ARGV[2])
+if ARGV[1] == 'decrease' then
+    rate = math.max(tonumber(ARGV[3]), rate * tonumber(ARGV[5]))
+else
+    rate = math.min(tonumber(ARGV[2]), rate + tonumber(ARGV[4]))
+end
+redis.call('HSET', KEYS[1], 'rate', rate)
+return tostring(rate)
+"""
+
+
+class BaseTokenBucket:
+    """
+    token bucket 요청 속도 제한
+    - 초당 rate 개의 token 이 채워지고(최대 capacity 개), 요청마다 token 을 하나씩 사용한다.
+    - 429 응답을 받으면 rate 를 decrease_factor 배로 줄이고, 성공하면 increase_step 씩 max_rate 까지 늘린다. (AIMD)
+    """
+
+    def __init__(self, max_rate: float, min_rate: float, capacity: float, increase_step: float,
+                 decrease_factor: float):
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.rate = max_rate
+        self.throttled_count = 0
+
+    def try_acquire(self) -> float:
+        """
+        token 을 가져오고, token 이 없으면 다음 token 까지 기다려야 하는 시간(초)을 반환
+        """
+        raise NotImplementedError
+
+    def adjust_rate(self, is_throttled: bool):
+        raise NotImplementedError
+
+    def acquire(self):
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def async_acquire(self):
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def report(self, status_code: int):
+        """
+        응답 결과로 rate 를 조절
+        """
+        if status_code == THROTTLED_STATUS:
+            self.throttled_count += 1
+            self.adjust_rate(is_throttled=True)
+        elif self.rate < self.max_rate:
+            self.adjust_rate(is_throttled=False)
+
+
+class LocalTokenBucket(BaseTokenBucket):
+    """
+    프로세스 안에서 공유하는 token bucket (thread-safe)
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def try_acquire(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+
+            return (1 - self.tokens) / self.rate
+
+    def adjust_rate(self, is_throttled: bool):
+        with self._lock:
+            if is_throttled:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+
+class RedisTokenBucket(BaseTokenBucket):
+    """
+    redis 에 상태를 저장해서 여러 프로세스(크론 스크립트, api 서버)가 공유하는 token bucket
+    : 상태 갱신은 lua script 로 원자적으로 처리하고, 시간은 redis 서버 시간을 사용한다.
+    """
+
+    def __init__(self, alias: str, key: str, **kwargs):
+        super().__init__(**kwargs)
+        self.alias = alias
+        self.key = key
+        self._acquire_script = None
+        self._adjust_rate_script = None
+
+    def _get_scripts(self):
+        if self._acquire_script is None:
+            from django_redis import get_redis_connection
+
+            redis = get_redis_connection(self.alias)
+            self._acquire_script = redis.register_script(REDIS_ACQUIRE_SCRIPT)
+            self._adjust_rate_script = redis.register_script(REDIS_ADJUST_RATE_SCRIPT)
+
+        return self._acquire_script, self._adjust_rate_script
+
+    def try_acquire(self) -> float:
+        acquire_script, _ = self._get_scripts()
+        wait, rate = acquire_script(keys=[self.key], args=[self.capacity, self.max_rate, 60 * 60])
+        self.rate = float(rate)
+        return float(wait)
+
+    def adjust_rate(self, is_throttled: bool):
+        _, adjust_rate_script = self._get_scripts()
+        self.rate = float(adjust_rate_script(
+            keys=[self.key],
+            args=[
+                'decrease' if is_throttled else 'increase',
+                self.max_rate, self.min_rate, self.increase_step, self.decrease_factor
+            ]
+        ))
+
+
+def create_scraping_throttle() -> BaseTokenBucket:
+    config = settings.GITHUB_SCRAPING_THROTTLE
+    options = dict(
+        max_rate=config['MAX_RATE'],
+        min_rate=config['MIN_RATE'],
+        capacity=config['CAPACITY'],
+        increase_step=config['INCREASE_STEP'],
+        decrease_factor=config['DECREASE_FACTOR'],
+    )
+
+    if config['BACKEND'] == 'redis':
+        return RedisTokenBucket(alias=config['CACHE_ALIAS'], key='github-scraping-throttle', **options)
+
+    return LocalTokenBucket(**options)
+
+
+# github.com(contribution calendar) 크롤링 요청 속도 제한
+scraping_throttle = create_scraping_throttle()
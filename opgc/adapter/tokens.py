@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import List
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from adapter.rate_limits import RateLimitState, RATE_LIMIT_RESOURCE, GRAPHQL_RATE_LIMIT_RESOURCE
+
+DEFAULT_RATE_LIMIT = 5000  # token 이 있는 경우 시간당 호출 가능 횟수
+
+
+class GithubToken:
+    """
+    Github API token 과 token 별 rate limit 상태, 사용량
+    """
+
+    def __init__(self, token: str):
+        self.token = token
+        self.state = RateLimitState()
+        self.graphql_state = RateLimitState(resource=GRAPHQL_RATE_LIMIT_RESOURCE)  # GraphQL API 는 한도가 별도로 관리됨
+        self.usage = 0
+        self._lock = threading.Lock()
+
+    @property
+    def headers(self) -> dict:
+        return {'Authorization': f'token {self.token}'}
+
+    @property
+    def masked_token(self) -> str:
+        return f'****{self.token[-4:]}'
+
+    def increase_usage(self):
+        with self._lock:
+            self.usage += 1
+
+    def get_state(self, resource: str = RATE_LIMIT_RESOURCE) -> RateLimitState:
+        return self.graphql_state if resource == GRAPHQL_RATE_LIMIT_RESOURCE else self.state
+
+    def get_expected_remaining(self, resource: str = RATE_LIMIT_RESOURCE) -> int:
+        """
+        rotation 기준이 되는 호출 가능 횟수 (상태를 모르거나 reset 이 지난 token 은 한도 전체를 쓸 수 있다고 본다)
+        """
+        state = self.get_state(resource)
+        remaining = state.get_remaining()
+        if remaining is None:
+            return state.limit or DEFAULT_RATE_LIMIT
+        return remaining
+
+
+class TokenPool:
+    """
+    여러 Github token 을 남은 호출 횟수 기준으로 돌려가며 사용한다.
+    rate limit 에 걸린 token 은 reset 시각까지 사용하지 않는다(parking).
+    """
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = [GithubToken(token) for token in tokens if token]
+
+    def acquire(self, resource: str = RATE_LIMIT_RESOURCE) -> GithubToken:
+        if not self.tokens:
+            raise ImproperlyConfigured('GITHUB_API_TOKENS 에 사용할 Github token 이 없습니다.')
+
+        available_tokens = [token for token in self.tokens if not token.get_state(resource).is_limited()]
+
+        if not available_tokens:
+            # 모든 token 이 parking 된 경우 가장 빨리 풀리는 token 을 사용 (응답으로 rate limit 이 판별된다)
+            return min(self.tokens, key=lambda token: token.get_state(resource).seconds_until_available())
+
+        # 남은 횟수가 같다면 reset 이 먼저 되는 token 을 먼저 소진한다.
+        return max(
+            available_tokens,
+            key=lambda token: (
+                token.get_expected_remaining(resource),
+                -(token.get_state(resource).reset_at or time.time())
+            )
+        )
+
+    def has_available_token(self, resource: str = RATE_LIMIT_RESOURCE) -> bool:
+        return any(not token.get_state(resource).is_limited() for token in self.tokens)
+
+    def is_limited(self, resource: str = RATE_LIMIT_RESOURCE) -> bool:
+        return not self.has_available_token(resource)
+
+    def get_unknown_tokens(self) -> List[GithubToken]:
+        """
+        rate limit 상태를 알 수 없는(아직 호출하지 않았거나 reset 이 지난) token
+        """
+        return [token for token in self.tokens if token.state.get_remaining() is None]
+
+    def get_remaining(self) -> int:
+        """
+        전체 token 의 호출 가능 횟수 합 (상태를 모르는 token 은 제외)
+        """
+        return sum(token.state.get_remaining() or 0 for token in self.tokens)
+
+    def get_usage_report(self) -> List[dict]:
+        return [{
+            'token': token.masked_token,
+            'usage': token.usage,
+            'remaining': token.state.get_remaining(),
+            'reset_at': token.state.reset_at,
+            'limited': token.state.get_limited_reason(),
+        } for token in self.tokens]
+
+    def clear(self):
+        for token in self.tokens:
+            token.usage = 0
+            token.state.clear()
+            token.graphql_state.clear()
+
+
+token_pool = TokenPool(settings.GITHUB_API_TOKENS)
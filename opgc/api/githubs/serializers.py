@@ -3,6 +3,7 @@ import json
 from rest_framework import serializers
 
 from apps.githubs.models import GithubUser, Organization, Repository, UserLanguage, Language
+from core.caches import language_map
 
 
 class GithubUserSerializer(serializers.ModelSerializer):
@@ -17,7 +18,7 @@ class GithubUserSerializer(serializers.ModelSerializer):
 
         ret['organizations'] = OrganizationSerializer(instance.organization.all(), many=True).data
         ret['repositories'] = RepositorySerializer(instance.repository.all(), many=True).data
-        user_language = UserLanguage.objects.filter(github_user_id=instance.id).prefetch_related('language')
+        user_language = UserLanguage.objects.filter(github_user_id=instance.id)
         ret['languages'] = UserLanguageSerializer(user_language, many=True).data
         ret['status'] = instance.get_status_display()
 
@@ -68,7 +69,7 @@ class UserLanguageSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         ret = super().to_representation(instance)
-        ret['language'] = instance.language.__str__()
+        ret['language'] = language_map.get_type(instance.language_id)  # Language 를 조회하지 않도록 매핑 사용
         return ret
 
 
@@ -0,0 +1,23 @@
+# Generated by Django 2.2.17 on 2026-10-18 18:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('githubs', '0013_auto_20230810_0919'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubuser',
+            name='continuous_commit_checked_date',
+            field=models.DateField(blank=True, default=None, null=True, verbose_name='1일 1커밋 체크한 날짜'),
+        ),
+        migrations.AddField(
+            model_name='githubuser',
+            name='continuous_commit_end_date',
+            field=models.DateField(blank=True, default=None, null=True, verbose_name='1일 1커밋 마지막 커밋 날짜'),
+        ),
+    ]
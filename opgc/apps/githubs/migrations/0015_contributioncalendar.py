@@ -0,0 +1,31 @@
+# Generated by Django 2.2.17 on 2026-10-18 18:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('githubs', '0014_githubuser_continuous_commit_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContributionCalendar',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('year', models.SmallIntegerField(verbose_name='년도')),
+                ('levels', models.BinaryField(help_text='날짜별 contribution level(0~4), 366 bytes')),
+                ('counts', models.BinaryField(help_text='날짜별 contribution 수(uint16), 366 * 2 bytes')),
+                ('github_user', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, to='githubs.GithubUser')),
+            ],
+            options={
+                'verbose_name': 'contribution calendar',
+                'db_table': 'githubs_contribution_calendar',
+                'unique_together': {('github_user', 'year')},
+            },
+        ),
+    ]
@@ -46,6 +46,10 @@ class GithubUser(CustomBaseModel):
     followers = models.IntegerField(default=0, blank=True, verbose_name='팔로워')
     following = models.IntegerField(default=0, blank=True, verbose_name='팔로잉')
     continuous_commit_day = models.IntegerField(default=0, verbose_name='1일 1커밋 지속 날짜 카운트')
+    continuous_commit_end_date = models.DateField(default=None, null=True, blank=True,
+                                                  verbose_name='1일 1커밋 마지막 커밋 날짜')
+    continuous_commit_checked_date = models.DateField(default=None, null=True, blank=True,
+                                                      verbose_name='1일 1커밋 체크한 날짜')
     total_score = models.IntegerField(default=0, blank=True, verbose_name='종합점수')
 
 
@@ -96,6 +100,21 @@ class Repository(CustomBaseModel):
                                  help_text='레포지토리에서 사용하는 모든 언어(json)')
 
 
+class ContributionCalendar(CustomBaseModel):
+    """
+    유저의 년도별 contribution calendar (1월 1일부터 날짜 순서대로 packing 해서 저장)
+    """
+    github_user = models.ForeignKey(GithubUser, db_constraint=False, on_delete=models.CASCADE)
+    year = models.SmallIntegerField(verbose_name='년도')
+    levels = models.BinaryField(help_text='날짜별 contribution level(0~4), 366 bytes')
+    counts = models.BinaryField(help_text='날짜별 contribution 수(uint16), 366 * 2 bytes')
+
+    class Meta:
+        db_table = 'githubs_contribution_calendar'
+        verbose_name = 'contribution calendar'
+        unique_together = ('github_user', 'year')
+
+
 class Achievements(CustomBaseModel):
     """
     달성 목표 (재미를 위한 컨텐츠)
@@ -0,0 +1,55 @@
+"""
+contribution calendar 파싱 벤치마크 (BeautifulSoup + lxml vs 정규식 파서)
+
+사용법 (opgc 디렉토리에서 실행)
+$ python -m benchmarks.contribution_calendar [반복 횟수]
+"""
+import sys
+import timeit
+from datetime import datetime, date
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from utils.contribution_calendar import parse_commit_dates
+
+FIXTURE_PATH = Path(__file__).parent / 'fixtures' / 'contributions_2023.html'
+SINCE, UNTIL = date(2023, 1, 1), date(2023, 12, 31)
+
+
+def parse_commit_dates_bs4(text: str, since: date, until: date) -> set:
+    """
+    기존 get_continuous_commit_day 의 파싱 방식 (td 전체를 돌면서 셀마다 strptime)
+    """
+    soup = BeautifulSoup(text, "lxml")
+    commit_dates = set()
+
+    for rect in reversed(soup.select('td')):
+        if not rect.get('data-date') or until < datetime.strptime(rect.get('data-date'), '%Y-%m-%d').date() \
+                or rect.get('data-level') == '0':
+            continue
+
+        commit_date = datetime.strptime(rect.get('data-date'), '%Y-%m-%d').date()
+        if since <= commit_date:
+            commit_dates.add(commit_date)
+
+    return commit_dates
+
+
+def run(number: int = 200):
+    content = FIXTURE_PATH.read_bytes()
+    text = content.decode('utf-8')
+
+    assert parse_commit_dates_bs4(text, SINCE, UNTIL) == parse_commit_dates(content, SINCE, UNTIL)
+
+    bs4_time = timeit.timeit(lambda: parse_commit_dates_bs4(text, SINCE, UNTIL), number=number)
+    regex_time = timeit.timeit(lambda: parse_commit_dates(content, SINCE, UNTIL), number=number)
+
+    print(f'fixture: {FIXTURE_PATH.name} ({len(content) / 1024:.1f}KB), {number}회 반복')
+    print(f'bs4 + lxml : {bs4_time / number * 1000:.3f}ms/회')
+    print(f'regex      : {regex_time / number * 1000:.3f}ms/회')
+    print(f'{bs4_time / regex_time:.1f}배 빠름')
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
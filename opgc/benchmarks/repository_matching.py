@@ -0,0 +1,69 @@
+"""
+유저의 기존 repository 매칭 벤치마크 (리스트 순회 + pop vs (full_name, owner) 인덱스)
+
+사용법 (opgc 디렉토리에서 실행)
+$ DJANGO_SETTINGS_MODULE=conf.settings.action python -m benchmarks.repository_matching [반복 횟수]
+"""
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'conf.settings.action')
+django.setup()
+
+from core.services.repository_service import RepositoryService  # noqa: E402
+
+
+def create_repositories(count: int) -> list:
+    return [SimpleNamespace(full_name=f'jay/repo{idx}', owner='jay') for idx in range(count)]
+
+
+def match_by_list(repositories: list, user_repositories: list) -> list:
+    """
+    기존 update_repository 의 매칭 방식 (repository 마다 리스트 전체를 순회하고 index 로 pop)
+    """
+    user_repositories = list(user_repositories)
+
+    for repository in repositories:
+        for idx, user_repo in enumerate(user_repositories):
+            if user_repo.full_name == repository.full_name and user_repo.owner == repository.owner:
+                user_repositories.pop(idx)
+                break
+
+    return user_repositories
+
+
+def match_by_index(repositories: list, user_repositories: list) -> list:
+    """
+    RepositoryService.create_repository_index 로 한번 인덱싱 한 뒤 O(1) 로 매칭
+    """
+    index = RepositoryService.create_repository_index(user_repositories)
+
+    for repository in repositories:
+        index.pop(RepositoryService.get_repository_key(repository.full_name, repository.owner), None)
+
+    return list(index.values())
+
+
+def run(number: int = 20):
+    for count in (250, 2000):
+        user_repositories = create_repositories(count)
+        # 최근에 생성된 repository 부터 내려오는 API 순서 + 삭제된 repository 10개
+        repositories = list(reversed(user_repositories[10:]))
+
+        assert match_by_list(repositories, user_repositories) == match_by_index(repositories, user_repositories)
+
+        list_time = timeit.timeit(lambda: match_by_list(repositories, user_repositories), number=number)
+        index_time = timeit.timeit(lambda: match_by_index(repositories, user_repositories), number=number)
+
+        print(f'repository {count}개, {number}회 반복')
+        print(f'list  : {list_time / number * 1000:.3f}ms/회')
+        print(f'index : {index_time / number * 1000:.3f}ms/회')
+        print(f'{list_time / index_time:.1f}배 빠름')
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
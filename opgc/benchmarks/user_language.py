@@ -0,0 +1,108 @@
+"""
+UserLanguage 업데이트 벤치마크 (UserLanguage 마다 save vs 한번 읽어서 bulk 동기화)
+: 80개 언어를 사용하는 유저의 언어별 바이트 수가 모두 바뀐 경우, 테스트 DB 를 만들어서 실행한다.
+
+사용법 (opgc 디렉토리에서 실행)
+$ DJANGO_SETTINGS_MODULE=conf.settings.action python -m benchmarks.user_language [반복 횟수]
+"""
+import os
+import sys
+import timeit
+from unittest import mock
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'conf.settings.action')
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from apps.githubs.models import GithubUser, Language, UserLanguage  # noqa: E402
+from core.services.repository_service import RepositoryService  # noqa: E402
+
+LANGUAGE_COUNT = 80
+
+
+def update_or_create_language_per_row(repository_service: RepositoryService):
+    """
+    기존 update_or_create_language 방식 (Language 를 두번 조회하고 UserLanguage 마다 save)
+    """
+    github_user = repository_service.github_user
+    language_qs = Language.objects.filter(type__in=repository_service.update_languages.keys()).values_list(
+        'type', flat=True
+    )
+    new_languages = set(repository_service.update_languages.keys()) - set(k.lower() for k in language_qs)
+
+    if new_languages:
+        Language.objects.bulk_create([Language(type=language) for language in new_languages])
+
+    user_language_qs = UserLanguage.objects.prefetch_related('language').filter(
+        github_user_id=github_user.id,
+        language__type__in=repository_service.update_languages.keys()
+    )
+
+    for user_language in user_language_qs:
+        if user_language.language.type in repository_service.update_languages.keys():
+            count = repository_service.update_languages.pop(user_language.language.type)
+
+            if user_language.number != count:
+                user_language.number = count
+                user_language.save(update_fields=['number'])
+
+    new_user_languages = [
+        UserLanguage(
+            github_user_id=github_user.id,
+            language_id=language.id,
+            number=repository_service.update_languages.pop(language.type.lower())
+        ) for language in Language.objects.filter(type__in=repository_service.update_languages.keys())
+    ]
+
+    if new_user_languages:
+        UserLanguage.objects.bulk_create(new_user_languages)
+
+
+def measure(github_user: GithubUser, update, number: int) -> (float, int):
+    iteration = {'count': 0}
+
+    def _update():
+        iteration['count'] += 1
+        repository_service = RepositoryService(github_user)
+        # 매번 모든 언어의 바이트 수가 바뀌도록 한다.
+        repository_service.update_languages = {
+            f'language{idx}': idx + iteration['count'] for idx in range(LANGUAGE_COUNT)
+        }
+        update(repository_service)
+
+    _update()  # 처음 한번은 Language, UserLanguage 를 생성
+
+    with CaptureQueriesContext(connection) as context:
+        _update()
+
+    return timeit.timeit(_update, number=number), len(context.captured_queries)
+
+
+def run(number: int = 20):
+    old_database_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0)
+
+    try:
+        with mock.patch('core.db.models.invalidate_obj'), mock.patch('core.db.models.invalidate_model'):
+            per_row_user = GithubUser.objects.create(username='per_row')
+            bulk_user = GithubUser.objects.create(username='bulk')
+
+            per_row_time, per_row_queries = measure(per_row_user, update_or_create_language_per_row, number)
+            bulk_time, bulk_queries = measure(bulk_user, RepositoryService.update_or_create_language, number)
+    finally:
+        connection.creation.destroy_test_db(old_database_name, verbosity=0)
+
+    print(f'언어 {LANGUAGE_COUNT}개, {number}회 반복 ({connection.vendor})')
+    print(f'per row : {per_row_time / number * 1000:.3f}ms/회, 쿼리 {per_row_queries}개')
+    print(f'bulk    : {bulk_time / number * 1000:.3f}ms/회, 쿼리 {bulk_queries}개')
+    print(f'쿼리 수 : {per_row_queries}개 -> {bulk_queries}개 ({per_row_queries - bulk_queries}개 감소)')
+    # sqlite 같은 로컬 DB 는 쿼리 왕복 비용이 거의 없어서 bulk 쿼리가 더 느릴 수 있다. (네트워크 DB 에서 차이가 커짐)
+    print(f'실행 시간 비율 (bulk / per row) : {bulk_time / per_row_time:.2f}')
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
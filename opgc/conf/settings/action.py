@@ -14,6 +14,7 @@ ALLOWED_HOSTS = ['*', 'localhost:8000', '127.0.0.1', 'localhost']
 # Gihub api auth token
 OPGC_TOKEN = 'OPGC_GITHUB_TOKEN'
 GITHUB_API_HEADER = {'Authorization': f'token {OPGC_TOKEN}'}
+GITHUB_API_TOKENS = [OPGC_TOKEN]  # rate limit 을 나눠쓰기 위한 token 목록 (남은 횟수 기준으로 돌려가며 사용)
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
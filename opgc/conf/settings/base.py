@@ -24,3 +24,82 @@ INSTALLED_APPS = [
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = 'OPGC_SECRET_KEY'
+
+#########################################
+#         Github API 통신 설정
+#########################################
+GITHUB_HTTP_POOL_CONNECTIONS = 10  # 커넥션 풀을 유지할 host 수
+GITHUB_HTTP_POOL_MAXSIZE = 32  # host 당 커넥션 풀 크기 (ThreadPoolExecutor 기본 max_worker 최대값)
+GITHUB_HTTP_TIMEOUT = (3.05, 10)  # (connect, read) 기본 timeout(초)
+GITHUB_ASYNC_CONNECTION_LIMIT = 100  # event loop 당 전체 동시 커넥션 수
+GITHUB_ASYNC_LIMIT_PER_HOST = 20  # host 당 동시 커넥션 수
+GITHUB_ASYNC_DNS_CACHE_TTL = 300  # DNS 캐시 유지 시간(초)
+GITHUB_ASYNC_KEEPALIVE_TIMEOUT = 30  # keep-alive 커넥션 유지 시간(초)
+GITHUB_ASYNC_TIMEOUT = 30  # 요청당 전체 timeout(초)
+
+# Github API 조건부 요청(ETag) 캐시
+# - BACKEND: memory(프로세스 메모리 LRU) or django(CACHE_ALIAS 에 설정된 Django cache)
+GITHUB_RESPONSE_CACHE = {
+    'BACKEND': 'memory',
+    'CACHE_ALIAS': 'default',
+    'MAX_BYTES': 64 * 1024 * 1024,  # memory backend 전체 크기
+    'MAX_ENTRY_BYTES': 1024 * 1024,  # 응답 하나당 최대 크기
+    'TIMEOUT': 60 * 60 * 24 * 7,  # django backend 유지 시간
+}
+
+# 유저 정보, 레포지토리, 언어 정보를 GraphQL 로 가져온다. (실패하면 REST API 로 가져옴)
+GITHUB_USE_GRAPHQL = True
+
+GITHUB_PAGINATION_CONCURRENCY = 4  # 페이지네이션 요청시 동시에 가져올 페이지 수
+GITHUB_ORGANIZATION_CONCURRENCY = 4  # 유저 업데이트시 동시에 repository 목록을 가져오는 organization 수
+
+GITHUB_REPOSITORY_BATCH_SIZE = 200  # 유저의 레포지토리를 한번에 저장(bulk_create, bulk_update)하는 개수
+
+# GET 요청 재시도 정책 (capped exponential backoff + jitter)
+GITHUB_RETRY = {
+    'MAX_RETRIES': 4,
+    'BACKOFF_BASE': 0.5,  # 첫 재시도 최대 대기 시간(초), 재시도마다 2배씩 증가
+    'BACKOFF_MAX': 8,  # 재시도 최대 대기 시간(초)
+    'MAX_RETRY_AFTER': 60,  # 이보다 긴 Retry-After 는 기다리지 않고 실패 처리
+}
+
+# 같은 organization 의 유저들이 공유하는 캐시 (같은 시간대에 업데이트 되는 유저들은 한번만 가져온다)
+# - TIMEOUT: 유지 시간(초), MAX_SIZE: 최대 개수
+GITHUB_ORGANIZATION_REPOSITORY_CACHE = {  # organization 별 repository 목록
+    'TIMEOUT': 60 * 30,
+    'MAX_SIZE': 1000,
+}
+GITHUB_CONTRIBUTOR_CACHE = {  # repository 별 contributor 목록
+    'TIMEOUT': 60 * 30,
+    'MAX_SIZE': 20000,
+}
+GITHUB_LANGUAGE_CACHE = {  # repository 별 언어 정보 (repository 가 변경되지 않으면 유지)
+    'TIMEOUT': 60 * 60 * 24 * 7,
+    'MAX_SIZE': 50000,
+}
+
+# Language type → id 매핑 (프로세스 메모리)
+# - Language 가 추가되면 CACHE_ALIAS 의 version 을 올리고, 다른 프로세스는 VERSION_CHECK_INTERVAL(초) 마다 확인한다.
+LANGUAGE_MAP = {
+    'CACHE_ALIAS': 'default',
+    'VERSION_CHECK_INTERVAL': 60,
+}
+
+# 1일 1커밋 크롤러 (github.com contribution calendar)
+GITHUB_CONTRIBUTION_CRAWLER = {
+    'CONCURRENCY': 10,  # 동시에 크롤링 하는 유저 수
+    'USER_CHUNK_SIZE': 1000,  # DB 에서 한번에 읽어오는 유저 수
+    'UPDATE_BATCH_SIZE': 500,  # 한번에 저장(bulk_update)하는 유저 수
+}
+
+# github.com 크롤링 요청 속도 제한 (token bucket, 429 응답을 받으면 속도를 줄인다)
+# - BACKEND: local(프로세스 안에서 공유) or redis(CACHE_ALIAS 의 django_redis 로 여러 프로세스가 공유)
+GITHUB_SCRAPING_THROTTLE = {
+    'BACKEND': 'local',
+    'CACHE_ALIAS': 'default',
+    'MAX_RATE': 10,  # 초당 최대 요청 수
+    'MIN_RATE': 0.5,  # 429 가 계속 되어도 유지하는 초당 최소 요청 수
+    'CAPACITY': 10,  # 한번에 몰아서 보낼 수 있는 요청 수
+    'INCREASE_STEP': 0.1,  # 성공할때마다 늘리는 초당 요청 수
+    'DECREASE_FACTOR': 0.5,  # 429 응답을 받으면 줄이는 비율
+}
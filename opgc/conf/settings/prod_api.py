@@ -14,6 +14,7 @@ ALLOWED_HOSTS = ['OPGC_ALLOWED_HOSTS']
 # Gihub api auth token
 OPGC_TOKEN = 'OPGC_GITHUB_TOKEN'
 GITHUB_API_HEADER = {'Authorization': f'token {OPGC_TOKEN}'}
+GITHUB_API_TOKENS = [OPGC_TOKEN]  # rate limit 을 나눠쓰기 위한 token 목록 (남은 횟수 기준으로 돌려가며 사용)
 
 # 임시
 CORS_ORIGIN_ALLOW_ALL = True
@@ -179,3 +180,6 @@ CACHEOPS = {
     'ranks.*': {},
     'notices.*': {},
 }
+
+GITHUB_RESPONSE_CACHE['BACKEND'] = 'django'  # 조건부 요청 캐시를 Redis 에서 공유
+GITHUB_SCRAPING_THROTTLE['BACKEND'] = 'redis'  # 크롤링 요청 속도를 크론 스크립트들과 공유
@@ -0,0 +1,268 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Iterable, List, Tuple
+
+from django.conf import settings
+
+
+class CacheStats:
+    """
+    캐시 통계 (thread-safe)
+    - hits: 캐시된 값을 사용한 횟수
+    - misses: 캐시가 없거나 만료되어 새로 가져온 횟수
+    - evictions: 크기 제한으로 밀려난 횟수
+    - invalidations: 원본이 변경되어 버려진 횟수 (VersionedTTLCache)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def increase(self, name: str, count: int = 1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + count)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self):
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def to_dict(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'hit_rate': round(self.hit_rate, 4),
+        }
+
+
+class TTLCache:
+    """
+    유저간에 공유하는 프로세스 메모리 캐시 (thread-safe)
+    : 유지 시간(timeout)이 지나면 만료되고, max_size 를 넘으면 가장 오래 사용하지 않은 값부터 제거한다.
+    """
+
+    def __init__(self, timeout: float, max_size: int):
+        self.timeout = timeout
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key: (expire_at, value)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(key, None)
+                self.stats.increase('misses')
+                return None
+
+            self._entries.move_to_end(key)
+
+        self.stats.increase('hits')
+        return entry[1]
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.timeout, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.increase('evictions')
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class VersionedTTLCache(TTLCache):
+    """
+    원본의 버전(ex. repository 의 pushed_at, size)을 같이 저장하는 캐시
+    : 조회할때 버전이 다르면 원본이 변경된 것이므로 버리고, 버전을 알 수 없는 경우는 캐시를 사용하지 않는다.
+    """
+
+    def get_version(self, key: str, version: Optional[tuple]) -> Optional[Any]:
+        if version is None or None in version:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            is_changed = entry is not None and entry[0] > time.monotonic() and entry[1][0] != version
+
+        if is_changed:
+            self.delete(key)
+            self.stats.increase('invalidations')
+
+        cached = self.get(key)
+        return cached[1] if cached is not None else None
+
+    def set_version(self, key: str, version: Optional[tuple], value: Any):
+        if version is None or None in version:
+            return
+
+        self.set(key, (version, value))
+
+
+class LanguageMap:
+    """
+    Language type(소문자) → id 매핑 (프로세스 메모리, thread-safe)
+    - 처음 사용할때 전체 Language 를 한번 읽어오고, 없는 type, id 를 찾는 경우 다시 읽는다.
+    - Language 를 추가하면 django cache 의 version 을 올리고, 다른 프로세스는 version_check_interval 마다
+      version 을 확인해서 바뀌었으면 다시 읽는다.
+    """
+    version_key = 'language-map-version'
+
+    def __init__(self, alias: str, version_check_interval: float):
+        self.alias = alias
+        self.version_check_interval = version_check_interval
+        self.stats = CacheStats()
+        self._lock = threading.RLock()
+        self._ids: Optional[Dict[str, int]] = None  # {type(소문자): id}
+        self._types: Dict[int, str] = {}  # {id: type(저장된 그대로)}
+        self._version = None
+        self._checked_at = 0.0
+
+    def get_ids(self, language_types: Iterable[str]) -> Dict[str, int]:
+        """
+        type 별 Language id (DB 에 없는 type 은 제외)
+        """
+        language_types = {language_type.lower() for language_type in language_types}
+
+        with self._lock:
+            ids = self._load()
+            if not language_types <= ids.keys():
+                self.stats.increase('misses')
+                ids = self.refresh()
+            else:
+                self.stats.increase('hits')
+
+            return {language_type: ids[language_type] for language_type in language_types if language_type in ids}
+
+    def get_id(self, language_type: str) -> Optional[int]:
+        return self.get_ids([language_type]).get(language_type.lower())
+
+    def get_type(self, language_id: int) -> Optional[str]:
+        with self._lock:
+            self._load()
+            if language_id not in self._types:
+                self.stats.increase('misses')
+                self.refresh()
+            else:
+                self.stats.increase('hits')
+
+            return self._types.get(language_id)
+
+    def items(self) -> List[Tuple[int, str]]:
+        """
+        전체 (id, type) 목록 (id 순서)
+        """
+        with self._lock:
+            self._load()
+            return sorted(self._types.items())
+
+    def get_or_create_ids(self, language_types: Iterable[str]) -> Dict[str, int]:
+        """
+        type 별 Language id, DB 에 없던 Language 는 생성한다.
+        """
+        from apps.githubs.models import Language
+
+        language_types = {language_type.lower() for language_type in language_types}
+        ids = self.get_ids(language_types)
+        new_language_types = language_types - ids.keys()
+
+        if not new_language_types:
+            return ids
+
+        # 다른 프로세스에서 먼저 생성한 경우는 무시하고 다시 읽어온다.
+        Language.objects.bulk_create(
+            [Language(type=language_type) for language_type in new_language_types], ignore_conflicts=True
+        )
+        self.bump_version()
+        return self.get_ids(language_types)
+
+    def refresh(self) -> Dict[str, int]:
+        from apps.githubs.models import Language
+
+        with self._lock:
+            version = self._get_version()
+            ids, types = {}, {}
+
+            for language_id, language_type in Language.objects.values_list('id', 'type').order_by('id'):
+                ids.setdefault(language_type.lower(), language_id)
+                types[language_id] = language_type
+
+            self._ids, self._types = ids, types
+            self._version = version
+            self._checked_at = time.monotonic()
+            return ids
+
+    def bump_version(self):
+        from django.core.cache import caches
+
+        cache = caches[self.alias]
+        cache.add(self.version_key, 0, timeout=None)
+        cache.incr(self.version_key)
+
+    def clear(self):
+        with self._lock:
+            self._ids, self._types = None, {}
+            self._version = None
+
+    def _load(self) -> Dict[str, int]:
+        if self._ids is None:
+            return self.refresh()
+
+        if time.monotonic() - self._checked_at >= self.version_check_interval:
+            self._checked_at = time.monotonic()
+            if self._get_version() != self._version:
+                return self.refresh()
+
+        return self._ids
+
+    def _get_version(self) -> int:
+        from django.core.cache import caches
+
+        return caches[self.alias].get(self.version_key, 0)
+
+
+# organization 별 repository 목록 (key: organization name)
+organization_repository_cache = TTLCache(
+    timeout=settings.GITHUB_ORGANIZATION_REPOSITORY_CACHE['TIMEOUT'],
+    max_size=settings.GITHUB_ORGANIZATION_REPOSITORY_CACHE['MAX_SIZE'],
+)
+
+# repository 별 contributor 의 contributions (key: repository full_name, value: {login(소문자): contributions})
+contributor_cache = TTLCache(
+    timeout=settings.GITHUB_CONTRIBUTOR_CACHE['TIMEOUT'],
+    max_size=settings.GITHUB_CONTRIBUTOR_CACHE['MAX_SIZE'],
+)
+
+# repository 별 언어 정보 (key: repository full_name, version: (pushed_at, size), value: {언어(소문자): 바이트 수})
+language_cache = VersionedTTLCache(
+    timeout=settings.GITHUB_LANGUAGE_CACHE['TIMEOUT'],
+    max_size=settings.GITHUB_LANGUAGE_CACHE['MAX_SIZE'],
+)
+
+# Language type(소문자) → id
+language_map = LanguageMap(
+    alias=settings.LANGUAGE_MAP['CACHE_ALIAS'],
+    version_check_interval=settings.LANGUAGE_MAP['VERSION_CHECK_INTERVAL'],
+)
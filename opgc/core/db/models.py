@@ -1,4 +1,4 @@
-from cacheops import invalidate_obj
+from cacheops import invalidate_obj, invalidate_model
 from django.db import models
 from django.db.models import QuerySet
 from sentry_sdk import capture_exception
@@ -12,6 +12,12 @@ class BaseQueryset(QuerySet):
         이렇게 커스텀 하거나 invalidated_update() 를 써줘야 한다
         """
         row = super().update(**kwargs)
+
+        if row > 1:
+            # 여러 row 를 업데이트 한 경우 (ex. bulk_update) 다시 조회하지 않고 model 단위로 invalidate
+            invalidate_model(self.model)
+            return row
+
         try:
             invalidate_obj(self.get())
         except self.model.DoesNotExist:
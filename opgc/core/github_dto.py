@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import Optional
 
 
 class UserType(Enum):
@@ -63,6 +64,9 @@ class RepositoryDto:
     language: str  # 대표 언어
     contributors_url: str  # contributor 정보 URL
     languages_url: str  # 언어 정보 URL
+    languages: Optional[dict]  # 언어별 바이트 수 (GraphQL 로 미리 가져온 경우에만 존재)
+    pushed_at: Optional[str]  # 마지막 push 시각
+    size: Optional[int]  # 레포지토리 크기(KB)
 
     def __init__(self, **kwargs):
         self.name = kwargs.get('name')
@@ -73,6 +77,16 @@ class RepositoryDto:
         self.language = kwargs.get('language', '')
         self.contributors_url = kwargs.get('contributors_url')
         self.languages_url = kwargs.get('languages_url')
+        self.languages = kwargs.get('languages')
+        self.pushed_at = kwargs.get('pushed_at')
+        self.size = kwargs.get('size')
+
+    @property
+    def version(self) -> tuple:
+        """
+        레포지토리 변경 여부를 판단하는 값 (push 가 있으면 pushed_at 과 size 가 바뀐다)
+        """
+        return self.pushed_at, self.size
 
     @staticmethod
     def _set_repository_full_name(full_name: str) -> str:
@@ -80,7 +94,6 @@ class RepositoryDto:
 
 
 @dataclass
-class ContributorDto:
-    languages: str
-    is_contributor: bool
-    contributions: int
+class UserProfileDto:
+    user_information: UserInformationDto
+    repositories: list  # RepositoryDto 로 변환 가능한 repository 데이터 (소유한 레포지토리)
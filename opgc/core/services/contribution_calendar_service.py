@@ -0,0 +1,71 @@
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Tuple, Optional
+
+from django.db import transaction
+
+from apps.githubs.models import ContributionCalendar
+from utils.contribution_calendar import pack_calendar, get_contribution_statistics, ContributionStatistics
+
+
+class ContributionCalendarService:
+    """
+    크롤링한 contribution calendar 를 유저의 년도별로 저장하고, 저장된 calendar 로 통계를 계산한다.
+    """
+
+    @staticmethod
+    def bulk_upsert(user_calendar_days: Dict[int, Dict[date, Tuple[int, int]]]):
+        """
+        유저별 날짜별 (level, contribution 수)를 년도별 calendar 에 합쳐서 저장
+        - user_calendar_days : {github_user_id: {날짜: (level, contribution 수)}}
+        """
+        calendar_days = defaultdict(dict)  # (github_user_id, year): {날짜: (level, contribution 수)}
+        for github_user_id, days in user_calendar_days.items():
+            for day, value in days.items():
+                calendar_days[(github_user_id, day.year)][day] = value
+
+        if not calendar_days:
+            return
+
+        calendars = {
+            (calendar.github_user_id, calendar.year): calendar
+            for calendar in ContributionCalendar.objects.filter(
+                github_user_id__in=user_calendar_days.keys(),
+                year__in={year for _, year in calendar_days.keys()}
+            )
+        }
+
+        new_calendars = []
+        update_calendars = []
+
+        for (github_user_id, year), days in calendar_days.items():
+            calendar = calendars.get((github_user_id, year))
+
+            if calendar is None:
+                levels, counts = pack_calendar(days)
+                new_calendars.append(
+                    ContributionCalendar(github_user_id=github_user_id, year=year, levels=levels, counts=counts)
+                )
+            else:
+                calendar.levels, calendar.counts = pack_calendar(days, bytes(calendar.levels), bytes(calendar.counts))
+                update_calendars.append(calendar)
+
+        with transaction.atomic():
+            if new_calendars:
+                ContributionCalendar.objects.bulk_create(new_calendars)
+            if update_calendars:
+                ContributionCalendar.objects.bulk_update(update_calendars, fields=['levels', 'counts'])
+
+    @staticmethod
+    def get_statistics(github_user_id: int, until: Optional[date] = None) -> ContributionStatistics:
+        """
+        저장된 calendar 로 1일 1커밋, 최장 1일 1커밋, 커밋한 날짜 수, 주간 통계를 계산 (크롤링 하지 않음)
+        """
+        calendars = ContributionCalendar.objects.filter(
+            github_user_id=github_user_id
+        ).values_list('year', 'levels', 'counts')
+
+        return get_contribution_statistics(
+            [(year, bytes(levels), bytes(counts)) for year, levels, counts in calendars],
+            until=until or date.today()
+        )
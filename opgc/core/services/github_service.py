@@ -1,24 +1,27 @@
 from dataclasses import asdict
 from typing import Optional
 
+from django.conf import settings
 from django.db.models import Count, Max
 from sentry_sdk import capture_exception
 
+from adapter.github_graphql import GithubGraphQLAdapter
 from adapter.githubs import GithubAdapter
 from adapter.slack import SlackAdapter
 from api.exceptions import NotUserType, BlockedUser
 from apps.githubs.models import GithubUser, BlockUser
-from core.github_dto import UserInformationDto, UserType
-from utils.exceptions import RateLimit, insert_queue
+from core.github_dto import UserInformationDto, UserType, UserProfileDto
+from utils.exceptions import RateLimit, insert_queue, manage_api_call_fail
 from core.services.organization_service import OrganizationService
 from core.services.repository_service import RepositoryService
-from utils.github import get_continuous_commit_day
+from utils.github import update_continuous_commit_day, CONTINUOUS_COMMIT_FIELDS
 
 
 class GithubInformationService:
     github_user = None
     github_adapter = GithubAdapter
-    github_api_per_page = 50
+    graphql_adapter = GithubGraphQLAdapter
+    limit_repository_count = 250
 
     user_update_fields = [
         'avatar_url', 'company', 'bio', 'blog', 'public_repos',
@@ -44,8 +47,13 @@ class GithubInformationService:
         # 0. Github API 호출 가능한지 체크
         self.get_rate_remaining()
 
-        # 실제로 github 에 존재하는 user 인지 체크
-        user_information: Optional[UserInformationDto] = self.github_adapter.get_user_info(self.username)
+        # 실제로 github 에 존재하는 user 인지 체크 (GraphQL 로 레포지토리 정보까지 한번에 가져오고, 실패하면 REST API 사용)
+        user_profile: Optional[UserProfileDto] = self.get_user_profile()
+        if user_profile:
+            user_information: Optional[UserInformationDto] = user_profile.user_information
+        else:
+            user_information: Optional[UserInformationDto] = self.github_adapter.get_user_info(self.username)
+
         if user_information is None and self.is_insert_queue:
             insert_queue(self.username)
             raise RateLimit()
@@ -55,18 +63,33 @@ class GithubInformationService:
 
         # 2. User 의 repository 정보를 가져온다
         repo_service = RepositoryService(github_user=self.github_user)
-        for repository in self.get_user_repository_urls(user_information):
+        if user_profile:
+            repositories = user_profile.repositories
+        else:
+            repositories = self.get_user_repository_urls(user_information)
+
+        if repositories is None:
+            # 레포지토리 목록을 일부만 가져온 상태로 업데이트하면 나머지 레포지토리가 삭제되므로 업데이트 하지 않는다.
+            return self.github_user
+
+        for repository in repositories:
             repo_service.repositories.append(repo_service.create_dto(repository))
 
         if repo_service.has_auto_commit_repository() is True:
             self.block_user()
 
         # 3. Organization 정보와 연관된 repository 업데이트
-        org_service = OrganizationService(github_user=self.github_user)
+        # organization repository 의 contributor 확인 결과는 4. 에서 다시 가져오지 않도록 repo_service 와 공유
+        org_service = OrganizationService(
+            github_user=self.github_user,
+            contributor_pages=repo_service.contributor_pages
+        )
         org_service.update_or_create_organization(user_information.organizations_url)
-        org_service.get_organization_repository()
+        if not org_service.get_organization_repository():
+            # organization repository 목록 없이 업데이트하면 기존 organization repository 가 삭제되므로 업데이트 하지 않는다.
+            return self.github_user
 
-        # 4. Repository 정보 업데이트
+        # 4. Repository 정보 업데이트 (유저가 소유한 레포지토리 + 기여한 organization 레포지토리)
         repo_service.repositories += org_service.repositories
         repo_service.update_repositories()
 
@@ -123,29 +146,38 @@ class GithubInformationService:
     def is_blocked_user(username: str) -> bool:
         return BlockUser.objects.filter(username=username).exists()
 
-    def get_user_repository_urls(self, user_information: UserInformationDto) -> list:
+    def get_user_profile(self) -> Optional[UserProfileDto]:
         """
-        유저가 가지고 있는 repository url 들을 반환
+        GraphQL 로 유저 정보와 소유한 레포지토리(언어별 바이트 수 포함)를 가져온다.
         """
-        limit_repository_count = 250
-        params = {'per_page': self.github_api_per_page, 'page': 1}
-        repositories = []
+        if not settings.GITHUB_USE_GRAPHQL:
+            return None
+
+        return self.graphql_adapter.get_user_profile(self.username, limit=self.limit_repository_count)
+
+    def get_user_repository_urls(self, user_information: UserInformationDto) -> Optional[list]:
+        """
+        유저가 가지고 있는 repository url 들을 반환 (가져오지 못한 페이지가 있으면 None)
+        """
+        # 250개가 넘는지 확인하기 위해 하나 더 가져온다.
+        repositories, status_code = self.github_adapter.get_paginated_infos(
+            user_information.repos_url,
+            limit=self.limit_repository_count + 1
+        )
 
-        for i in range(0, (self.github_user.public_repos // self.github_api_per_page) + 1):
-            params['page'] = i + 1
-            repository_info, status_code = self.github_adapter.get_repository_infos(user_information.repos_url, params)
-            if repository_info:
-                repositories.extend(repository_info)
+        if repositories is None:
+            manage_api_call_fail(self.github_user, status_code)
+            return None
 
         # todo: 레포지토리가 너무 많은경우 한번 프로세스에 async 로 처리하는데 서버 성능이 못따라감.
         #       일단 250개 미만으로 업데이트 하고, 이 부분에 대해서 고민해보기 (일단 리포팅만)
-        if len(repositories) > limit_repository_count:
+        if len(repositories) > self.limit_repository_count:
             capture_exception(Exception(f'Repository count is over 250.'))
 
-        return repositories[:limit_repository_count]
+        return repositories[:self.limit_repository_count]
 
     def get_rate_remaining(self) -> int:
-        remaining = self.github_adapter.check_rate_limit()
+        remaining = self.github_adapter.get_rate_remaining()
 
         if remaining <= 0:
             if self.is_insert_queue:
@@ -162,9 +194,7 @@ class GithubInformationService:
         self.github_user.total_contribution = total_contribution
         self.github_user.total_stargazers_count = total_stargazers_count
 
-        is_completed, continuous_count = get_continuous_commit_day(self.github_user.username)
-        if is_completed:
-            self.github_user.continuous_commit_day = continuous_count
+        update_continuous_commit_day(self.github_user)
 
         total_score = self.get_total_score(self.github_user)
         user_rank = self.update_user_ranking(total_score, self.github_user)
@@ -175,25 +205,30 @@ class GithubInformationService:
         self.github_user.tier = self.get_tier_statistics(user_rank)
         self.github_user.save(update_fields=[
             'status', 'updated', 'total_contribution', 'total_stargazers_count',
-            'tier', 'continuous_commit_day', 'previous_user_rank', 'user_rank', 'total_score'
+            'tier', 'previous_user_rank', 'user_rank', 'total_score', *CONTINUOUS_COMMIT_FIELDS
         ])
 
         return self.github_user
 
     @staticmethod
-    def get_total_score(github_user: GithubUser) -> int:
-        """
-        종합 점수 계산 정첵
-        - 각 항목별 백분율을 구한뒤 가중치를 적용하여 종합 점수를 구한다.
-        """
-        weights = [95, 4, 0.5, 0.5]  # 각 항목별 가중치
-        max_scores = GithubUser.objects.aggregate(
+    def get_max_scores() -> dict:
+        return GithubUser.objects.aggregate(
             continuous_commit_day=Max('continuous_commit_day'),
             total_contribution=Max('total_contribution'),
             followers=Max('followers'),
             following=Max('following'),
         )
 
+    @classmethod
+    def get_total_score(cls, github_user: GithubUser, max_scores: Optional[dict] = None) -> int:
+        """
+        종합 점수 계산 정첵
+        - 각 항목별 백분율을 구한뒤 가중치를 적용하여 종합 점수를 구한다.
+        - max_scores : 여러 유저의 점수를 한번에 계산하는 경우 미리 구한 항목별 최대값
+        """
+        weights = [95, 4, 0.5, 0.5]  # 각 항목별 가중치
+        max_scores = max_scores or cls.get_max_scores()
+
         continuous_commit_day = (github_user.continuous_commit_day / max_scores['continuous_commit_day']) * 100 * weights[0]
         total_contribution = (github_user.total_contribution / max_scores['total_contribution']) * 100 * weights[1]
         followers = (github_user.followers / max_scores['followers']) * 100 * weights[2]
@@ -1,20 +1,26 @@
 import asyncio
-import json
-from typing import List
+from typing import List, Dict, Set, Optional
+
+from django.conf import settings
+from django.db import transaction
 
 from adapter.githubs import GithubAdapter
+from adapter.sessions import AsyncSessionManager
 from apps.githubs.models import GithubUser, UserOrganization, Organization
+from core.caches import organization_repository_cache
 from core.github_dto import OrganizationDto, RepositoryDto
 from utils.exceptions import manage_api_call_fail
-from core.services.repository_service import RepositoryService
+from core.services.repository_service import RepositoryService, ContributorPages
 
 
 class OrganizationService:
     github_adapter = GithubAdapter
 
-    def __init__(self, github_user: GithubUser):
+    def __init__(self, github_user: GithubUser, contributor_pages: Optional[Dict[str, ContributorPages]] = None):
         self.github_user = github_user
-        self.new_repositories: List[RepositoryDto] = []  # 업데이트 해야할 레포지토리
+        # contributor 확인 결과를 같은 업데이트의 RepositoryService 와 공유한다. (contributor_pages)
+        self.repository_service = RepositoryService(github_user=github_user, contributor_pages=contributor_pages)
+        self.organizations: List[OrganizationDto] = []  # 유저가 소속된 organization
         self.repositories = []  # 실제 유저의 레포지토리
 
     def get_organizations(self, organization_url: str) -> List[OrganizationDto]:
@@ -34,94 +40,134 @@ class OrganizationService:
         """
         organization(소속)을 생성하거나 업데이트
         """
-        update_user_organization_list = []
-        current_user_organizations = list(UserOrganization.objects.filter(
-            github_user_id=self.github_user.id
-        ).values_list('organization__name', flat=True))
+        organization_dtos = {
+            organization_dto.name: organization_dto for organization_dto in self.get_organizations(organization_url)
+        }
 
-        for organization_dto in self.get_organizations(organization_url):
-            try:
-                update_fields = []
-                organization = Organization.objects.get(name=organization_dto.name)
+        with transaction.atomic():
+            organization_ids = self.update_or_create_organizations(organization_dtos)
+            self.update_organization_handler(organization_ids)
 
-                for idx, org in enumerate(current_user_organizations):
-                    if organization.name == org:
-                        current_user_organizations.pop(idx)
-                        break
+        # organization 의 repository 는 get_organization_repository 에서 동시에 가져온다.
+        self.organizations = list(organization_dtos.values())
 
-                if organization.description != organization_dto.description:
-                    organization.description = organization_dto.description
-                    update_fields.append('description')
+    @staticmethod
+    def update_or_create_organizations(organization_dtos: Dict[str, OrganizationDto]) -> Set[int]:
+        """
+        organization 을 이름으로 한번에 조회해서 없으면 생성(bulk_create), 변경된 정보는 bulk_update 한다.
+        : organization 수와 상관없이 쿼리 수가 같다.
+        """
+        organizations = {
+            organization.name: organization
+            for organization in Organization.objects.filter(name__in=organization_dtos.keys())
+        }
+
+        new_organizations = []
+        changed_organizations = []
+        for name, organization_dto in organization_dtos.items():
+            organization = organizations.get(name)
+
+            if organization is None:
+                new_organizations.append(
+                    Organization(
+                        name=organization_dto.name,
+                        logo=organization_dto.logo,
+                        description=organization_dto.description or '',
+                    )
+                )
+            elif organization.description != organization_dto.description or \
+                    organization.logo != organization_dto.logo:
+                organization.description = organization_dto.description
+                organization.logo = organization_dto.logo
+                changed_organizations.append(organization)
+
+        if new_organizations:
+            # 다른 유저 업데이트에서 먼저 생성한 경우는 무시하고, id 를 알기 위해 다시 조회한다.
+            Organization.objects.bulk_create(new_organizations, ignore_conflicts=True)
+            organizations.update(
+                (organization.name, organization)
+                for organization in Organization.objects.filter(
+                    name__in=[organization.name for organization in new_organizations]
+                )
+            )
 
-                if organization.logo != organization_dto.logo:
-                    organization.logo = organization_dto.logo
-                    update_fields.append('logo')
+        if changed_organizations:
+            Organization.objects.bulk_update(changed_organizations, fields=['description', 'logo'])
 
-                if update_fields:
-                    organization.save(update_fields=update_fields)
+        return {organization.id for organization in organizations.values()}
 
-                update_user_organization_list.append(organization.id)
+    async def get_organization_repositories(self, organization_dto: OrganizationDto) -> Optional[List[RepositoryDto]]:
+        """
+        organization 의 repository 목록 (같은 organization 의 유저들은 캐시된 목록을 공유한다)
+        : 가져오지 못하면 None (빈 목록을 캐시하면 다른 멤버들의 organization repository 가 삭제되므로 캐시하지 않는다)
+        """
+        repositories = organization_repository_cache.get(organization_dto.name)
 
-            except Organization.DoesNotExist:
-                new_organization = Organization.objects.create(
-                    name=organization_dto.name,
-                    logo=organization_dto.logo,
-                    description=organization_dto.description or '',
-                )
-                update_user_organization_list.append(new_organization.id)
+        if repositories is None:
+            repositories = await self.repository_service.async_get_repositories(organization_dto.repos_url)
 
-            # organization 에 있는 repository 중 User 가 Contributor 인 repository 를 등록한다.
-            repository_service = RepositoryService(github_user=self.github_user)
-            self.new_repositories += repository_service.get_repositories(organization_dto.repos_url)
+            if repositories is not None:
+                organization_repository_cache.set(organization_dto.name, repositories)
 
-        self.update_organization_handler(current_user_organizations, update_user_organization_list)
+        return repositories
 
-    def update_organization_handler(self, current_user_organizations: list, update_user_organization_list: list):
-        new_user_organization_list = []
+    def update_organization_handler(self, organization_ids: Set[int]):
+        """
+        현재 소속과 비교해서 새로운 소속은 추가하고, 더이상 소속이 아닌 organization 은 삭제
+        """
+        current_organization_ids = set(UserOrganization.objects.filter(
+            github_user_id=self.github_user.id
+        ).values_list('organization_id', flat=True))
 
-        for organization_id in update_user_organization_list:
-            if not UserOrganization.objects.filter(
-                github_user_id=self.github_user.id,
-                organization_id=organization_id
-            ).exists():
-                new_user_organization_list.append(
-                    UserOrganization(
-                        github_user_id=self.github_user.id,
-                        organization_id=organization_id
-                    )
-                )
+        new_organization_ids = organization_ids - current_organization_ids
+        delete_organization_ids = current_organization_ids - organization_ids
 
-        if new_user_organization_list:
-            UserOrganization.objects.bulk_create(new_user_organization_list)
+        if new_organization_ids:
+            UserOrganization.objects.bulk_create([
+                UserOrganization(
+                    github_user_id=self.github_user.id,
+                    organization_id=organization_id
+                ) for organization_id in new_organization_ids
+            ])
 
-        if current_user_organizations:
+        if delete_organization_ids:
             UserOrganization.objects.filter(
                 github_user_id=self.github_user.id,
-                organization__name__in=current_user_organizations
+                organization_id__in=delete_organization_ids
             ).delete()
 
-    def get_organization_repository(self):
+    def get_organization_repository(self) -> bool:
         """
-        organization 에 저장되어있는 repository 정보를 가져온다
+        organization 에 있는 repository 중 User 가 Contributor 인 repository 를 가져온다
+        : repository 목록을 가져오지 못한 organization 이 있으면 False
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(self.get_organization_repository_futures(self.new_repositories))
+        return AsyncSessionManager.run(self.get_organization_repository_futures(self.organizations))
+
+    async def get_organization_repository_futures(self, organizations: List[OrganizationDto]) -> bool:
+        """
+        organization 별 repository 목록은 최대 GITHUB_ORGANIZATION_CONCURRENCY 개씩 동시에 가져오고,
+        목록을 다 가져온 organization 부터 바로 contributor 확인을 시작한다.
+        """
+        semaphore = asyncio.Semaphore(settings.GITHUB_ORGANIZATION_CONCURRENCY)
 
-    async def get_organization_repository_futures(self, repositories: list):
         async def __inner(repository: RepositoryDto):
-            res, content = await GithubAdapter.get_infos(repository.contributors_url)
+            contributors = await self.repository_service.get_contributors(repository)
+
+            if contributors and self.github_user.username.lower() in contributors:
+                self.repositories.append(repository)
+
+        async def __organization(organization_dto: OrganizationDto) -> bool:
+            async with semaphore:
+                repositories = await self.get_organization_repositories(organization_dto)
 
-            if res.status != 200:
-                return
+            if repositories is None:
+                return False
 
-            for contributor in json.loads(content):
-                if self.github_user.username.lower() == contributor.get('login').lower():
-                    self.repositories.append(repository)
-                    break
+            await asyncio.gather(*[__inner(repository) for repository in repositories])
+            return True
 
-        futures = [asyncio.create_task(__inner(repository)) for repository in repositories]
-        await asyncio.gather(*futures)
+        futures = [asyncio.create_task(__organization(organization_dto)) for organization_dto in organizations]
+        return all(await asyncio.gather(*futures))
 
     @staticmethod
     def create_dto(organization_data: dict) -> OrganizationDto:
@@ -1,10 +1,16 @@
 import asyncio
 import json
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict
+
+from django.conf import settings
+from django.db import transaction
 
 from adapter.githubs import GithubAdapter
-from apps.githubs.models import GithubUser, Repository, Language, UserLanguage
-from core.github_dto import RepositoryDto, ContributorDto
+from adapter.sessions import AsyncSessionManager
+from apps.githubs.models import GithubUser, Repository, UserLanguage
+from core.caches import contributor_cache, language_cache, language_map
+from core.github_dto import RepositoryDto
 from utils.exceptions import manage_api_call_fail, REASON_FORBIDDEN
 
 
@@ -15,125 +21,90 @@ AUTO_COMMIT_REPO_NAME_REGEX = [
 ]
 
 
+@dataclass
+class ContributorPages:
+    contributors: dict = field(default_factory=dict)  # 지금까지 가져온 {login(소문자): contributions}
+    next_page: Optional[int] = 1  # 다음에 가져올 페이지 (None 이면 더 가져올 페이지가 없음)
+    is_complete: bool = False  # 전체 contributor 목록을 가져왔는지 (403 등으로 중단된 경우 False)
+
+
 class RepositoryService:
     github_adapter = GithubAdapter
-    github_api_per_page = 50
 
-    def __init__(self, github_user: GithubUser):
+    def __init__(self, github_user: GithubUser, contributor_pages: Optional[Dict[str, ContributorPages]] = None):
         self.github_user = github_user
         self.total_contribution = 0
         self.total_stargazers_count = 0
         self.repositories: List[RepositoryDto] = []  # 업데이트할 레포지토리 리스트
         self.new_repository_list = []  # 새로 생성될 레포지토리 리스트
+        self.changed_repository_list = []  # contribution, stargazers_count 가 변경된 레포지토리 리스트
         self.update_languages = {}  # 업데이트 할 language
+        # 업데이트 중에 가져온 repository 별 contributor 페이지 (같은 업데이트의 OrganizationService 와 공유)
+        self.contributor_pages: Dict[str, ContributorPages] = {} if contributor_pages is None else contributor_pages
 
     def update_repositories(self) -> bool:
-        # 유저의 현재 모든 repository 를 가져온다.
-        user_repositories = list(Repository.objects.filter(github_user=self.github_user))
+        # 유저의 현재 모든 repository 를 (full_name, owner) 로 찾을 수 있도록 인덱싱 한다.
+        user_repository_index = self.create_repository_index(
+            Repository.objects.filter(github_user=self.github_user)
+        )
+
+        AsyncSessionManager.run(self.get_update_repository_futures(self.repositories, user_repository_index))
 
-        # loop = asyncio.get_event_loop()
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(self.get_update_repository_futures(self.repositories, user_repositories))
+        # 인덱스에 남아 있는 user_repository 는 삭제된 repository 라 DB 에서도 삭제 해준다.
+        delete_repository_ids = [repository.id for repository in user_repository_index.values()]
 
-        if self.new_repository_list:
-            Repository.objects.bulk_create(self.new_repository_list)
+        # 가져오는 동안 모아둔 변경사항을 한번에 저장
+        batch_size = settings.GITHUB_REPOSITORY_BATCH_SIZE
+        with transaction.atomic():
+            if self.new_repository_list:
+                Repository.objects.bulk_create(self.new_repository_list, batch_size=batch_size)
 
-        # 남아 있는 user_repository 는 삭제된 repository 라 DB 에서도 삭제 해준다.
-        delete_repository_ids = []
-        for repository in user_repositories:
-            delete_repository_ids.append(repository.id)
+            if self.changed_repository_list:
+                Repository.objects.bulk_update(
+                    self.changed_repository_list, fields=['contribution', 'stargazers_count'], batch_size=batch_size
+                )
 
-        if delete_repository_ids:
-            Repository.objects.filter(id__in=delete_repository_ids).delete()
+            if delete_repository_ids:
+                Repository.objects.filter(id__in=delete_repository_ids).delete()
 
         return True
 
-    def get_repositories(self, repos_url: str) -> List[RepositoryDto]:
-        repositories = []
-        repository_infos, status_code = self.github_adapter.get_repository_infos(repos_url)
+    async def async_get_repositories(self, repos_url: str) -> Optional[List[RepositoryDto]]:
+        """
+        repos_url 의 모든 repository 를 가져온다. (Link 헤더로 전체 페이지를 확인해서 동시에 가져온다)
+        : 가져오지 못하면 None
+        """
+        repository_infos, status_code = await self.github_adapter.async_get_paginated_infos(repos_url)
 
         if repository_infos is None:
             manage_api_call_fail(self.github_user, status_code)
+            return None
 
-        for repository_info in repository_infos:
-            repository_dto = self.create_dto(repository_info)
-            repositories.append(repository_dto)
-
-        return repositories
-
-    def create_repository(self, repository: RepositoryDto) -> (int, Optional[Repository]):
-        new_repository = None
-
-        if self.is_fork_repository(repository.fork):
-            return 0, None
+        return [self.create_dto(repository_info) for repository_info in repository_infos]
 
-        contributor = self.check_contributor(repository)
-
-        # contributor 이거나 owner 인 경우
-        if contributor.is_contributor or repository.owner.lower() == self.github_user.username.lower():
-            new_repository = Repository(
+    def create_repository(self, repository: RepositoryDto, contribution: int, languages: str) -> Optional[Repository]:
+        """
+        새로운 repository 를 만든다. (contributor 이거나 owner 인 경우만)
+        """
+        if contribution > 0 or repository.owner.lower() == self.github_user.username.lower():
+            return Repository(
                 github_user=self.github_user,
                 name=repository.name,
                 full_name=repository.full_name,
                 owner=repository.owner,
-                contribution=contributor.contributions,
+                contribution=contribution,
                 stargazers_count=repository.stargazers_count,
                 rep_language=repository.language if repository.language else '',
-                languages=contributor.languages
+                languages=languages
             )
 
-        self.total_stargazers_count += repository.stargazers_count
-
-        return contributor.contributions, new_repository
+        return None
 
-    def check_contributor(self, repository: RepositoryDto) -> ContributorDto:
+    def add_languages(self, languages: Optional[dict]) -> str:
         """
-        User 가 Repository 의 contributor 인지 확인한다.
-        contributions 와 language 확인을 위해 아래 로직을 타야함
-        Too many Contributor 403 오류인 경우만 어쩔수 없이 contributions 확인 불가
+        언어별 바이트 수를 update_languages 에 더한다.
+        : await 없이 한번에 더하기 때문에 같은 event loop 의 여러 task 에서 호출해도 안전하다.
         """
-        params = {'per_page': self.github_api_per_page, 'page': 1}
-
-        for i in range(0, (self.github_user.public_repos // self.github_api_per_page) + 1):
-            params['page'] = i + 1
-            contributor_infos, status_code = self.github_adapter.get_contributor_infos(
-                contributors_url=repository.contributors_url,
-                params=params
-            )
-
-            if contributor_infos is None:
-                fail_type = manage_api_call_fail(self.github_user, status_code)
-                if fail_type == REASON_FORBIDDEN:
-                    break
-                continue
-
-            for contributor in contributor_infos:
-                # User 타입이고 contributor 가 본인인 경우 (깃헙에서 대소문자 구분을 하지않아서 lower 처리후 비교)
-                if self.is_contributor(contributor, self.github_user.username):
-                    contributions = contributor.get('contributions', 0)
-                    return ContributorDto(
-                        languages=self.record_language(repository.languages_url) if contributions > 0 else '',
-                        is_contributor=True,
-                        contributions=contributions
-                    )
-
-        return ContributorDto(
-            languages='',
-            is_contributor=False,
-            contributions=0
-        )
-
-    def record_language(self, languages_url: str) -> str:
-        """
-        repository 에서 사용중인 언어를 찾아서 dictionary 에 type 과 count 를 저장
-        - count : 해당 언어로 작성된 코드의 바이트 수.
-        """
-        languages, status_code = self.github_adapter.get_languages(languages_url)
-
-        if languages is None:
-            manage_api_call_fail(self.github_user, status_code)
-
         if not languages:
             return ''
 
@@ -145,119 +116,236 @@ class RepositoryService:
 
         return json.dumps(list(languages.keys()))
 
-    def update_or_create_language(self):
+    async def async_get_languages(self, repository: RepositoryDto) -> Optional[dict]:
         """
-        새로 추가된 언어를 만들고 User 가 사용하는 언어사용 count(byte 수)를 업데이트 해주는 함수
+        repository 의 언어 정보를 가져온다.
+        - GraphQL 로 미리 가져온 언어 정보가 있으면 API 를 호출하지 않는다.
+        - 변경되지 않은 repository(pushed_at, size 가 같은)는 다른 유저가 가져온 언어 정보를 재사용한다.
         """
-        # DB에 없던 Language 생성
-        new_language_list = []
-        language_qs = Language.objects.filter(
-            type__in=self.update_languages.keys()
-        ).values_list(
-            'type', flat=True
-        )
+        languages = self.get_cached_languages(repository)
+        if languages is not None:
+            return languages
 
-        update_languages_set = set(self.update_languages.keys())
-        # 업데이트 이전에 대문자로 저장된 Type들 호환성을 위해 소문자로 변환후 비교
-        exists_languages_set = set(k.lower() for k in language_qs)
-        new_languages = update_languages_set - exists_languages_set
+        languages, status_code = await self.github_adapter.async_get_languages(repository.languages_url)
+        return self.set_cached_languages(repository, languages, status_code)
 
-        for language in new_languages:
-            new_language_list.append(Language(type=language))
+    @staticmethod
+    def get_cached_languages(repository: RepositoryDto) -> Optional[dict]:
+        if repository.languages is not None:
+            language_cache.set_version(repository.full_name, repository.version, repository.languages)
+            return repository.languages
 
-        if new_language_list:
-            Language.objects.bulk_create(new_language_list)
+        return language_cache.get_version(repository.full_name, repository.version)
 
-        # 기존에 있던 UserLanguage 업데이트
-        new_user_languages = []
-        user_language_qs = UserLanguage.objects.prefetch_related('language').filter(
-            github_user_id=self.github_user.id,
-            language__type__in=self.update_languages.keys()
-        )
+    def set_cached_languages(self, repository: RepositoryDto, languages: Optional[dict],
+                             status_code: int) -> Optional[dict]:
+        if languages is None:
+            manage_api_call_fail(self.github_user, status_code)
+            return None
 
-        for user_language in user_language_qs:
-            if user_language.language.type in self.update_languages.keys():
-                count = self.update_languages.pop(user_language.language.type)
+        language_cache.set_version(repository.full_name, repository.version, languages)
+        return languages
 
-                if user_language.number != count:
+    def update_or_create_language(self):
+        """
+        새로 추가된 언어를 만들고 User 가 사용하는 언어사용 count(byte 수)를 동기화 해주는 함수
+        : 유저의 UserLanguage 를 한번 읽어서 생성(bulk_create), 변경(bulk_update), 삭제(더이상 사용하지 않는 언어)를
+          한 트랜잭션으로 처리한다.
+        """
+        # 업데이트 이전에 대문자로 저장된 Type들 호환성을 위해 소문자로 변환후 비교
+        update_languages = {}
+        for language_type, count in self.update_languages.items():
+            update_languages[language_type.lower()] = update_languages.get(language_type.lower(), 0) + count
+
+        # Language 생성은 UserLanguage 트랜잭션 밖에서 처리 (롤백되어도 language_map 과 DB 가 어긋나지 않도록)
+        language_ids = language_map.get_or_create_ids(update_languages.keys())
+
+        with transaction.atomic():
+            user_languages = {}
+            delete_user_language_ids = []
+            for user_language in UserLanguage.objects.filter(github_user_id=self.github_user.id):
+                if user_language.language_id in user_languages:
+                    delete_user_language_ids.append(user_language.id)  # 같은 언어로 중복 생성된 UserLanguage
+                else:
+                    user_languages[user_language.language_id] = user_language
+
+            new_user_languages = []
+            changed_user_languages = []
+            for language_type, count in update_languages.items():
+                language_id = language_ids.get(language_type)
+                if language_id is None:
+                    continue
+
+                user_language = user_languages.pop(language_id, None)
+
+                if user_language is None:
+                    new_user_languages.append(
+                        UserLanguage(
+                            github_user_id=self.github_user.id,
+                            language_id=language_id,
+                            number=count
+                        )
+                    )
+                elif user_language.number != count:
                     user_language.number = count
-                    user_language.save(update_fields=['number'])
-
-        # 새로운 UserLanguage 생성
-        languages = Language.objects.filter(type__in=self.update_languages.keys())
-        for language in languages:
-            new_user_languages.append(
-                UserLanguage(
-                    github_user_id=self.github_user.id,
-                    language_id=language.id,
-                    number=self.update_languages.pop(language.type.lower())
-                )
-            )
-
-        if new_user_languages:
-            UserLanguage.objects.bulk_create(new_user_languages)
+                    changed_user_languages.append(user_language)
 
-    async def update_repository(self, repository: RepositoryDto, user_repositories: list):
-        is_exist_repo = False
+            # 남아 있는 UserLanguage 는 더이상 사용하지 않는 언어
+            delete_user_language_ids += [user_language.id for user_language in user_languages.values()]
 
-        for idx, user_repo in enumerate(user_repositories):
-            if user_repo.full_name == repository.full_name and user_repo.owner == repository.owner:
-                update_fields = []
-                is_exist_repo = True
-                contribution = 0
+            if new_user_languages:
+                UserLanguage.objects.bulk_create(new_user_languages)
 
-                user_repositories.pop(idx)
-                res, content = await GithubAdapter.get_infos(repository.contributors_url)
+            if changed_user_languages:
+                UserLanguage.objects.bulk_update(changed_user_languages, fields=['number'])
 
-                if res.status == 200:
-                    for contributor in json.loads(content):
-                        # User 타입이고 contributor 가 본인인 경우 (깃헙에서 대소문자 구분을 하지않아서 lower 처리후 비교)
-                        if self.is_contributor(contributor, self.github_user.username):
-                            contribution = contributor.get('contributions')
-                            self.record_language(repository.languages_url)
+            if delete_user_language_ids:
+                UserLanguage.objects.filter(id__in=delete_user_language_ids).delete()
 
-                if user_repo.contribution != contribution:
-                    user_repo.contribution = contribution
-                    update_fields.append('contribution')
+    async def update_repository(self, repository: RepositoryDto, user_repository_index: dict):
+        # 매칭된 repository 는 await 전에 인덱스에서 빼서 다른 task 와 중복으로 매칭되지 않도록 한다.
+        user_repo = user_repository_index.pop(self.get_repository_key(repository.full_name, repository.owner), None)
 
-                if user_repo.stargazers_count != repository.stargazers_count:
-                    user_repo.stargazers_count = repository.stargazers_count
-                    update_fields.append('stargazers_count')
+        # 새로운 레포지토리 중 fork 한 레포지토리는 제외
+        if user_repo is None and self.is_fork_repository(repository.fork):
+            return
 
-                if update_fields:
-                    user_repo.save(update_fields=update_fields)
+        contribution = 0
+        languages = ''
+        contributors, repository_languages = await self.get_contributors_and_languages(repository)
 
-                self.total_stargazers_count += repository.stargazers_count
-                self.total_contribution += contribution
-                break
+        if contributors:
+            # 깃헙에서 대소문자 구분을 하지않아서 lower 처리후 비교
+            contribution = contributors.get(self.github_user.username.lower(), 0)
+            if contribution:
+                languages = self.add_languages(repository_languages)
 
         # 새로운 레포지토리인 경우
-        if not is_exist_repo:
-            _contribution, new_repository = self.create_repository(repository)
+        if user_repo is None:
+            new_repository = self.create_repository(repository, contribution, languages)
 
             if new_repository:
                 self.new_repository_list.append(new_repository)
 
-            self.total_contribution += _contribution
+        else:
+            is_changed = False
+
+            if user_repo.contribution != contribution:
+                user_repo.contribution = contribution
+                is_changed = True
+
+            if user_repo.stargazers_count != repository.stargazers_count:
+                user_repo.stargazers_count = repository.stargazers_count
+                is_changed = True
+
+            if is_changed:
+                # 코루틴 안에서 바로 저장하지 않고 update_repositories 에서 bulk_update 로 한번에 저장
+                self.changed_repository_list.append(user_repo)
 
-    async def get_update_repository_futures(self, repositories, user_repositories: list):
+        self.total_stargazers_count += repository.stargazers_count
+        self.total_contribution += contribution
+
+    async def get_update_repository_futures(self, repositories, user_repository_index: dict):
         futures = [
             asyncio.create_task(
-                self.update_repository(repository, user_repositories)
+                self.update_repository(repository, user_repository_index)
             ) for repository in repositories
         ]
 
         await asyncio.gather(*futures)
 
     @staticmethod
-    def create_dto(repository_data: dict) -> RepositoryDto:
-        return RepositoryDto(**repository_data)
+    def get_repository_key(full_name: str, owner: str) -> tuple:
+        return full_name, owner
+
+    @classmethod
+    def create_repository_index(cls, user_repositories) -> dict:
+        """
+        유저의 repository 를 (full_name, owner) 로 찾을 수 있는 dictionary 로 만든다.
+        """
+        return {
+            cls.get_repository_key(user_repo.full_name, user_repo.owner): user_repo
+            for user_repo in user_repositories
+        }
+
+    async def get_contributors_and_languages(self, repository: RepositoryDto) -> (Optional[dict], Optional[dict]):
+        """
+        repository 의 contributor 와 언어 정보를 가져온다.
+        : 언어 정보는 contributor 목록에서 유저를 확인한 뒤, contributor 인 경우에만 순서대로 가져온다.
+          (동시에 가져오면 contributor 가 아닌 repository 의 언어 정보까지 호출하게 된다)
+        """
+        contributors = await self.get_contributors(repository)
+
+        if not contributors or not contributors.get(self.github_user.username.lower()):
+            return contributors, None
+
+        return contributors, await self.async_get_languages(repository)
+
+    async def get_contributors(self, repository: RepositoryDto) -> Optional[dict]:
+        """
+        repository 의 contributor 별 contributions 를 가져온다. ({login(소문자): contributions})
+        - Link 헤더의 다음 페이지를 따라가며 가져오다가 유저를 찾으면 바로 멈춘다. (유저를 찾을때 까지의 목록만 반환)
+        - 가져온 페이지는 contributor_pages 에 남겨서 같은 업데이트 중에는 다시 가져오지 않는다.
+        - 끝까지 가져온 contributor 목록은 유저간에 캐시를 공유해서 organization 멤버 수만큼 호출하지 않도록 한다.
+        """
+        contributors = self.get_known_contributors(repository)
+        if contributors is not None:
+            return contributors
+
+        username = self.github_user.username.lower()
+        pages = self.contributor_pages.setdefault(repository.full_name, ContributorPages())
+
+        while username not in pages.contributors and pages.next_page:
+            contributor_infos, next_page, status_code = await self.github_adapter.async_get_contributor_page(
+                contributors_url=repository.contributors_url,
+                page=pages.next_page
+            )
+
+            if contributor_infos is None:
+                # Too many Contributor(403) 인 경우는 다시 요청해도 같으므로 더 가져오지 않는다.
+                if manage_api_call_fail(self.github_user, status_code) == REASON_FORBIDDEN:
+                    pages.next_page = None
+                return None
+
+            pages.contributors.update(self.to_contributor_map(contributor_infos))
+            pages.next_page = next_page
+
+            if next_page is None:
+                pages.is_complete = True
+                contributor_cache.set(repository.full_name, pages.contributors)
+
+        return pages.contributors
+
+    def get_known_contributors(self, repository: RepositoryDto) -> Optional[dict]:
+        """
+        이미 가져온 전체 contributor 목록 (이번 업데이트에서 가져온 목록, 유저간에 공유하는 캐시 순서로 확인)
+        """
+        pages = self.contributor_pages.get(repository.full_name)
+        if pages is not None and pages.is_complete:
+            return pages.contributors
+
+        contributors = contributor_cache.get(repository.full_name)
+        if contributors is not None:
+            # 캐시가 만료되어도 이번 업데이트 중에는 다시 가져오지 않도록 남겨둔다.
+            self.contributor_pages[repository.full_name] = ContributorPages(
+                contributors=contributors, next_page=None, is_complete=True
+            )
+
+        return contributors
 
     @staticmethod
-    def is_contributor(contributor: dict, github_user_name: str):
-        if contributor.get('type') == 'User' and contributor.get('login').lower() == github_user_name.lower():
-            return True
-        return False
+    def to_contributor_map(contributor_infos: list) -> dict:
+        """
+        User 타입 contributor 의 contributions (깃헙에서 대소문자 구분을 하지않아서 login 은 소문자로 저장)
+        """
+        return {
+            contributor.get('login').lower(): contributor.get('contributions', 0)
+            for contributor in contributor_infos if contributor.get('type') == 'User'
+        }
+
+    @staticmethod
+    def create_dto(repository_data: dict) -> RepositoryDto:
+        return RepositoryDto(**repository_data)
 
     @staticmethod
     def is_fork_repository(fork: bool):
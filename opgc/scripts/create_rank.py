@@ -1,6 +1,4 @@
-from chunkator import chunkator
-
-from apps.githubs.models import Language
+from core.caches import language_map
 from scripts.update_ranking_system import RankService, rank_type_model
 
 
@@ -13,6 +11,5 @@ def run():
     for _type in rank_type_model.keys():
         rank_service.create_new_rank(_type=_type)
 
-    languages = Language.objects.all()
-    for language in chunkator(languages, 1000):
-        rank_service.create_new_rank(_type=f'lang-{language.type}')
+    for _, language_type in language_map.items():
+        rank_service.create_new_rank(_type=f'lang-{language_type}')
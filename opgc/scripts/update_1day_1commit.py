@@ -1,55 +1,158 @@
 import asyncio
+import concurrent.futures
 import timeit
+from typing import List, Dict
 
-from chunkator import chunkator
+from chunkator import chunkator_page
+from django.conf import settings
+from django.db import connection, transaction
+from sentry_sdk import capture_exception
 
+from adapter.sessions import AsyncSessionManager
 from apps.githubs.models import GithubUser
+from core.services.contribution_calendar_service import ContributionCalendarService
 from core.services.github_service import GithubInformationService
-from utils.github import get_continuous_commit_day, is_exists_github_users
+from utils.github import (
+    async_update_continuous_commit_day, async_is_exists_github_users, get_yesterday, CONTINUOUS_COMMIT_FIELDS
+)
 from adapter.slack import SlackAdapter
 
 
-async def update_continuous_commit_day(github_user: GithubUser):
+class ContinuousCommitDayCrawler:
     """
-    1일 1커밋 크롤링으로 업데이트
+    1일 1커밋 크롤러
+    - DB 에서 유저를 user_chunk_size 씩 읽어서 큐에 넣고 (큐가 가득 차면 worker 가 처리할때까지 기다린다)
+    - concurrency 개의 worker 가 동시에 크롤링 하고, 결과는 update_batch_size 씩 모아서 bulk_update 한다.
+      (크롤링한 calendar 도 같이 ContributionCalendar 에 저장)
+    - DB 작업은 event loop 를 막지 않도록 별도 스레드 하나에서 처리한다.
     """
-    if not is_exists_github_users(github_user.username):
-        return
 
-    is_completed, continuous_count = get_continuous_commit_day(github_user.username)
+    def __init__(self, concurrency: int, user_chunk_size: int, update_batch_size: int):
+        self.concurrency = concurrency
+        self.user_chunk_size = user_chunk_size
+        self.update_batch_size = update_batch_size
+        self.db_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.updated_users: List[GithubUser] = []
+        self.calendar_days: Dict[int, dict] = {}  # github_user_id: 크롤링한 날짜별 (level, contribution 수)
+        self.update_count = 0
+        self.fail_count = 0
+
+    async def run(self):
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        workers = [asyncio.ensure_future(self.worker(queue)) for _ in range(self.concurrency)]
+
+        try:
+            await self.produce(queue)
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+            await self.flush()
+            await self.run_db(self.close_connection)
+            self.db_executor.shutdown()
+
+    async def produce(self, queue: asyncio.Queue):
+        pages = chunkator_page(
+            GithubUser.objects.only(
+                'id', 'username', 'total_contribution', 'followers', 'following', *CONTINUOUS_COMMIT_FIELDS
+            ),
+            self.user_chunk_size
+        )
+
+        while True:
+            github_users = await self.run_db(next, pages, None)
+            if github_users is None:
+                break
+
+            for github_user in github_users:
+                await queue.put(github_user)
+
+    async def worker(self, queue: asyncio.Queue):
+        while True:
+            github_user = await queue.get()
+            try:
+                await self.update_continuous_commit_day(github_user)
+            except Exception as e:
+                capture_exception(e)
+            finally:
+                queue.task_done()
+
+    async def update_continuous_commit_day(self, github_user: GithubUser):
+        """
+        1일 1커밋 크롤링으로 업데이트
+        """
+        if github_user.continuous_commit_checked_date == get_yesterday():
+            return  # 오늘 이미 업데이트 된 유저
+
+        if not await async_is_exists_github_users(github_user.username):
+            return
 
-    if is_completed:
-        github_user.continuous_commit_day = continuous_count
-        github_user.total_score = GithubInformationService.get_total_score(github_user)
-        github_user.save(update_fields=['continuous_commit_day', 'total_score'])
+        calendar_days = {}
+        if not await async_update_continuous_commit_day(github_user, calendar_days):
+            self.fail_count += 1
+            return
 
+        self.updated_users.append(github_user)
+        if calendar_days:
+            self.calendar_days[github_user.id] = calendar_days
 
-def update_1day_1commit():
+        if len(self.updated_users) >= self.update_batch_size:
+            await self.flush()
 
-    async def update_1day_1commit_futures():
-        github_users = GithubUser.objects.all()
+    async def flush(self):
+        github_users, self.updated_users = self.updated_users, []
+        calendar_days, self.calendar_days = self.calendar_days, {}
 
-        if not github_users:
-            return
+        if github_users:
+            await self.run_db(self.save, github_users, calendar_days)
+            self.update_count += len(github_users)
+
+    @staticmethod
+    def save(github_users: List[GithubUser], calendar_days: Dict[int, dict]):
+        # 아직 저장되지 않은 이번 배치의 1일 1커밋 카운트도 최대값에 포함한다.
+        max_scores = GithubInformationService.get_max_scores()
+        max_scores['continuous_commit_day'] = max(
+            max_scores['continuous_commit_day'] or 0,
+            *[github_user.continuous_commit_day for github_user in github_users]
+        )
+
+        for github_user in github_users:
+            github_user.total_score = GithubInformationService.get_total_score(github_user, max_scores)
 
-        futures = [asyncio.ensure_future(update_continuous_commit_day(github_user))
-                   for github_user in chunkator(github_users, 1000)]
+        with transaction.atomic():
+            GithubUser.objects.bulk_update(github_users, fields=[*CONTINUOUS_COMMIT_FIELDS, 'total_score'])
+            ContributionCalendarService.bulk_upsert(calendar_days)
 
-        await asyncio.gather(*futures)
+    @staticmethod
+    def close_connection():
+        connection.close()  # DB 스레드에서 열린 커넥션은 DB 스레드에서 닫아야 한다.
+
+    async def run_db(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.db_executor, func, *args)
+
+
+def update_1day_1commit() -> ContinuousCommitDayCrawler:
+    crawler = ContinuousCommitDayCrawler(
+        concurrency=settings.GITHUB_CONTRIBUTION_CRAWLER['CONCURRENCY'],
+        user_chunk_size=settings.GITHUB_CONTRIBUTION_CRAWLER['USER_CHUNK_SIZE'],
+        update_batch_size=settings.GITHUB_CONTRIBUTION_CRAWLER['UPDATE_BATCH_SIZE'],
+    )
+    AsyncSessionManager.run(crawler.run())
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(update_1day_1commit_futures())
+    return crawler
 
 
 def run():
     start_time = timeit.default_timer()  # 시작 시간 체크
     SlackAdapter.slack_update_1day_1commit(status='시작🌱', message='')
 
-    update_1day_1commit()
+    crawler = update_1day_1commit()
 
     terminate_time = timeit.default_timer()  # 종료 시간 체크
     SlackAdapter.slack_update_1day_1commit(
         status='완료🌿',
-        message=f'1일 1커밋 카운트 업데이트가 {terminate_time - start_time:.2f}초 걸렸습니다.😎',
+        message=f'1일 1커밋 카운트 업데이트가 {terminate_time - start_time:.2f}초 걸렸습니다.😎 '
+                f'(업데이트 {crawler.update_count}명, 실패 {crawler.fail_count}명)',
     )
@@ -4,8 +4,9 @@ from chunkator import chunkator
 from django.db import transaction
 from sentry_sdk import capture_exception
 
-from apps.githubs.models import GithubUser, Language, UserLanguage
+from apps.githubs.models import GithubUser, UserLanguage
 from apps.ranks.models import UserRank
+from core.caches import language_map
 from core.services.github_service import GithubInformationService
 from utils.exceptions import GitHubUserDoesNotExist
 from adapter.slack import SlackAdapter
@@ -52,13 +53,13 @@ class RankService(object):
         언어별 count 값으로 랭킹
         랭킹 업데이트 도중 하나라도 오류가 나면 원상복구
         """
-        for language in chunkator(Language.objects.all(), 1000):
-            user_languages = UserLanguage.objects.filter(language_id=language.id).order_by('-number')[:10]
+        for language_id, language_type in language_map.items():
+            user_languages = UserLanguage.objects.filter(language_id=language_id).order_by('-number')[:10]
 
             with transaction.atomic():  # 랭킹 업데이트 도중 하나라도 오류가 나면 원상복구
                 for order, user_language in enumerate(user_languages):
                     user_rank, is_created = UserRank.objects.get_or_create(
-                        type=f'lang-{language.type}',
+                        type=f'lang-{language_type}',
                         ranking=order+1
                     )
                     user_rank.github_user_id = user_language.github_user_id
@@ -6,7 +6,12 @@ from chunkator import chunkator
 
 from apps.githubs.models import GithubUser
 from utils.exceptions import RateLimit, GitHubUserDoesNotExist
+from core.caches import language_cache
 from core.services.github_service import GithubInformationService
+from adapter.caches import response_cache
+from adapter.githubs import GithubAdapter
+from adapter.retries import retry_stats
+from adapter.sessions import SessionManager
 from adapter.slack import SlackAdapter
 
 
@@ -57,9 +62,22 @@ def run():
                 continue
 
     terminate_time = timeit.default_timer()
+    connection_stats = SessionManager.get_connection_stats()
+    dedup_stats = GithubAdapter.get_dedup_stats()
+    token_usage = ', '.join(
+        f'{report["token"]} {report["usage"]}회(남은 횟수 {report["remaining"]})'
+        for report in GithubAdapter.get_token_usage_report()
+    )
     SlackAdapter.slack_update_older_week_user(
         status='완료',
         message=f'업데이트가 {terminate_time - start_time:.2f}초 걸렸습니다. '
-                f'🤖 API 호출 남은 횟수 : {rate_limit_check_service.get_rate_remaining()}',
+                f'🤖 API 호출 남은 횟수 : {rate_limit_check_service.get_rate_remaining()} '
+                f'🔌 커넥션 재사용 : {connection_stats["reused"]}/{connection_stats["requests"]} '
+                f'(신규 커넥션 {connection_stats["opened"]}) '
+                f'📦 캐시 적중률 : {response_cache.stats.hit_rate * 100:.1f}% '
+                f'(언어 {language_cache.stats.hit_rate * 100:.1f}%) '
+                f'🔗 중복 요청 병합 : {dedup_stats["shared"]}회 ({dedup_stats["dedup_rate"] * 100:.1f}%) '
+                f'🔑 token 사용량 : {token_usage} '
+                f'🔁 재시도 : {sum(stats["retries"] for stats in retry_stats.to_dict().values())}회',
         update_user=update_user_count
     )
@@ -0,0 +1,76 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    etag = '"opgc-v1"'
+    total_items = 250  # /repos 로 요청시 페이지네이션 되는 전체 아이템 수
+
+    def do_GET(self):
+        if self.path.startswith('/repos'):
+            return self.send_page()
+
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = b'{"login": "jay"}'
+        self.send_response(200)
+        self.send_header('ETag', self.etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_page(self):
+        query = parse_qs(urlparse(self.path).query)
+        per_page, page = int(query['per_page'][0]), int(query['page'][0])
+        last_page = (self.total_items - 1) // per_page + 1
+        body = json.dumps([
+            {'id': i} for i in range((page - 1) * per_page, min(page * per_page, self.total_items))
+        ]).encode()
+
+        if page == int(query.get('fail_page', [0])[0]):
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if self.headers.get('If-None-Match') == self.etag:
+            # 304 응답에는 Link 헤더가 없다.
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('ETag', self.etag)
+        self.send_header('Link', f'<http://{self.headers["Host"]}/repos?per_page={per_page}&page={last_page}>; rel="last"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='function')
+def local_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,70 @@
+import json
+
+from adapter.caches import CachedResponse, MemoryResponseCache, response_cache
+from adapter.githubs import GithubAdapter
+from adapter.sessions import AsyncSessionManager
+
+
+class TestMemoryResponseCache:
+
+    def test_파라미터_순서가_달라도_같은_캐시키를_만든다(self):
+        key1 = MemoryResponseCache.build_key('https://api.github.com/users/jay/repos?type=all', {'page': 1})
+        key2 = MemoryResponseCache.build_key('https://api.github.com/users/jay/repos?page=1', {'type': 'all'})
+        assert key1 == key2
+
+    def test_전체_크기를_넘으면_가장_오래_사용하지_않은_응답부터_제거된다(self):
+        cache = MemoryResponseCache(max_bytes=10, max_entry_bytes=10)
+        cache.set('a', CachedResponse(body=b'1234', etag='a'))
+        cache.set('b', CachedResponse(body=b'1234', etag='b'))
+        cache.get('a')
+        cache.set('c', CachedResponse(body=b'1234', etag='c'))
+
+        assert cache.get('a') is not None
+        assert cache.get('b') is None
+        assert cache.get('c') is not None
+        assert cache.current_bytes == 8
+        assert cache.stats.evictions == 1
+
+    def test_ETag_가_없거나_너무_큰_응답은_저장하지_않는다(self):
+        cache = MemoryResponseCache(max_bytes=100, max_entry_bytes=4)
+        cache.store('a', {}, b'1')
+        cache.store('b', {'ETag': '"b"'}, b'12345')
+
+        assert len(cache) == 0
+
+
+class TestGithubAdapterResponseCache:
+
+    def setup_method(self):
+        response_cache.clear()
+        response_cache.stats.reset()
+
+    def test_변경되지_않은_응답은_304_로_받고_캐시된_본문을_사용한다(self, local_server):
+        url = f'{local_server}/users/jay'
+        GithubAdapter.get_repository_infos(url)
+        repository_info, status_code = GithubAdapter.get_repository_infos(url)
+
+        assert status_code == 200
+        assert repository_info == {'login': 'jay'}
+        assert response_cache.stats.hits == 1
+        assert response_cache.stats.misses == 1
+
+    def test_async_요청도_캐시된_본문을_사용한다(self, local_server):
+        url = f'{local_server}/users/jay'
+        GithubAdapter.get_repository_infos(url)
+
+        res, content = AsyncSessionManager.run(GithubAdapter.get_infos(url))
+
+        assert res.status == 200
+        assert json.loads(content) == {'login': 'jay'}
+        assert response_cache.stats.hits == 1
+
+    def test_async_304_응답도_캐시된_Link_헤더로_모든_페이지를_가져온다(self, local_server):
+        url = f'{local_server}/repos'
+        AsyncSessionManager.run(GithubAdapter.async_get_paginated_infos(url))
+
+        infos, status_code = AsyncSessionManager.run(GithubAdapter.async_get_paginated_infos(url))
+
+        assert status_code == 200
+        assert [info['id'] for info in infos] == list(range(250))
+        assert response_cache.stats.hits == 3  # 3 페이지 모두 304
@@ -0,0 +1,121 @@
+import json
+import time
+from unittest import mock
+
+from requests import Response
+
+from adapter.github_graphql import GithubGraphQLAdapter
+from adapter.tokens import TokenPool
+from core.github_dto import RepositoryDto, UserType
+
+
+def repository_node(name: str, owner: str = 'jay') -> dict:
+    return {
+        'name': name,
+        'nameWithOwner': f'{owner}/{name}',
+        'owner': {'login': owner},
+        'stargazerCount': 3,
+        'isFork': False,
+        'primaryLanguage': {'name': 'Python'},
+        'languages': {'edges': [{'size': 100, 'node': {'name': 'Python'}}, {'size': 10, 'node': {'name': 'HTML'}}]},
+    }
+
+
+def create_response(body: dict, status_code: int = 200, headers: dict = None) -> Response:
+    res = Response()
+    res.status_code = status_code
+    res._content = json.dumps(body).encode()
+    res.headers.update(headers or {})
+    return res
+
+
+def connection(nodes: list, end_cursor: str = None) -> dict:
+    return {'pageInfo': {'hasNextPage': end_cursor is not None, 'endCursor': end_cursor}, 'nodes': nodes}
+
+
+USER_DATA = {
+    'login': 'jay',
+    'name': 'test_name',
+    'email': 'test@test.com',
+    'location': 'Republic of Korea',
+    'avatarUrl': 'https://avatars.githubusercontent.com/u/1',
+    'company': None,
+    'bio': None,
+    'websiteUrl': None,
+    'followers': {'totalCount': 10},
+    'following': {'totalCount': 20},
+    'publicRepositories': {'totalCount': 3},
+}
+
+
+class TestGithubGraphQLAdapter:
+
+    def test_repository_노드를_REST_응답_형태로_변환한다(self):
+        repository = RepositoryDto(**GithubGraphQLAdapter.to_repository_data(repository_node('opgc')))
+
+        assert repository.full_name == 'jay/opgc'
+        assert repository.owner == 'jay'
+        assert repository.language == 'Python'
+        assert repository.contributors_url == 'https://api.github.com/repos/jay/opgc/contributors'
+        assert repository.languages == {'python': 100, 'html': 10}
+
+    def test_다음_페이지까지_가져와서_유저_프로필을_만든다(self):
+        first_page = {'user': {
+            **USER_DATA,
+            'repositories': connection([repository_node('repo1')], end_cursor='cursor1'),
+        }}
+        second_page = {'user': {'repositories': connection([repository_node('repo2')])}}
+
+        with mock.patch.object(GithubGraphQLAdapter, '_handle_query', side_effect=[first_page, second_page]):
+            user_profile = GithubGraphQLAdapter.get_user_profile('jay', limit=250)
+
+        assert user_profile.user_information.type == UserType.user
+        assert user_profile.user_information.public_repos == 3
+        assert user_profile.user_information.repos_url == 'https://api.github.com/users/jay/repos'
+        assert [repository['full_name'] for repository in user_profile.repositories] == ['jay/repo1', 'jay/repo2']
+
+    def test_limit_을_채우면_다음_페이지는_가져오지_않는다(self):
+        first_page = {'user': {
+            **USER_DATA,
+            'repositories': connection([repository_node('repo1'), repository_node('repo2')], end_cursor='c'),
+        }}
+
+        with mock.patch.object(GithubGraphQLAdapter, '_handle_query', side_effect=[first_page]) as handle_query:
+            user_profile = GithubGraphQLAdapter.get_user_profile('jay', limit=2)
+
+        assert handle_query.call_count == 1
+        assert len(user_profile.repositories) == 2
+
+    def test_유저가_없거나_쿼리가_실패하면_None_을_반환한다(self):
+        with mock.patch.object(GithubGraphQLAdapter, '_handle_query', return_value={'user': None}):
+            assert GithubGraphQLAdapter.get_user_profile('org', limit=250) is None
+
+    def test_rate_limit_에_걸린_token_은_다른_token_으로_다시_요청한다(self):
+        token_pool = TokenPool(['token-a', 'token-b'])
+        session = mock.Mock()
+        session.post.side_effect = [
+            create_response({'errors': [{'type': 'RATE_LIMITED', 'message': 'API rate limit exceeded'}]}, headers={
+                'X-RateLimit-Resource': 'graphql',
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset': str(int(time.time()) + 600),
+            }),
+            create_response({'data': {'user': None}}),
+        ]
+
+        with mock.patch.object(GithubGraphQLAdapter, 'token_pool', token_pool), \
+                mock.patch('adapter.github_graphql.SessionManager.get_session', return_value=session):
+            assert GithubGraphQLAdapter._handle_query('query', {}) == {'user': None}
+
+        tokens = [call.kwargs['headers']['Authorization'] for call in session.post.call_args_list]
+        assert sorted(tokens) == ['token token-a', 'token token-b']
+
+    def test_5xx_응답은_재시도한다(self):
+        session = mock.Mock()
+        session.post.side_effect = [create_response({}, status_code=502), create_response({'data': {'user': None}})]
+
+        with mock.patch.object(GithubGraphQLAdapter, 'token_pool', TokenPool(['token-a'])), \
+                mock.patch('adapter.github_graphql.SessionManager.get_session', return_value=session), \
+                mock.patch('adapter.retries.time.sleep'):
+            assert GithubGraphQLAdapter._handle_query('query', {}) == {'user': None}
+
+        assert session.post.call_count == 2
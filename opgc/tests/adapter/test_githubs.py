@@ -0,0 +1,68 @@
+from unittest import mock
+
+from furl import furl
+
+from adapter.githubs import GithubAdapter
+from adapter.sessions import AsyncSessionManager
+
+
+class TestGithubAdapterPagination:
+
+    def test_Link_헤더에서_마지막_페이지를_가져온다(self):
+        link = '<https://api.github.com/user/1/repos?per_page=100&page=2>; rel="next", ' \
+               '<https://api.github.com/user/1/repos?per_page=100&page=3>; rel="last"'
+
+        assert GithubAdapter.get_last_page(link) == 3
+        assert GithubAdapter.get_last_page(None) == 1
+
+    def test_Link_헤더에서_다음_페이지를_가져온다(self):
+        link = '<https://api.github.com/repos/jay/opgc/contributors?per_page=100&page=2>; rel="next", ' \
+               '<https://api.github.com/repos/jay/opgc/contributors?per_page=100&page=3>; rel="last"'
+
+        assert GithubAdapter.get_next_page(link) == 2
+        assert GithubAdapter.get_next_page('<https://api.github.com/x?page=1>; rel="prev"') is None
+        assert GithubAdapter.get_next_page(None) is None
+
+    def test_모든_페이지를_순서대로_가져온다(self, local_server):
+        infos, status_code = GithubAdapter.get_paginated_infos(f'{local_server}/repos')
+
+        assert status_code == 200
+        assert [info['id'] for info in infos] == list(range(250))
+
+    def test_limit_만큼만_가져온다(self, local_server):
+        infos, status_code = GithubAdapter.get_paginated_infos(f'{local_server}/repos', limit=120)
+
+        assert len(infos) == 120
+        assert infos[-1]['id'] == 119
+
+    def test_async_로도_모든_페이지를_가져온다(self, local_server):
+        infos, status_code = AsyncSessionManager.run(GithubAdapter.async_get_paginated_infos(f'{local_server}/repos'))
+
+        assert status_code == 200
+        assert [info['id'] for info in infos] == list(range(250))
+
+    def test_가져오지_못한_페이지가_있으면_실패로_반환한다(self, local_server):
+        infos, status_code = GithubAdapter.get_paginated_infos(f'{local_server}/repos', params={'fail_page': 2})
+
+        assert infos is None
+        assert status_code == 404
+
+    def test_async_로_가져오지_못한_페이지가_있으면_실패로_반환한다(self, local_server):
+        infos, status_code = AsyncSessionManager.run(
+            GithubAdapter.async_get_paginated_infos(f'{local_server}/repos', params={'fail_page': 3})
+        )
+
+        assert infos is None
+        assert status_code == 404
+
+
+class TestGithubAdapterUser:
+
+    def test_유저_존재_여부는_token_pool_로_요청한다(self, local_server):
+        token_pool = GithubAdapter.token_pool
+        with mock.patch.object(GithubAdapter, 'github_url', furl(local_server)), \
+                mock.patch.object(token_pool, 'acquire', wraps=token_pool.acquire) as acquire:
+            assert GithubAdapter.is_exists_user('jay') is True
+            assert AsyncSessionManager.run(GithubAdapter.async_is_exists_user('jay')) is True
+
+        assert acquire.call_count == 2
@@ -0,0 +1,70 @@
+import time
+
+from adapter.rate_limits import RateLimitState, PRIMARY_RATE_LIMIT, SECONDARY_RATE_LIMIT
+
+
+class TestRateLimitState:
+
+    def setup_method(self):
+        self.state = RateLimitState()
+        self.reset_at = int(time.time()) + 600
+
+    def test_응답_헤더로_남은_호출_횟수를_갱신한다(self):
+        self.state.update_from_response(200, {
+            'X-RateLimit-Limit': '5000',
+            'X-RateLimit-Remaining': '4321',
+            'X-RateLimit-Reset': str(self.reset_at),
+        })
+
+        assert self.state.get_remaining() == 4321
+        assert self.state.is_limited() is False
+
+    def test_상태를_모르거나_reset_시각이_지나면_None_을_반환한다(self):
+        assert self.state.get_remaining() is None
+
+        self.state.update(limit=5000, remaining=0, reset_at=time.time() - 1)
+        assert self.state.get_remaining() is None
+
+    def test_남은_횟수가_0인_403_응답은_primary_rate_limit_이다(self):
+        reason = self.state.update_from_response(403, {
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': str(self.reset_at),
+        })
+
+        assert reason == PRIMARY_RATE_LIMIT
+        assert self.state.get_remaining() == 0
+        assert 0 < self.state.seconds_until_available() <= 600
+
+    def test_Retry_After_가_있는_403_응답은_secondary_rate_limit_이다(self):
+        reason = self.state.update_from_response(403, {
+            'X-RateLimit-Remaining': '4000',
+            'X-RateLimit-Reset': str(self.reset_at),
+            'Retry-After': '30',
+        })
+
+        assert reason == SECONDARY_RATE_LIMIT
+        assert self.state.get_limited_reason() == SECONDARY_RATE_LIMIT
+        assert self.state.seconds_until_available() <= 30
+
+    def test_secondary_rate_limit_메시지로도_구분한다(self):
+        reason = self.state.update_from_response(
+            403, {}, '{"message": "You have exceeded a secondary rate limit."}'
+        )
+        assert reason == SECONDARY_RATE_LIMIT
+
+    def test_rate_limit_이_아닌_403_응답은_구분하지_않는다(self):
+        reason = self.state.update_from_response(403, {
+            'X-RateLimit-Remaining': '4000',
+            'X-RateLimit-Reset': str(self.reset_at),
+        }, '{"message": "contributor list is too large"}')
+
+        assert reason is None
+        assert self.state.is_limited() is False
+
+    def test_다른_resource_의_응답은_무시한다(self):
+        self.state.update_from_response(200, {
+            'X-RateLimit-Resource': 'graphql',
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': str(self.reset_at),
+        })
+        assert self.state.remaining is None
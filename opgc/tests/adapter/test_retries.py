@@ -0,0 +1,69 @@
+from unittest import mock
+
+import requests
+
+from adapter.retries import RetryPolicy, RetryStats, send_with_retry, retry_stats
+
+
+def response(status_code: int, headers: dict = None) -> requests.Response:
+    res = requests.Response()
+    res.status_code = status_code
+    res.headers.update(headers or {})
+    return res
+
+
+class TestRetryPolicy:
+
+    def setup_method(self):
+        self.policy = RetryPolicy(max_retries=3, backoff_base=0.5, backoff_max=2, max_retry_after=60)
+
+    def test_backoff_은_재시도_할수록_늘어나고_최대값을_넘지_않는다(self):
+        for attempt in range(10):
+            assert 0 <= self.policy.get_backoff(attempt) <= min(2, 0.5 * (2 ** attempt))
+
+    def test_5xx_202_커넥션_오류는_재시도한다(self):
+        assert self.policy.get_retry_delay(0, status_code=502) is not None
+        assert self.policy.get_retry_delay(0, status_code=202) is not None
+        assert self.policy.get_retry_delay(0, exception=requests.ConnectionError()) is not None
+
+    def test_재시도_횟수를_넘거나_재시도_대상이_아니면_None_을_반환한다(self):
+        assert self.policy.get_retry_delay(3, status_code=502) is None
+        assert self.policy.get_retry_delay(0, status_code=404) is None
+        assert self.policy.get_retry_delay(0, status_code=200) is None
+
+    def test_Retry_After_만큼_기다리고_너무_길면_재시도하지_않는다(self):
+        assert self.policy.get_retry_delay(0, status_code=403, headers={'Retry-After': '30'}) == 30
+        assert self.policy.get_retry_delay(0, status_code=403, headers={'Retry-After': '120'}) is None
+
+    def test_primary_rate_limit_은_재시도하지_않는다(self):
+        headers = {'X-RateLimit-Remaining': '0'}
+        assert self.policy.get_retry_delay(0, status_code=403, headers=headers) is None
+        assert self.policy.get_retry_delay(0, status_code=429, headers=headers) is None
+
+
+class TestSendWithRetry:
+
+    def setup_method(self):
+        retry_stats.reset()
+
+    @mock.patch('adapter.retries.time.sleep')
+    def test_일시적인_오류는_재시도_후_성공한다(self, sleep):
+        send = mock.Mock(side_effect=[response(502), requests.ConnectionError(), response(200)])
+
+        res = send_with_retry('https://api.github.com/repos/jay/opgc/contributors', send)
+
+        assert res.status_code == 200
+        assert send.call_count == 3
+        assert retry_stats.to_dict() == {'api.github.com/repos/*/*/contributors': {'retries': 2, 'failures': 0}}
+
+    @mock.patch('adapter.retries.time.sleep')
+    def test_재시도를_모두_소진하면_실패를_기록한다(self, sleep):
+        send = mock.Mock(return_value=response(503))
+
+        res = send_with_retry('https://github.com/users/jay/contributions', send)
+
+        assert res.status_code == 503
+        assert retry_stats.to_dict()['github.com/users/*/contributions']['failures'] == 1
+
+    def test_endpoint_는_유저명과_레포지토리명을_치환한다(self):
+        assert RetryStats.get_endpoint('https://api.github.com/users/jay/repos?page=2') == 'api.github.com/users/*/repos'
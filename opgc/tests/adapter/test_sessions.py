@@ -0,0 +1,59 @@
+import concurrent.futures
+
+from adapter.sessions import SessionManager, AsyncSessionManager, connection_stats
+
+
+class TestSessionManager:
+
+    def setup_method(self):
+        SessionManager.close()
+        connection_stats.reset()
+
+    def teardown_method(self):
+        SessionManager.close()
+
+    def test_get_session_호출시_프로세스_전역에서_같은_세션을_반환한다(self):
+        assert SessionManager.get_session() is SessionManager.get_session()
+
+    def test_같은_host_로_여러번_요청시_커넥션을_재사용한다(self, local_server):
+        session = SessionManager.get_session()
+        for _ in range(5):
+            session.get(f'{local_server}/users/jay')
+
+        stats = SessionManager.get_connection_stats()
+        assert stats['requests'] == 5
+        assert stats['opened'] == 1
+        assert stats['reused'] == 4
+
+    def test_여러_스레드에서_요청해도_커넥션_풀을_공유한다(self, local_server):
+        session = SessionManager.get_session()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(40):
+                executor.submit(session.get, f'{local_server}/users/jay')
+
+        stats = SessionManager.get_connection_stats()
+        assert stats['requests'] == 40
+        assert stats['opened'] <= 4
+
+
+class TestAsyncSessionManager:
+
+    def test_같은_event_loop_에서는_세션을_재사용한다(self, local_server):
+        async def _inner():
+            session = AsyncSessionManager.get_session()
+            for _ in range(3):
+                async with AsyncSessionManager.get_session().get(f'{local_server}/users/jay') as res:
+                    assert res.status == 200
+
+            return session, AsyncSessionManager.get_session()
+
+        first, second = AsyncSessionManager.run(_inner())
+        assert first is second
+        assert first.closed
+
+    def test_event_loop_가_다르면_별도의_세션을_사용한다(self):
+        async def _inner():
+            return AsyncSessionManager.get_session()
+
+        assert AsyncSessionManager.run(_inner()) is not AsyncSessionManager.run(_inner())
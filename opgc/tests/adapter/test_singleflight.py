@@ -0,0 +1,104 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from adapter.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+
+    def test_동시에_들어온_같은_key_는_한번만_실행된다(self):
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def _func():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return 'result'
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(flight.do, 'key', _func)
+            started.wait()
+            followers = [executor.submit(flight.do, 'key', _func) for _ in range(4)]
+            results = [leader.result()] + [future.result() for future in followers]
+
+        assert results == ['result'] * 5
+        assert len(calls) == 1
+        assert flight.stats.to_dict() == {'executed': 1, 'shared': 4, 'dedup_rate': 0.8}
+
+    def test_실행이_끝나면_다시_실행된다(self):
+        flight = SingleFlight()
+
+        assert flight.do('key', lambda: 1) == 1
+        assert flight.do('key', lambda: 2) == 2
+        assert flight.stats.shared == 0
+
+    def test_예외는_기다리던_호출에도_전달된다(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def _func():
+            started.set()
+            time.sleep(0.2)
+            raise ValueError()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, 'key', _func)
+            started.wait()
+            follower = executor.submit(flight.do, 'key', _func)
+
+            with pytest.raises(ValueError):
+                leader.result()
+            with pytest.raises(ValueError):
+                follower.result()
+
+    def test_BaseException_도_기다리던_호출에_전달된다(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        raised = {}
+
+        class WorkerKilled(BaseException):
+            pass
+
+        def _func():
+            started.set()
+            time.sleep(0.2)
+            raise WorkerKilled()
+
+        def _do(name: str):
+            try:
+                flight.do('key', _func)
+            except WorkerKilled:
+                raised[name] = True
+
+        # 전달되지 않으면 follower 가 계속 기다리므로 daemon 스레드로 실행하고 timeout 까지만 기다린다.
+        leader = threading.Thread(target=_do, args=('leader',), daemon=True)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=_do, args=('follower',), daemon=True)
+        follower.start()
+
+        leader.join(timeout=1)
+        follower.join(timeout=1)
+
+        assert raised == {'leader': True, 'follower': True}
+
+    def test_coroutine_도_같은_key_는_한번만_실행된다(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def _func():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return 'result'
+
+        async def _run():
+            return await asyncio.gather(*[flight.async_do('key', _func) for _ in range(5)])
+
+        assert asyncio.run(_run()) == ['result'] * 5
+        assert len(calls) == 1
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+from adapter.throttles import LocalTokenBucket
+
+
+def create_bucket(**kwargs) -> LocalTokenBucket:
+    options = dict(max_rate=10, min_rate=1, capacity=2, increase_step=1, decrease_factor=0.5)
+    options.update(kwargs)
+    return LocalTokenBucket(**options)
+
+
+class TestLocalTokenBucket:
+
+    def test_capacity_만큼은_바로_가져온다(self):
+        bucket = create_bucket()
+
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() > 0  # token 이 없으면 기다려야 하는 시간을 반환
+
+    def test_token_이_없으면_rate_만큼_기다린다(self):
+        bucket = create_bucket(max_rate=20, capacity=1)
+        bucket.acquire()
+
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    def test_async_acquire(self):
+        bucket = create_bucket(max_rate=20, capacity=1)
+
+        async def _acquire():
+            start = time.monotonic()
+            await asyncio.gather(*[bucket.async_acquire() for _ in range(3)])
+            return time.monotonic() - start
+
+        assert asyncio.run(_acquire()) >= 0.09
+
+    def test_429_응답을_받으면_rate_를_줄인다(self):
+        bucket = create_bucket()
+
+        bucket.report(429)
+        assert bucket.rate == 5
+        bucket.report(429)
+        bucket.report(429)
+        bucket.report(429)
+        assert bucket.rate == 1  # min_rate 보다 줄이지 않는다.
+        assert bucket.throttled_count == 4
+
+    def test_성공하면_max_rate_까지_rate_를_늘린다(self):
+        bucket = create_bucket()
+        bucket.report(429)
+
+        bucket.report(200)
+        assert bucket.rate == 6
+        for _ in range(10):
+            bucket.report(200)
+        assert bucket.rate == 10
@@ -0,0 +1,60 @@
+import time
+from unittest import mock
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from adapter.githubs import GithubAdapter
+from adapter.tokens import TokenPool
+
+
+class TestTokenPool:
+
+    def setup_method(self):
+        self.pool = TokenPool(['token-a', 'token-b', ''])
+        self.token_a, self.token_b = self.pool.tokens
+        self.reset_at = time.time() + 600
+
+    def test_빈_token_은_pool_에_등록하지_않는다(self):
+        assert len(self.pool.tokens) == 2
+
+    def test_남은_호출_횟수가_많은_token_을_사용한다(self):
+        self.token_a.state.update(limit=5000, remaining=100, reset_at=self.reset_at)
+        self.token_b.state.update(limit=5000, remaining=3000, reset_at=self.reset_at)
+
+        assert self.pool.acquire() is self.token_b
+        assert self.pool.get_remaining() == 3100
+
+    def test_rate_limit_에_걸린_token_은_reset_전까지_사용하지_않는다(self):
+        self.token_b.state.update_from_response(403, {
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': str(int(self.reset_at)),
+        })
+
+        assert self.pool.acquire() is self.token_a
+        assert self.pool.is_limited() is False
+
+    def test_모든_token_이_rate_limit_이면_가장_빨리_풀리는_token_을_반환한다(self):
+        self.token_a.state.update(limit=5000, remaining=0, reset_at=self.reset_at + 100)
+        self.token_b.state.update(limit=5000, remaining=0, reset_at=self.reset_at)
+
+        assert self.pool.is_limited() is True
+        assert self.pool.acquire() is self.token_b
+
+    def test_token_별_사용량을_리포트한다(self):
+        self.token_a.increase_usage()
+        self.token_a.increase_usage()
+
+        report = self.pool.get_usage_report()
+        assert report[0]['token'] == '****en-a'
+        assert report[0]['usage'] == 2
+        assert report[1]['usage'] == 0
+
+
+def test_token_이_없으면_요청하지_않고_설정_오류를_낸다():
+    with mock.patch.object(GithubAdapter, 'token_pool', TokenPool([])), \
+            mock.patch('adapter.githubs.SessionManager.get_session') as get_session:
+        with pytest.raises(ImproperlyConfigured):
+            GithubAdapter.is_exists_user('jay')
+
+    get_session.return_value.get.assert_not_called()
@@ -7,3 +7,15 @@
 # def mock_slack_notify_new_user():
 #     with mock.patch('utils.slack.slack_notify_new_user') as patch:
 #         yield patch
+
+import pytest
+
+from core.caches import language_map
+
+
+@pytest.fixture(autouse=True)
+def clear_language_map():
+    # 테스트마다 DB 가 롤백되므로 프로세스 메모리의 Language 매핑도 비운다.
+    language_map.clear()
+    yield
+    language_map.clear()
@@ -0,0 +1,101 @@
+import time
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.githubs.models import Language
+from core.caches import TTLCache, VersionedTTLCache, LanguageMap
+
+
+class TestTTLCache:
+
+    def test_저장한_값을_가져온다(self):
+        cache = TTLCache(timeout=60, max_size=10)
+        cache.set('jay/opgc', {'jay': 10})
+
+        assert cache.get('jay/opgc') == {'jay': 10}
+        assert cache.get('jay/none') is None
+        assert cache.stats.to_dict() == {
+            'hits': 1, 'misses': 1, 'evictions': 0, 'invalidations': 0, 'hit_rate': 0.5
+        }
+
+    def test_유지_시간이_지나면_만료된다(self):
+        cache = TTLCache(timeout=0.05, max_size=10)
+        cache.set('jay/opgc', {'jay': 10})
+        time.sleep(0.1)
+
+        assert cache.get('jay/opgc') is None
+        assert len(cache) == 0
+
+    def test_최대_개수를_넘으면_오래_사용하지_않은_값부터_제거한다(self):
+        cache = TTLCache(timeout=60, max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.stats.evictions == 1
+
+
+class TestVersionedTTLCache:
+
+    def test_버전이_같으면_캐시된_값을_사용한다(self):
+        cache = VersionedTTLCache(timeout=60, max_size=10)
+        cache.set_version('jay/opgc', ('2021-01-01T00:00:00Z', 100), {'python': 10})
+
+        assert cache.get_version('jay/opgc', ('2021-01-01T00:00:00Z', 100)) == {'python': 10}
+
+    def test_버전이_바뀌면_캐시를_버린다(self):
+        cache = VersionedTTLCache(timeout=60, max_size=10)
+        cache.set_version('jay/opgc', ('2021-01-01T00:00:00Z', 100), {'python': 10})
+
+        assert cache.get_version('jay/opgc', ('2021-02-01T00:00:00Z', 120)) is None
+        assert cache.stats.invalidations == 1
+        assert len(cache) == 0
+
+    def test_버전을_알_수_없으면_캐시하지_않는다(self):
+        cache = VersionedTTLCache(timeout=60, max_size=10)
+        cache.set_version('jay/opgc', (None, 100), {'python': 10})
+
+        assert len(cache) == 0
+        assert cache.get_version('jay/opgc', (None, 100)) is None
+
+
+@pytest.mark.django_db
+class TestLanguageMap:
+
+    def test_한번_읽어온_뒤에는_DB_를_조회하지_않는다(self):
+        python = Language.objects.create(type='Python')
+        language_map = LanguageMap(alias='default', version_check_interval=60)
+
+        assert language_map.get_ids(['python', 'PYTHON']) == {'python': python.id}
+
+        with CaptureQueriesContext(connection) as context:
+            assert language_map.get_id('Python') == python.id
+            assert language_map.get_type(python.id) == 'Python'
+
+        assert len(context.captured_queries) == 0
+
+    def test_없는_type_을_찾으면_다시_읽어온다(self):
+        language_map = LanguageMap(alias='default', version_check_interval=60)
+        assert language_map.get_ids(['go']) == {}
+
+        go = Language.objects.create(type='go')
+
+        assert language_map.get_id('go') == go.id
+        assert language_map.stats.misses == 2
+
+    def test_다른_프로세스에서_언어를_추가하면_version_으로_다시_읽어온다(self):
+        language_map = LanguageMap(alias='default', version_check_interval=0)
+        other_process_map = LanguageMap(alias='default', version_check_interval=0)
+        assert language_map.items() == []
+
+        ids = other_process_map.get_or_create_ids(['rust', 'kotlin'])
+
+        assert language_map.items() == sorted(
+            (language_id, language_type) for language_type, language_id in ids.items()
+        )
@@ -1,4 +1,5 @@
 from dataclasses import asdict
+from unittest import mock
 import pytest
 
 from api.exceptions import BlockedUser, NotUserType
@@ -68,3 +69,16 @@ class TestGithubInformationService:
         assert updated_user.following == update_data["following"]
         assert updated_user.company == update_data["company"]
         assert updated_user.status == GithubUser.UPDATING
+
+    @pytest.mark.django_db
+    def test_레포지토리_페이지를_가져오지_못하면_get_user_repository_urls_는_None_을_반환한다(self):
+        github_information_service = GithubInformationService(username=self.username)
+        github_information_service.github_user = GithubUserFactory.create(username=self.username)
+        user_information_dto = UserInformationDTOFactory.create()
+
+        with mock.patch.object(github_information_service.github_adapter, 'get_paginated_infos',
+                               return_value=(None, 404)), \
+                mock.patch('core.services.github_service.manage_api_call_fail') as manage_api_call_fail:
+            assert github_information_service.get_user_repository_urls(user_information_dto) is None
+
+        manage_api_call_fail.assert_called_once_with(github_information_service.github_user, 404)
@@ -10,3 +10,160 @@
 #     org_dto = org_service.create_dto(github_context.org_dummy_data)
 #
 #     assert isinstance(org_dto, OrganizationDto)
+
+import asyncio
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.githubs.models import GithubUser, Organization, UserOrganization
+from core.github_dto import OrganizationDto, RepositoryDto
+from adapter.githubs import GithubAdapter
+from core.services.organization_service import OrganizationService
+from core.services.repository_service import RepositoryService
+from tests.utils.model_factory import GithubUserFactory
+
+
+def create_organization_dtos(names) -> list:
+    return [
+        OrganizationDto(login=name, description=f'{name} description', avatar_url=f'https://{name}.com', repos_url='')
+        for name in names
+    ]
+
+
+def update_or_create_organization(github_user, organization_dtos: list) -> int:
+    organization_service = OrganizationService(github_user)
+
+    with mock.patch.object(OrganizationService, 'get_organizations', return_value=organization_dtos), \
+            mock.patch('core.db.models.invalidate_obj'), \
+            mock.patch('core.db.models.invalidate_model'), \
+            CaptureQueriesContext(connection) as context:
+        organization_service.update_or_create_organization('')
+
+    return len(context.captured_queries)
+
+
+def get_user_organizations(github_user) -> set:
+    return set(UserOrganization.objects.filter(github_user=github_user).values_list('organization__name', flat=True))
+
+
+@pytest.mark.django_db
+def test_소속된_organization_을_동기화한다():
+    github_user = GithubUserFactory.create()
+    kept = Organization.objects.create(name='kept', description='old', logo='')
+    left = Organization.objects.create(name='left', description='', logo='')
+    UserOrganization.objects.bulk_create([
+        UserOrganization(github_user=github_user, organization=kept),
+        UserOrganization(github_user=github_user, organization=left),
+    ])
+
+    update_or_create_organization(github_user, create_organization_dtos(['kept', 'new']))
+
+    assert get_user_organizations(github_user) == {'kept', 'new'}
+    kept.refresh_from_db()
+    assert (kept.description, kept.logo) == ('kept description', 'https://kept.com')
+    assert Organization.objects.filter(name='left').exists()  # 소속만 삭제
+
+
+@pytest.mark.django_db
+def test_organization_수와_상관없이_쿼리_수가_같다():
+    query_counts = []
+
+    for count in (2, 30):
+        github_user = GithubUserFactory.create(username=f'user{count}')
+        update_or_create_organization(github_user, create_organization_dtos([f'old{idx}' for idx in range(count)]))
+        with mock.patch('core.db.models.invalidate_model'):
+            Organization.objects.filter(name__startswith='old').update(description='changed')
+
+        query_counts.append(update_or_create_organization(
+            github_user,
+            create_organization_dtos([f'{prefix}{idx}' for prefix in ('old', 'new') for idx in range(count)])
+        ))
+        assert len(get_user_organizations(github_user)) == count * 2
+
+    assert query_counts[0] == query_counts[1]
+
+
+def test_organization_repository_를_동시에_가져오고_바로_contributor_를_확인한다(settings):
+    settings.GITHUB_ORGANIZATION_CONCURRENCY = 2
+    organization_service = OrganizationService(GithubUser(username='Jay'))
+    organization_service.organizations = create_organization_dtos(['fast', 'slow', 'waiting'])
+    events = []
+
+    async def _get_organization_repositories(self, organization_dto):
+        events.append(f'list {organization_dto.name}')
+        await asyncio.sleep(0.2 if organization_dto.name == 'slow' else 0)
+        return [
+            RepositoryDto(
+                name=f'repo{idx}', full_name=f'{organization_dto.name}/repo{idx}',
+                owner={'login': organization_dto.name}, stargazers_count=0, fork=False, language='', contributors_url='', languages_url=''
+            ) for idx in range(2)
+        ]
+
+    async def _get_contributors(self, repository):
+        events.append(f'check {repository.full_name}')
+        return {'jay': 1} if repository.name == 'repo0' else {'other': 1}
+
+    with mock.patch.object(OrganizationService, 'get_organization_repositories', _get_organization_repositories), \
+            mock.patch('core.services.organization_service.RepositoryService.get_contributors', _get_contributors):
+        asyncio.run(organization_service.get_organization_repository_futures(organization_service.organizations))
+
+    assert sorted(repository.full_name for repository in organization_service.repositories) == [
+        'fast/repo0', 'slow/repo0', 'waiting/repo0'
+    ]
+    # 2개의 organization 을 동시에 가져오다가 fast 가 끝나면 waiting 을 가져오고,
+    # slow 를 기다리지 않고 fast 의 contributor 확인을 시작한다.
+    assert events[:2] == ['list fast', 'list slow']
+    assert events.index('list waiting') < events.index('check slow/repo0')
+    assert events.index('check fast/repo0') < events.index('check slow/repo0')
+
+
+
+def test_organization_repository_목록을_가져오지_못하면_캐시하지_않고_실패로_반환한다():
+    organization_service = OrganizationService(GithubUser(username='jay'))
+
+    async def _async_get_repositories(self, repos_url):
+        return None
+
+    with mock.patch.object(RepositoryService, 'async_get_repositories', _async_get_repositories), \
+            mock.patch('core.services.organization_service.organization_repository_cache') as cache:
+        cache.get.return_value = None
+        result = asyncio.run(organization_service.get_organization_repository_futures(create_organization_dtos(['org'])))
+
+    assert result is False
+    assert organization_service.repositories == []
+    cache.set.assert_not_called()
+
+def test_organization_에서_확인한_contributor_는_repository_업데이트에서_다시_가져오지_않는다():
+    github_user = GithubUser(username='jay')
+    organization_service = OrganizationService(github_user)
+    repository_service = RepositoryService(
+        github_user, contributor_pages=organization_service.repository_service.contributor_pages
+    )
+    repository = RepositoryDto(
+        name='opgc', full_name='org/opgc', owner={'login': 'org'}, stargazers_count=0, fork=False,
+        language='', contributors_url='https://api.github.com/repos/org/opgc/contributors', languages_url='',
+        languages={'python': 10}
+    )
+    contributor_infos = [{'login': 'Jay', 'type': 'User', 'contributions': 7}]
+
+    async def _async_get_contributor_page(contributors_url, page):
+        return contributor_infos, None, 200
+
+    async def _update():
+        await organization_service.get_organization_repository_futures(create_organization_dtos(['org']))
+        await repository_service.update_repository(repository, {})
+
+    with mock.patch.object(GithubAdapter, 'async_get_contributor_page', side_effect=_async_get_contributor_page) \
+            as get_contributor_page, \
+            mock.patch.object(OrganizationService, 'get_organization_repositories', return_value=[repository]), \
+            mock.patch('core.services.repository_service.contributor_cache') as contributor_cache:
+        contributor_cache.get.return_value = None  # 유저간 공유 캐시가 만료된 경우
+        asyncio.run(_update())
+
+    assert organization_service.repositories == [repository]
+    assert [new_repository.contribution for new_repository in repository_service.new_repository_list] == [7]
+    assert repository_service.total_contribution == 7
+    get_contributor_page.assert_awaited_once()
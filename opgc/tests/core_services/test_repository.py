@@ -10,3 +10,250 @@
 #     repo_dto = repo_service.create_dto(github_context.repo_dummy_data)
 #
 #     assert isinstance(repo_dto, RepositoryDto)
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.githubs.models import GithubUser, Repository, Language, UserLanguage
+from core.github_dto import RepositoryDto
+from core.services.repository_service import RepositoryService
+from tests.utils.model_factory import GithubUserFactory
+
+
+def create_repository_dto(name: str, stargazers_count: int = 0) -> RepositoryDto:
+    return RepositoryDto(
+        name=name, full_name=f'jay/{name}', owner={'login': 'jay'}, stargazers_count=stargazers_count,
+        fork=False, language='python', contributors_url='', languages_url='', languages={'python': 10}
+    )
+
+
+@pytest.mark.django_db
+def test_기존_repository_는_업데이트하고_없어진_repository_는_삭제한다():
+    github_user = GithubUserFactory.create()
+    for name in ('kept', 'deleted'):
+        Repository.objects.create(github_user=github_user, name=name, full_name=f'jay/{name}', owner='jay')
+
+    forked = create_repository_dto('forked', stargazers_count=10)
+    forked.fork = True
+
+    repository_service = RepositoryService(github_user)
+    repository_service.repositories = [
+        create_repository_dto('kept', stargazers_count=3), create_repository_dto('new', stargazers_count=1), forked
+    ]
+
+    async def _get_contributors(self, repository):
+        return {'jay': 5} if repository.name == 'kept' else {'jay': 2}
+
+    with mock.patch.object(RepositoryService, 'get_contributors', _get_contributors), \
+            mock.patch('core.db.models.invalidate_obj'):
+        repository_service.update_repositories()
+
+    repositories = {
+        repository.name: (repository.contribution, repository.stargazers_count, repository.languages)
+        for repository in Repository.objects.filter(github_user=github_user)
+    }
+    # 새로운 레포지토리 중 fork 한 레포지토리는 만들지 않는다.
+    assert repositories == {'kept': (5, 3, ''), 'new': (2, 1, '["python"]')}
+    assert repository_service.total_contribution == 7
+    assert repository_service.total_stargazers_count == 4
+
+
+@pytest.mark.django_db
+def test_변경된_repository_는_모아서_bulk_update_한다(settings):
+    settings.GITHUB_REPOSITORY_BATCH_SIZE = 2
+    github_user = GithubUserFactory.create()
+    Repository.objects.bulk_create([
+        Repository(github_user=github_user, name=f'repo{idx}', full_name=f'jay/repo{idx}', owner='jay')
+        for idx in range(5)
+    ])
+
+    repository_service = RepositoryService(github_user)
+    repository_service.repositories = [create_repository_dto(f'repo{idx}', stargazers_count=idx) for idx in range(5)]
+
+    async def _get_contributors(self, repository):
+        return {}
+
+    with mock.patch.object(RepositoryService, 'get_contributors', _get_contributors), \
+            mock.patch.object(Repository, 'save') as save, \
+            mock.patch('core.db.models.invalidate_obj') as invalidate_obj, \
+            mock.patch('core.db.models.invalidate_model') as invalidate_model:
+        repository_service.update_repositories()
+
+    save.assert_not_called()
+    # 여러 row 를 업데이트 하면 다시 조회하지 않고 batch 마다 model 단위로 invalidate 한다.
+    invalidate_obj.assert_not_called()
+    assert invalidate_model.call_args_list == [mock.call(Repository)] * 2
+    assert len(repository_service.changed_repository_list) == 4  # stargazers_count 가 그대로인 repo0 제외
+    assert dict(Repository.objects.values_list('name', 'stargazers_count')) == {
+        f'repo{idx}': idx for idx in range(5)
+    }
+
+
+@pytest.mark.django_db
+def test_contributor_인_repository_만_언어_정보를_가져와서_합산한다():
+    github_user = GithubUserFactory.create()
+    Repository.objects.bulk_create([
+        Repository(github_user=github_user, name=name, full_name=f'jay/{name}', owner='jay')
+        for name in ('contributed', 'not-contributed')
+    ])
+
+    repository_service = RepositoryService(github_user)
+    repository_service.repositories = [
+        RepositoryDto(
+            name=name, full_name=f'{owner}/{name}', owner={'login': owner}, stargazers_count=0, fork=False,
+            language='python', contributors_url='', languages_url=name, pushed_at=None, size=None
+        ) for name, owner in (('contributed', 'jay'), ('not-contributed', 'jay'), ('new-contributed', 'org'),
+                              ('new-not-contributed', 'org'))
+    ]
+    contributors = {
+        'contributed': {'jay': 3}, 'not-contributed': {'other': 1},
+        'new-contributed': {'jay': 3}, 'new-not-contributed': {'other': 1},
+    }
+    languages_urls = []
+
+    async def _get_contributors(self, repository):
+        return contributors[repository.name]
+
+    async def _async_get_languages(languages_url, params=None):
+        languages_urls.append(languages_url)
+        return {'python': 100, 'go': 10}, 200
+
+    async def _update():
+        await repository_service.get_update_repository_futures(
+            repository_service.repositories,
+            repository_service.create_repository_index(Repository.objects.filter(github_user=github_user))
+        )
+
+    with mock.patch.object(RepositoryService, 'get_contributors', _get_contributors), \
+            mock.patch.object(RepositoryService.github_adapter, 'async_get_languages', _async_get_languages):
+        asyncio.run(_update())
+
+    assert sorted(languages_urls) == ['contributed', 'new-contributed']
+    assert repository_service.update_languages == {'python': 200, 'go': 20}
+    assert repository_service.total_contribution == 6
+    assert [repository.full_name for repository in repository_service.new_repository_list] == ['org/new-contributed']
+
+
+
+def test_contributor_를_가져오지_못하면_manage_api_call_fail_로_처리한다():
+    repository_service = RepositoryService(GithubUser(username='jay'))
+
+    async def _async_get_contributor_page(contributors_url, page):
+        return None, None, 502
+
+    with mock.patch.object(RepositoryService.github_adapter, 'async_get_contributor_page',
+                           side_effect=_async_get_contributor_page), \
+            mock.patch('core.services.repository_service.contributor_cache') as contributor_cache, \
+            mock.patch('core.services.repository_service.manage_api_call_fail') as manage_api_call_fail:
+        contributor_cache.get.return_value = None
+        assert asyncio.run(repository_service.get_contributors(create_repository_dto('opgc'))) is None
+
+    manage_api_call_fail.assert_called_once_with(repository_service.github_user, 502)
+
+class TestGetContributors:
+
+    @staticmethod
+    def create_contributor_pages(pages: int) -> dict:
+        return {
+            page: (
+                [{'login': f'user{page}-{idx}', 'type': 'User', 'contributions': idx + 1} for idx in range(100)],
+                page + 1 if page < pages else None,
+                200
+            ) for page in range(1, pages + 1)
+        }
+
+    @staticmethod
+    def get_contributors(repository_service: RepositoryService, contributor_pages: dict):
+        async def _async_get_contributor_page(contributors_url, page):
+            return contributor_pages[page]
+
+        with mock.patch.object(RepositoryService.github_adapter, 'async_get_contributor_page',
+                               side_effect=_async_get_contributor_page) as get_contributor_page, \
+                mock.patch('core.services.repository_service.contributor_cache') as contributor_cache:
+            contributor_cache.get.return_value = None
+
+            for _ in range(2):
+                # 같은 업데이트 중에는 이미 가져온 페이지를 다시 가져오지 않는다.
+                contributors = asyncio.run(repository_service.get_contributors(create_repository_dto('opgc')))
+
+        return contributors, get_contributor_page, contributor_cache
+
+    def test_유저를_찾으면_다음_페이지는_가져오지_않는다(self):
+        repository_service = RepositoryService(GithubUser(username='User2-4'))
+        contributors, get_contributor_page, contributor_cache = self.get_contributors(
+            repository_service, self.create_contributor_pages(pages=5)
+        )
+
+        assert contributors['user2-4'] == 5
+        assert [call.kwargs['page'] for call in get_contributor_page.await_args_list] == [1, 2]
+        contributor_cache.set.assert_not_called()  # 일부만 가져온 목록은 공유하지 않는다.
+
+    def test_끝까지_없으면_contributor_목록을_캐시한다(self):
+        repository_service = RepositoryService(GithubUser(username='jay'))
+        contributors, get_contributor_page, contributor_cache = self.get_contributors(
+            repository_service, self.create_contributor_pages(pages=2)
+        )
+
+        assert 'jay' not in contributors
+        assert get_contributor_page.await_count == 2
+        full_name, cached_contributors = contributor_cache.set.call_args.args
+        assert full_name == 'jay/opgc' and len(cached_contributors) == 200
+
+
+class TestUpdateOrCreateLanguage:
+
+    @staticmethod
+    def update_languages(github_user: GithubUser, update_languages: dict) -> int:
+        repository_service = RepositoryService(github_user)
+        repository_service.update_languages = dict(update_languages)
+
+        with CaptureQueriesContext(connection) as context, mock.patch('core.db.models.invalidate_obj'), \
+                mock.patch('core.db.models.invalidate_model'):
+            repository_service.update_or_create_language()
+
+        return len(context.captured_queries)
+
+    @staticmethod
+    def get_user_languages(github_user: GithubUser) -> dict:
+        return dict(
+            UserLanguage.objects.filter(github_user=github_user).values_list('language__type', 'number')
+        )
+
+    @pytest.mark.django_db
+    def test_언어를_생성_변경_삭제한다(self):
+        github_user = GithubUserFactory.create()
+        python, go, java = [Language.objects.create(type=t) for t in ('Python', 'go', 'java')]
+        UserLanguage.objects.bulk_create([
+            UserLanguage(github_user=github_user, language=python, number=10),
+            UserLanguage(github_user=github_user, language=python, number=10),  # 중복 생성된 UserLanguage
+            UserLanguage(github_user=github_user, language=go, number=20),
+            UserLanguage(github_user=github_user, language=java, number=30),
+        ])
+
+        self.update_languages(github_user, {'python': 15, 'go': 20, 'rust': 5})
+
+        assert self.get_user_languages(github_user) == {'Python': 15, 'go': 20, 'rust': 5}
+        assert UserLanguage.objects.filter(github_user=github_user).count() == 3
+        assert Language.objects.filter(type__iexact='python').count() == 1  # 대문자로 저장된 언어는 다시 만들지 않는다.
+
+    @pytest.mark.django_db
+    def test_언어_수와_상관없이_쿼리_수가_같다(self):
+        query_counts = []
+
+        for language_count in (5, 80):
+            github_user = GithubUserFactory.create(username=f'user{language_count}')
+            self.update_languages(github_user, {f'language{idx}': idx for idx in range(language_count)})
+            query_counts.append(
+                self.update_languages(github_user, {f'language{idx}': idx + 1 for idx in range(language_count)})
+            )
+
+            assert self.get_user_languages(github_user) == {
+                f'language{idx}': idx + 1 for idx in range(language_count)
+            }
+
+        assert query_counts[0] == query_counts[1]
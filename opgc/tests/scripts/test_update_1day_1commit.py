@@ -0,0 +1,49 @@
+from unittest import mock
+
+import pytest
+
+from adapter.sessions import AsyncSessionManager
+from apps.githubs.models import GithubUser, ContributionCalendar
+from core.services.contribution_calendar_service import ContributionCalendarService
+from scripts.update_1day_1commit import ContinuousCommitDayCrawler
+from utils.github import get_yesterday
+
+
+@pytest.mark.django_db(transaction=True)
+def test_모든_유저를_크롤링해서_배치로_저장한다():
+    GithubUser.objects.bulk_create([
+        GithubUser(
+            username=f'user{idx}', total_contribution=10, followers=1, following=1,
+            continuous_commit_checked_date=get_yesterday() if idx == 0 else None  # 오늘 이미 업데이트 된 유저
+        ) for idx in range(7)
+    ])
+
+    async def _update_continuous_commit_day(github_user: GithubUser, calendar_days: dict) -> bool:
+        calendar_days[get_yesterday()] = (1, int(github_user.username[4:]))
+        github_user.continuous_commit_day = int(github_user.username[4:])
+        github_user.continuous_commit_end_date = get_yesterday()
+        github_user.continuous_commit_checked_date = get_yesterday()
+        return github_user.username != 'user6'
+
+    async def _is_exists_github_users(username: str) -> bool:
+        return username != 'user5'
+
+    crawler = ContinuousCommitDayCrawler(concurrency=3, user_chunk_size=2, update_batch_size=2)
+
+    with mock.patch('scripts.update_1day_1commit.async_update_continuous_commit_day', _update_continuous_commit_day), \
+            mock.patch('scripts.update_1day_1commit.async_is_exists_github_users', _is_exists_github_users), \
+            mock.patch('core.db.models.invalidate_obj'), \
+            mock.patch('core.db.models.invalidate_model'):
+        AsyncSessionManager.run(crawler.run())
+
+    assert crawler.update_count == 4
+    assert crawler.fail_count == 1
+    assert dict(GithubUser.objects.values_list('username', 'continuous_commit_day')) == {
+        'user0': 0, 'user1': 1, 'user2': 2, 'user3': 3, 'user4': 4, 'user5': 0, 'user6': 0
+    }
+    assert GithubUser.objects.get(username='user4').total_score > 0
+    assert GithubUser.objects.get(username='user4').continuous_commit_end_date == get_yesterday()
+    assert ContributionCalendar.objects.count() == 4
+    assert ContributionCalendarService.get_statistics(
+        GithubUser.objects.get(username='user4').id, until=get_yesterday()
+    ).total_contributions == 4
@@ -0,0 +1,78 @@
+from datetime import date
+
+from utils.contribution_calendar import (
+    parse_commit_dates, parse_calendar_days, pack_calendar, get_contribution_statistics
+)
+
+
+class TestParseCommitDates:
+
+    def test_커밋이_있는_날짜만_가져온다(self):
+        content = b'<td data-date="2023-01-01" id="day-0" data-level="0"></td>' \
+                  b'<td data-date="2023-01-02" id="day-1" data-level="2"></td>' \
+                  b'<td class="ContributionCalendar-label"></td>' \
+                  b'<td data-date="2023-01-03" id="day-2" data-level="4"></td>'
+
+        assert parse_commit_dates(content, date(2023, 1, 1), date(2023, 12, 31)) == {
+            date(2023, 1, 2), date(2023, 1, 3)
+        }
+
+    def test_기간_밖의_날짜는_제외한다(self):
+        content = b'<td data-date="2022-12-31" data-level="1"></td>' \
+                  b'<td data-date="2023-01-01" data-level="1"></td>' \
+                  b'<td data-date="2023-01-02" data-level="1"></td>'
+
+        assert parse_commit_dates(content, date(2023, 1, 1), date(2023, 1, 1)) == {date(2023, 1, 1)}
+
+    def test_속성_순서가_달라도_가져온다(self):
+        content = b'<rect data-level="3" data-count="5" data-date="2021-03-01"></rect>'
+
+        assert parse_commit_dates(content, date(2021, 1, 1), date(2021, 12, 31)) == {date(2021, 3, 1)}
+
+
+class TestParseCalendarDays:
+
+    def test_tool_tip_에서_contribution_수를_가져온다(self):
+        content = b'<td data-date="2023-01-01" id="day-0" data-level="0"></td>' \
+                  b'<td data-date="2023-01-02" id="day-1" data-level="2"></td>' \
+                  b'<tool-tip for="day-0" class="sr-only">No contributions on January 1st.</tool-tip>' \
+                  b'<tool-tip for="day-1" class="sr-only">1,024 contributions on January 2nd.</tool-tip>'
+
+        assert parse_calendar_days(content, date(2023, 1, 1), date(2023, 12, 31)) == {
+            date(2023, 1, 1): (0, 0), date(2023, 1, 2): (2, 1024)
+        }
+
+    def test_data_count_에서_contribution_수를_가져온다(self):
+        content = b'<rect class="ContributionCalendar-day" data-count="5" data-date="2021-03-01" data-level="3"></rect>'
+
+        assert parse_calendar_days(content, date(2021, 1, 1), date(2021, 12, 31)) == {date(2021, 3, 1): (3, 5)}
+
+
+class TestContributionStatistics:
+
+    def test_packing_한_calendar_로_통계를_계산한다(self):
+        # 2022-12-30 ~ 2023-01-02 연속 4일, 2023-01-05 ~ 2023-01-06 연속 2일
+        calendar_2022 = pack_calendar({date(2022, 12, 30): (1, 3), date(2022, 12, 31): (2, 5)})
+        calendar_2023 = pack_calendar({
+            date(2023, 1, 1): (1, 1), date(2023, 1, 2): (4, 20), date(2023, 1, 5): (1, 1), date(2023, 1, 6): (1, 2)
+        })
+
+        statistics = get_contribution_statistics(
+            [(2023, *calendar_2023), (2022, *calendar_2022)], until=date(2023, 1, 8)
+        )
+
+        assert statistics.current_streak == 2
+        assert statistics.longest_streak == 4
+        assert statistics.active_days == 6
+        assert statistics.total_contributions == 32
+        assert statistics.weekly_contributions[-2:] == [9, 23]  # 12/26 ~ 1/1, 1/2 ~ 1/8
+        assert statistics.active_weeks == 2
+
+    def test_이미_저장된_calendar_에_덮어쓴다(self):
+        levels, counts = pack_calendar({date(2023, 1, 1): (1, 1)})
+        levels, counts = pack_calendar({date(2023, 1, 2): (2, 7)}, levels, counts)
+
+        statistics = get_contribution_statistics([(2023, levels, counts)], until=date(2023, 1, 2))
+
+        assert statistics.current_streak == 2
+        assert statistics.total_contributions == 8
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+from apps.githubs.models import GithubUser
+from utils.github import update_continuous_commit_day, CommitStreak
+
+
+def make_calendar(commit_dates: list, since, until) -> mock.Mock:
+    cells = []
+    current = since
+    while current <= until:
+        level = 1 if current in commit_dates else 0
+        cells.append(f'<td class="ContributionCalendar-day" data-date="{current.isoformat()}" data-level="{level}"></td>')
+        current += timedelta(days=1)
+    return mock.Mock(content=f'<table><tbody><tr>{"".join(cells)}</tr></tbody></table>'.encode())
+
+
+class TestUpdateContinuousCommitDay:
+    now = (datetime.now() - timedelta(days=1)).date()
+
+    def get_github_user(self, count: int, end_days_ago: int, checked_days_ago: int) -> GithubUser:
+        return GithubUser(
+            username='jay',
+            continuous_commit_day=count,
+            continuous_commit_end_date=self.now - timedelta(days=end_days_ago),
+            continuous_commit_checked_date=self.now - timedelta(days=checked_days_ago),
+        )
+
+    def test_이전_결과에서_이어서_계산한다(self):
+        github_user = self.get_github_user(count=10, end_days_ago=3, checked_days_ago=3)
+        commit_dates = [self.now - timedelta(days=days) for days in range(4)]
+
+        with mock.patch('utils.github.get_contributions_between') as get_contributions, \
+                mock.patch('utils.github.get_full_commit_streak') as get_full_commit_streak:
+            get_contributions.return_value = make_calendar(commit_dates, self.now - timedelta(days=3), self.now)
+
+            assert update_continuous_commit_day(github_user) is True
+
+        assert get_contributions.call_count == 1
+        get_full_commit_streak.assert_not_called()
+        assert github_user.continuous_commit_day == 13
+        assert github_user.continuous_commit_end_date == self.now
+        assert github_user.continuous_commit_checked_date == self.now
+
+    def test_중간에_끊기면_새로_시작한다(self):
+        github_user = self.get_github_user(count=10, end_days_ago=5, checked_days_ago=5)
+        commit_dates = [self.now - timedelta(days=days) for days in (5, 2, 1)]
+
+        with mock.patch('utils.github.get_contributions_between') as get_contributions:
+            get_contributions.return_value = make_calendar(commit_dates, self.now - timedelta(days=5), self.now)
+
+            assert update_continuous_commit_day(github_user) is True
+
+        assert github_user.continuous_commit_day == 2
+        assert github_user.continuous_commit_end_date == self.now - timedelta(days=1)
+
+    def test_마지막_커밋_날짜가_맞지_않으면_전체를_다시_계산한다(self):
+        github_user = self.get_github_user(count=10, end_days_ago=3, checked_days_ago=3)
+        full_streak = CommitStreak(count=1, end_date=self.now, checked_date=self.now)
+
+        with mock.patch('utils.github.get_contributions_between') as get_contributions, \
+                mock.patch('utils.github.get_full_commit_streak', return_value=(True, full_streak)) as get_full:
+            get_contributions.return_value = make_calendar([self.now], self.now - timedelta(days=3), self.now)
+
+            assert update_continuous_commit_day(github_user) is True
+
+        get_full.assert_called_once_with('jay')
+        assert github_user.continuous_commit_day == 1
+
+    def test_이전_결과가_없으면_전체를_계산한다(self):
+        github_user = GithubUser(username='jay', continuous_commit_day=0)
+        full_streak = CommitStreak(count=7, end_date=self.now, checked_date=self.now)
+
+        with mock.patch('utils.github.get_contributions_between') as get_contributions, \
+                mock.patch('utils.github.get_full_commit_streak', return_value=(True, full_streak)):
+            assert update_continuous_commit_day(github_user) is True
+
+        get_contributions.assert_not_called()
+        assert github_user.continuous_commit_day == 7
@@ -0,0 +1,158 @@
+import re
+import sys
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from typing import Set, Iterator, Tuple, Dict, List
+
+# contribution calendar 의 날짜 칸 (td, 예전 마크업은 rect)에서 data-date, data-level 을 가져온다.
+# ex) <td data-date="2023-01-01" id="contribution-day-component-0-0" data-level="1" ...></td>
+CALENDAR_DAY_REGEX = re.compile(
+    rb'data-date="(\d{4}-\d{2}-\d{2})"[^>]*?data-level="([0-4])"'
+    rb'|data-level="([0-4])"[^>]*?data-date="(\d{4}-\d{2}-\d{2})"'
+)
+
+
+def iter_calendar_days(content: bytes) -> Iterator[Tuple[bytes, bytes]]:
+    """
+    HTML 트리를 만들지 않고 응답 본문에서 바로 (날짜, level) 를 순서대로 가져온다. (날짜는 ISO 형식 bytes)
+    """
+    for match in CALENDAR_DAY_REGEX.finditer(content):
+        commit_date, level, reversed_level, reversed_date = match.groups()
+        if commit_date is None:
+            commit_date, level = reversed_date, reversed_level
+        yield commit_date, level
+
+
+def parse_commit_dates(content: bytes, since: date, until: date) -> Set[date]:
+    """
+    기간내(since ~ until) 커밋이 있는(level 이 0 이 아닌) 날짜
+    : 날짜는 ISO 문자열 그대로 비교하고, 커밋이 있는 날짜만 date 로 변환한다.
+    """
+    since, until = since.isoformat().encode(), until.isoformat().encode()
+    return {
+        date.fromisoformat(commit_date.decode())
+        for commit_date, level in iter_calendar_days(content)
+        if level != b'0' and since <= commit_date <= until
+    }
+
+
+# 날짜별 contribution 수를 가져오기 위한 정규식
+# - td 마크업: 날짜 칸의 id 와 연결된 tool-tip 에 contribution 수가 있다. (ex. 3 contributions on January 1st.)
+# - rect 마크업(예전): data-count 속성에 있다.
+CALENDAR_DAY_TAG_REGEX = re.compile(rb'<(?:td|rect)\b[^>]*?\bdata-date="[^"]+"[^>]*>')
+CALENDAR_DAY_ATTRIBUTE_REGEX = re.compile(rb'\b(data-date|data-level|data-count|id)="([^"]*)"')
+CALENDAR_TOOLTIP_REGEX = re.compile(rb'<tool-tip\b[^>]*?\bfor="([^"]+)"[^>]*>\s*(No|[\d,]+) contribution')
+
+DAYS_PER_YEAR = 366  # 윤년 기준으로 packing (윤년이 아니면 마지막 칸은 사용하지 않음)
+ACTIVE_DAY_TABLE = bytes.maketrans(bytes(range(5)), b'01111')  # level -> 커밋 여부(b'0', b'1')
+
+
+@dataclass
+class ContributionStatistics:
+    current_streak: int  # 지속중인 1일 1커밋 (마지막으로 커밋한 날까지)
+    longest_streak: int  # 가장 길게 지속한 1일 1커밋
+    active_days: int  # 커밋한 날짜 수
+    total_contributions: int  # 전체 contribution 수
+    weekly_contributions: List[int]  # 최근 주(7일) 단위 contribution 수 (오래된 주부터)
+    active_weeks: int  # 커밋한 날이 있는 주의 수 (weekly_contributions 기준)
+
+
+def parse_calendar_days(content: bytes, since: date, until: date) -> Dict[date, Tuple[int, int]]:
+    """
+    기간내(since ~ until) 날짜별 (level, contribution 수)
+    """
+    since, until = since.isoformat().encode(), until.isoformat().encode()
+    tooltip_counts = dict(CALENDAR_TOOLTIP_REGEX.findall(content))
+    days = {}
+
+    for tag in CALENDAR_DAY_TAG_REGEX.finditer(content):
+        attributes = dict(CALENDAR_DAY_ATTRIBUTE_REGEX.findall(tag.group()))
+        day = attributes[b'data-date']
+
+        if not since <= day <= until:
+            continue
+
+        count = attributes.get(b'data-count') or tooltip_counts.get(attributes.get(b'id'), b'No')
+        days[date.fromisoformat(day.decode())] = (
+            int(attributes.get(b'data-level') or 0),
+            0 if count == b'No' else int(count.replace(b',', b''))
+        )
+
+    return days
+
+
+def get_day_index(day: date) -> int:
+    return day.timetuple().tm_yday - 1
+
+
+def pack_calendar(days: Dict[date, Tuple[int, int]], levels: bytes = b'', counts: bytes = b'') -> (bytes, bytes):
+    """
+    한 해의 날짜별 (level, contribution 수)를 이미 저장된 calendar(levels, counts) 에 덮어써서 packing
+    - levels : 날짜당 1 byte
+    - counts : 날짜당 uint16 (little endian, 65535 이상은 65535)
+    """
+    packed_levels = bytearray(levels or bytes(DAYS_PER_YEAR))
+    packed_counts = unpack_counts(counts)
+
+    for day, (level, count) in days.items():
+        index = get_day_index(day)
+        packed_levels[index] = level
+        packed_counts[index] = min(count, 0xFFFF)
+
+    if sys.byteorder == 'big':
+        packed_counts.byteswap()
+
+    return bytes(packed_levels), packed_counts.tobytes()
+
+
+def unpack_counts(counts: bytes) -> array:
+    unpacked = array('H')
+
+    if not counts:
+        unpacked.frombytes(bytes(DAYS_PER_YEAR * 2))
+        return unpacked
+
+    unpacked.frombytes(counts)
+    if sys.byteorder == 'big':
+        unpacked.byteswap()
+
+    return unpacked
+
+
+def get_contribution_statistics(calendars: List[Tuple[int, bytes, bytes]], until: date,
+                                weeks: int = 52) -> ContributionStatistics:
+    """
+    년도별 calendar (year, levels, counts) 로 통계를 계산
+    : 년도별 배열을 날짜 순서대로 이어 붙인 뒤 bytes 연산(translate, split, count)으로 한번에 계산한다.
+      저장되지 않은 년도/날짜는 커밋이 없는 날로 본다.
+    """
+    calendars = sorted(calendar for calendar in calendars if calendar[0] <= until.year)
+    levels = bytearray()
+    counts = array('H')
+
+    for year, year_levels, year_counts in calendars:
+        if levels:
+            # 중간에 저장되지 않은 년도는 커밋이 없는 날로 채운다.
+            missing_days = (date(year, 1, 1) - date(calendars[0][0], 1, 1)).days - len(levels)
+            levels += bytes(missing_days)
+            counts.extend(array('H', bytes(missing_days * 2)))
+
+        days = get_day_index(until) + 1 if year == until.year else get_day_index(date(year, 12, 31)) + 1
+        levels += year_levels[:days]
+        counts.extend(unpack_counts(year_counts)[:days])
+
+    activity = bytes(levels).translate(ACTIVE_DAY_TABLE)
+    streak_activity = activity.rstrip(b'0')
+
+    # until 부터 거꾸로 7일씩 나눈 최근 weeks 주
+    weekly_contributions = [sum(counts[max(end - 7, 0):end]) for end in range(len(counts), 0, -7)][:weeks][::-1]
+
+    return ContributionStatistics(
+        current_streak=len(streak_activity) - (streak_activity.rfind(b'0') + 1),
+        longest_streak=max(map(len, activity.split(b'0')), default=0),
+        active_days=activity.count(b'1'),
+        total_contributions=sum(counts),
+        weekly_contributions=weekly_contributions,
+        active_weeks=sum(1 for count in weekly_contributions if count > 0),
+    )
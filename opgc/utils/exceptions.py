@@ -4,6 +4,7 @@ from typing import Optional
 
 from rest_framework import status
 
+from adapter.tokens import token_pool
 from apps.githubs.models import GithubUser
 from apps.reservations.models import UpdateUserQueue
 
@@ -11,6 +12,7 @@ from apps.reservations.models import UpdateUserQueue
 # 204: 컨텐츠 제공안함
 # 451: 저작권
 PASSING_RESPONSE_STATUS = [status.HTTP_204_NO_CONTENT, status.HTTP_405_METHOD_NOT_ALLOWED]
+RATE_LIMIT_RESPONSE_STATUS = [status.HTTP_403_FORBIDDEN, status.HTTP_429_TOO_MANY_REQUESTS]
 REASON_RATE_LIMIT = 'rate limit exceeded'
 REASON_FORBIDDEN = 'Forbidden'
 PASSING_STATUS = 'pass'
@@ -35,7 +37,14 @@ def manage_api_call_fail(
     if not github_user:
         return None
 
-    if status_code == status.HTTP_403_FORBIDDEN and reason == REASON_RATE_LIMIT:
+    if reason is None and status_code in RATE_LIMIT_RESPONSE_STATUS:
+        # 응답 헤더로 추적한 token 들의 rate limit 상태로 rate limit 인지, 권한 문제(Too many contributor 등)인지 구분
+        if token_pool.is_limited() or status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+            reason = REASON_RATE_LIMIT
+        else:
+            reason = REASON_FORBIDDEN
+
+    if status_code in RATE_LIMIT_RESPONSE_STATUS and reason == REASON_RATE_LIMIT:
         raise RateLimit()
     elif status_code == status.HTTP_403_FORBIDDEN and reason == REASON_FORBIDDEN:
         return REASON_FORBIDDEN
@@ -1,87 +1,316 @@
-import time
-from datetime import datetime, timedelta
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta, date
+from typing import Optional, Set, Dict, Tuple
 
-import requests
-from bs4 import BeautifulSoup
-from django.conf import settings
 from requests import Response
 from sentry_sdk import capture_exception
 
+from adapter.githubs import GithubAdapter
+from adapter.retries import send_with_retry, async_send_with_retry
+from adapter.sessions import SessionManager, AsyncSessionManager
+from adapter.throttles import scraping_throttle
+from apps.githubs.models import GithubUser
+from utils.contribution_calendar import parse_commit_dates, parse_calendar_days
+
+
+GITHUB_OPEN_YEAR = 2008  # 깃허브 오픈 년도
+# 1일 1커밋 정보를 업데이트 할때 같이 저장해야 하는 필드
+CONTINUOUS_COMMIT_FIELDS = ['continuous_commit_day', 'continuous_commit_end_date', 'continuous_commit_checked_date']
+
+
+@dataclass
+class CommitStreak:
+    count: int  # 1일 1커밋 지속 날짜 카운트
+    end_date: Optional[date]  # 지속중인 1일 1커밋의 마지막 커밋 날짜
+    checked_date: date  # 어느 날짜까지 체크했는지
+
+
+class CommitStreakCounter:
+    """
+    최근 년도부터 거슬러 올라가며 년도별 커밋 날짜를 넣어서 1일 1커밋 지속 날짜를 센다.
+    """
+
+    def __init__(self, now: date):
+        self.now = now
+        self.count = 0
+        self.end_date = None
+        self.next_date = None
+
+    def years(self) -> range:
+        return range(self.now.year, GITHUB_OPEN_YEAR - 1, -1)
+
+    def add(self, commit_dates: Set[date]) -> bool:
+        """
+        한 해의 커밋 날짜를 세고, 1일 1커밋이 중단 됐는지 반환
+        """
+        for current_date in sorted(commit_dates, reverse=True):
+            if self.next_date and (self.next_date - current_date).days > 1:  # 날짜가 중간에 끊기면 중단으로 간주
+                return True
+
+            self.count += 1
+            self.end_date = self.end_date or current_date
+            self.next_date = current_date
+
+        return False
+
+    def to_streak(self) -> CommitStreak:
+        return CommitStreak(count=self.count, end_date=self.end_date, checked_date=self.now)
+
+
+def get_commit_dates(content: bytes, since: date, until: date,
+                     calendar_days: Optional[Dict[date, Tuple[int, int]]] = None) -> Set[date]:
+    """
+    기간내 커밋이 있는 날짜 (calendar_days 가 있으면 날짜별 level, contribution 수도 같이 모은다)
+    """
+    if calendar_days is None:
+        return parse_commit_dates(content, since, until)
+
+    days = parse_calendar_days(content, since, until)
+    calendar_days.update(days)
+    return {day for day, (level, _) in days.items() if level > 0}
+
+
+def get_yesterday() -> date:
+    return (datetime.now() - timedelta(days=1)).date()  # 업데이트 당일 전날부터 체크
+
+
+def get_contributions_url(username: str, year: Optional[int] = None, from_date: Optional[date] = None,
+                          to_date: Optional[date] = None) -> str:
+    if year:
+        return f'https://github.com/users/{username}/contributions?to={year}-12-31'
+    return f'https://github.com/users/{username}/contributions?from={from_date.isoformat()}&to={to_date.isoformat()}'
+
+
+def get_contributions(url: str) -> Optional[Response]:
+    """
+    contribution calendar 를 가져온다. (github.com 크롤링은 모두 scraping_throttle 로 요청 속도를 제한)
+    """
+    def _send() -> Response:
+        scraping_throttle.acquire()
+        res = SessionManager.get_session().get(url)
+        scraping_throttle.report(res.status_code)
+        return res
+
+    return send_with_retry(url, _send)
+
 
 def retry_handle(username, year) -> Optional[Response]:
-    # todo: 공통 util 로 분리
-    retry_cnt = 0
-    res = None
+    return get_contributions(get_contributions_url(username, year=year))
 
-    while retry_cnt < 5:
-        res = requests.get(f'https://github.com/users/{username}/contributions?to={year}-12-31')
 
-        if res.status_code != 200:
-            time.sleep(1)
-            retry_cnt += 1
-            continue
+def get_contributions_between(username: str, from_date: date, to_date: date) -> Optional[Response]:
+    """
+    기간(최대 1년) 동안의 contribution calendar 를 가져온다.
+    """
+    return get_contributions(get_contributions_url(username, from_date=from_date, to_date=to_date))
+
 
-        break
+async def async_get_contributions(url: str) -> Optional[bytes]:
+    """
+    contribution calendar 를 aiohttp 로 가져온다. (실패한 경우 None)
+    """
+    async def _send() -> tuple:
+        await scraping_throttle.async_acquire()
+        async with AsyncSessionManager.get_session().get(url) as res:
+            content = await res.read()
+        scraping_throttle.report(res.status)
+        return res, content
 
-    if retry_cnt >= 5:
-        capture_exception(Exception(f'Requests Retry Limit'))
+    try:
+        res, content = await async_send_with_retry(url, _send)
+    except Exception as e:
+        capture_exception(e)
+        return None
 
-    return res
+    return content if res.status == 200 else None
 
 
-def get_continuous_commit_day(username: str) -> (bool, int):
+def get_full_commit_streak(username: str) -> (bool, CommitStreak):
     """
-    1일 1커밋을 얼마나 지속했는지 day count 하는 함수
+    올해부터 깃허브 오픈 년도까지 거슬러 올라가며 1일 1커밋 지속 날짜를 계산
     """
-    now = datetime.now() - timedelta(days=1)  # 업데이트 당일 전날부터 체크
-    continuous_count = 0
-    is_commit_aborted = False  # 1일 1커밋이 중단 됐는지
-    is_completed = True  # 크롤링이 정상적으로 완료 되었는지
+    counter = CommitStreakCounter(get_yesterday())
 
-    for year in range(now.year, 2007, -1):  # 2007년에 깃허브 오픈
-        time.sleep(0.1)  # 429 에러 때문에 약간의 sleep 을 준다.
+    for year in counter.years():
         res = retry_handle(username, year)
 
         if not res:
-            is_completed = False
+            return False, counter.to_streak()
+
+        if counter.add(get_commit_dates(res.content, date(year, 1, 1), counter.now)):
+            break
+
+    return True, counter.to_streak()
+
+
+async def async_get_full_commit_streak(username: str, calendar_days: Optional[dict] = None) -> (bool, CommitStreak):
+    """
+    get_full_commit_streak 의 async 버전
+    - calendar_days : 가져온 calendar 의 날짜별 (level, contribution 수)를 모을 dict
+    """
+    counter = CommitStreakCounter(get_yesterday())
+
+    for year in counter.years():
+        content = await async_get_contributions(get_contributions_url(username, year=year))
+
+        if content is None:
+            return False, counter.to_streak()
+
+        if counter.add(get_commit_dates(content, date(year, 1, 1), counter.now, calendar_days)):
+            break
+
+    return True, counter.to_streak()
+
+
+def extend_commit_streak(previous: CommitStreak, commit_dates: Set[date], now: date) -> Optional[CommitStreak]:
+    """
+    이전에 계산한 1일 1커밋(previous)의 마지막 커밋 날짜 이후의 커밋 날짜로 이어가거나 새로 시작한다.
+    이전 결과와 calendar 가 맞지 않으면 None 을 반환 (전체를 다시 계산해야함)
+    """
+    # 마지막 커밋 날짜에 커밋이 없다면 이전 결과를 믿을 수 없다. (커밋 삭제, 레포지토리 비공개 등)
+    if previous.end_date not in commit_dates:
+        return None
+
+    end_date = max(commit_dates)
+    current_date = end_date
+    continuous_count = 0
+
+    while current_date in commit_dates:
+        if current_date == previous.end_date:
+            # 이전 1일 1커밋과 이어지는 경우
+            continuous_count += previous.count
             break
 
-        soup = BeautifulSoup(res.text, "lxml")  # html.parse 보다 lxml이 더 빠르다고 한다
+        continuous_count += 1
+        current_date -= timedelta(days=1)
+
+    return CommitStreak(count=continuous_count, end_date=end_date, checked_date=now)
+
+
+def get_incremental_commit_streak(username: str, previous: CommitStreak) -> (bool, Optional[CommitStreak]):
+    """
+    이전에 계산한 1일 1커밋의 마지막 커밋 날짜부터 어제까지의 calendar 만 가져와서 계산
+    """
+    now = get_yesterday()
+    res = get_contributions_between(username, previous.end_date, now)
+
+    if not res:
+        return False, None
+
+    return True, extend_commit_streak(previous, parse_commit_dates(res.content, previous.end_date, now), now)
+
+
+async def async_get_incremental_commit_streak(
+    username: str,
+    previous: CommitStreak,
+    calendar_days: Optional[dict] = None
+) -> (bool, Optional[CommitStreak]):
+    """
+    get_incremental_commit_streak 의 async 버전
+    """
+    now = get_yesterday()
+    content = await async_get_contributions(get_contributions_url(username, from_date=previous.end_date, to_date=now))
+
+    if content is None:
+        return False, None
+
+    return True, extend_commit_streak(
+        previous, get_commit_dates(content, previous.end_date, now, calendar_days), now
+    )
+
+
+def update_continuous_commit_day(github_user: GithubUser) -> bool:
+    """
+    1일 1커밋 지속 날짜를 업데이트 (저장은 호출한 곳에서 CONTINUOUS_COMMIT_FIELDS 로 해야함)
+    : 마지막으로 계산한 날짜 이후만 가져와서 계산하고, 이전 결과가 없거나 맞지 않을때만 전체를 다시 계산한다.
+    """
+    now = get_yesterday()
+    streak = None
+
+    if is_incremental_available(github_user, now):
+        if github_user.continuous_commit_checked_date == now:
+            return True  # 오늘 이미 계산한 경우
+
+        is_completed, streak = get_incremental_commit_streak(github_user.username, get_previous_streak(github_user))
+
+        if not is_completed:
+            return False
+
+    if streak is None:
+        is_completed, streak = get_full_commit_streak(github_user.username)
 
-        date_commits = []  # 해당 년도의 커밋 정보를 저장할 리스트
+        if not is_completed:
+            return False
 
-        for rect in reversed(soup.select('td')):
-            if not rect.get('data-date') or now.date() < datetime.strptime(rect.get('data-date'), '%Y-%m-%d').date() or rect.get('data-level') == '0':
-                continue
+    set_commit_streak(github_user, streak)
+    return True
 
-            commit_date = rect.get('data-date')
-            date_commits.append(commit_date)
 
-        if not is_commit_aborted:
-            date_commits.sort(reverse=True)
-            next_date = None
+async def async_update_continuous_commit_day(github_user: GithubUser, calendar_days: Optional[dict] = None) -> bool:
+    """
+    update_continuous_commit_day 의 async 버전
+    - calendar_days : 크롤링한 날짜별 (level, contribution 수)를 모을 dict (ContributionCalendar 저장용)
+    """
+    now = get_yesterday()
+    streak = None
+
+    if is_incremental_available(github_user, now):
+        if github_user.continuous_commit_checked_date == now:
+            return True
 
-            for date_commit in date_commits:
+        is_completed, streak = await async_get_incremental_commit_streak(
+            github_user.username, get_previous_streak(github_user), calendar_days
+        )
 
-                current_date = datetime.strptime(date_commit, '%Y-%m-%d').date()
+        if not is_completed:
+            return False
 
-                if next_date and (next_date - current_date).days > 1:     # 날짜가 중간에 끊기면 중단으로 간주
-                    is_commit_aborted = True
-                    break
-                continuous_count += 1
-                next_date = current_date
+    if streak is None:
+        is_completed, streak = await async_get_full_commit_streak(github_user.username, calendar_days)
 
-            if is_commit_aborted:
-                break
+        if not is_completed:
+            return False
 
-    return is_completed, continuous_count
+    set_commit_streak(github_user, streak)
+    return True
+
+
+def is_incremental_available(github_user: GithubUser, now: date) -> bool:
+    """
+    이전 결과로 이어서 계산할 수 있는지 체크 (calendar 는 한번에 1년까지만 가져올 수 있다)
+    """
+    end_date = github_user.continuous_commit_end_date
+    checked_date = github_user.continuous_commit_checked_date
+
+    if not end_date or not checked_date or github_user.continuous_commit_day <= 0:
+        return False
+
+    return end_date <= checked_date <= now and (now - end_date).days < 365
+
+
+def get_previous_streak(github_user: GithubUser) -> CommitStreak:
+    return CommitStreak(
+        count=github_user.continuous_commit_day,
+        end_date=github_user.continuous_commit_end_date,
+        checked_date=github_user.continuous_commit_checked_date
+    )
+
+
+def set_commit_streak(github_user: GithubUser, streak: CommitStreak):
+    github_user.continuous_commit_day = streak.count
+    github_user.continuous_commit_end_date = streak.end_date
+    github_user.continuous_commit_checked_date = streak.checked_date
 
 
 def is_exists_github_users(username: str) -> bool:
     """
     Github 에 존재하는 유저인지 체크 (Organization 인 경우 404)
     """
-    # todo: rate limit 인 경우 처리해주기
-    res = requests.get(f'https://api.github.com/users/{username}', headers=settings.GITHUB_API_HEADER)
-    return True if res.status_code == 200 else False
+    return GithubAdapter.is_exists_user(username)
+
+
+async def async_is_exists_github_users(username: str) -> bool:
+    """
+    is_exists_github_users 의 async 버전
+    """
+    return await GithubAdapter.async_is_exists_user(username)